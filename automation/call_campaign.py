@@ -0,0 +1,323 @@
+"""Scheduled call campaigns with a cap on concurrent calls.
+
+A ``CallCampaign`` keeps at most ``max_in_flight`` calls open and starts the
+next one when Twilio reports a call finished through its status callback,
+so no one polls call status. Calls go out only inside the campaign's time
+window; numbers not reached before the window closes are marked
+``skipped``.
+
+State for thousands of calls is a deque of waiting recipients plus a dict
+of calls in flight keyed by call SID. API requests run on a small fixed
+pool of ``placers`` threads, one ``CallbackServer`` thread serves the
+callbacks of every campaign, and one housekeeping thread per campaign opens
+and closes the window and retires calls whose final callback never came.
+
+The TwiML for each distinct message text is rendered once up front and
+reused from ``notify.voice_twiml``'s cache.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+
+from automation import notify
+
+FINAL_STATUSES = {"completed", "busy", "no-answer", "failed", "canceled"}
+DEFAULT_CALL_TIMEOUT = 900.0  # a call with no final callback after this long is given up on
+HOUSEKEEPING_INTERVAL = 1.0
+EARLY_TTL = 60.0  # a callback for an unknown call SID is kept this long in case calls.create is still returning
+MAX_EARLY = 1000
+
+
+@dataclass
+class CallRecord:
+    to: str
+    message: str
+    status: str = "waiting"
+    sid: str | None = None
+    started: float | None = None
+    ended: float | None = None
+    error: str | None = None
+
+    @property
+    def duration(self):
+        if self.started is None or self.ended is None:
+            return None
+        return self.ended - self.started
+
+
+class CallCampaign:
+    """Place ``recipients`` (``(to, message)`` pairs) with at most ``max_in_flight`` live calls.
+
+    ``place(to, message, status_callback)`` starts one call and returns its
+    SID; ``status_callback`` is ``None`` unless the campaign is attached to a
+    ``CallbackServer``, which then feeds ``on_status`` and detaches the
+    campaign once it has finished.
+    """
+
+    def __init__(self, place, recipients, max_in_flight=5, start_at=None, end_at=None,
+                 call_timeout=DEFAULT_CALL_TIMEOUT, placers=4, clock=time.time):
+        self.id = uuid.uuid4().hex[:12]
+        self.place = place
+        self.records = [CallRecord(to, message) for to, message in recipients]
+        self.max_in_flight = max_in_flight
+        self.start_at = start_at
+        self.end_at = end_at
+        self.call_timeout = call_timeout
+        self.status_callback = None
+        self.peak_in_flight = 0
+        self.finished = threading.Event()
+        self._clock = clock
+        self._waiting = deque(self.records)
+        self._placing = 0
+        self._live = {}  # sid -> record
+        self._early = {}  # sid -> (status, time) of callbacks that arrived before calls.create returned
+        self._on_finished = []
+        self._lock = threading.Lock()
+        self._placers = ThreadPoolExecutor(max_workers=placers, thread_name_prefix=f"calls-{self.id}")
+        self._cancelled = False
+        self._housekeeper = threading.Thread(target=self._housekeeping, name=f"calls-{self.id}-window",
+                                             daemon=True)
+        # Render each distinct message once; place_call then hits the cache.
+        for message in {r.message for r in self.records}:
+            notify.voice_twiml(message)
+
+    @property
+    def in_flight(self):
+        return self._placing + len(self._live)
+
+    def _window_open(self, now):
+        return (self.start_at is None or now >= self.start_at) and (self.end_at is None or now < self.end_at)
+
+    def start(self):
+        self._housekeeper.start()
+        self._fill()
+        return self
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+            while self._waiting:
+                self._waiting.popleft().status = "canceled"
+        self._check_finished()
+
+    def _fill(self):
+        with self._lock:
+            now = self._clock()
+            if self._cancelled or not self._window_open(now):
+                return
+            while self._waiting and self.in_flight < self.max_in_flight:
+                record = self._waiting.popleft()
+                record.status = "placing"
+                record.started = now
+                self._placing += 1
+                self._placers.submit(self._place, record)
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _place(self, record):
+        try:
+            sid = self.place(record.to, record.message, self.status_callback)
+        except Exception as exc:  # provider SDKs raise their own exception types
+            with self._lock:
+                self._placing -= 1
+                record.status, record.error, record.ended = "failed", str(exc), self._clock()
+            self._fill()
+            self._check_finished()
+            return
+        with self._lock:
+            self._placing -= 1
+            record.sid, record.status = sid, "queued"
+            self._live[sid] = record
+            early = self._early.pop(sid, None)
+        if early is not None:
+            self.on_status(sid, early[0])
+        elif self.status_callback is None:
+            # Without callbacks there is nothing to wait for: the call was handed off.
+            self.on_status(sid, "completed")
+
+    def on_status(self, sid, status):
+        """Record a status callback; a final status frees a slot for the next call."""
+        with self._lock:
+            record = self._live.get(sid)
+            if record is None:
+                # Unknown SID: its calls.create may not have returned yet. Late or
+                # forged callbacks land here too, so the dict is bounded.
+                if sid not in self._early and len(self._early) >= MAX_EARLY:
+                    del self._early[next(iter(self._early))]
+                self._early[sid] = (status, self._clock())
+                return
+            record.status = status
+            if status not in FINAL_STATUSES:
+                return
+            record.ended = self._clock()
+            del self._live[sid]
+        self._fill()
+        self._check_finished()
+
+    def add_done_callback(self, fn):
+        """Call ``fn(campaign)`` once the campaign has finished (right away if it already has)."""
+        with self._lock:
+            if not self.finished.is_set():
+                self._on_finished.append(fn)
+                return
+        fn(self)
+
+    def _check_finished(self):
+        with self._lock:
+            if self.finished.is_set() or self._waiting or self.in_flight:
+                return
+            self.finished.set()
+            callbacks, self._on_finished = self._on_finished, []
+        for fn in callbacks:
+            fn(self)
+
+    def _housekeeping(self):
+        while not self.finished.wait(HOUSEKEEPING_INTERVAL):
+            now = self._clock()
+            with self._lock:
+                if self.end_at is not None and now >= self.end_at:
+                    while self._waiting:
+                        self._waiting.popleft().status = "skipped"
+                stale = [sid for sid, r in self._live.items() if now - r.started > self.call_timeout]
+                for sid in stale:
+                    record = self._live.pop(sid)
+                    record.status, record.ended = "unknown", now
+                    record.error = "no final status callback received"
+                for sid in [sid for sid, (_, at) in self._early.items() if now - at > EARLY_TTL]:
+                    del self._early[sid]
+            # Opens the window when its start time arrives and backfills stale slots.
+            self._fill()
+            self._check_finished()
+        self._placers.shutdown(wait=False)
+
+    def counts(self):
+        with self._lock:
+            return Counter(r.status for r in self.records)
+
+    def wait(self, timeout=None):
+        return self.finished.wait(timeout)
+
+
+class CallbackServer:
+    """Receives Twilio call-status callbacks for every campaign on one thread.
+
+    Callbacks are served at ``<public_url>/calls/<campaign id>/status``. With
+    an ``auth_token``, requests without a valid ``X-Twilio-Signature`` are
+    rejected. Both are kept per campaign, so campaigns of different Twilio
+    accounts can share the server; the constructor's values are defaults
+    for ``attach``.
+    """
+
+    def __init__(self, public_url=None, host="0.0.0.0", port=8099, auth_token=None):
+        self.public_url = public_url.rstrip("/") if public_url else None
+        self.auth_token = auth_token
+        self.campaigns = {}
+        self.received = 0
+        self._routes = {}  # campaign id -> (public URL, signature validator or None)
+        self._server = HTTPServer((host, port), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, name="call-callbacks", daemon=True)
+
+    def _handler(self):
+        server = self
+
+        # HTTP/1.0: one request per connection, so a caller holding a
+        # keep-alive connection open cannot stall the single server thread.
+        class Handler(BaseHTTPRequestHandler):
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status):
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                params = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+                parts = self.path.strip("/").split("/")
+                campaign = server.campaigns.get(parts[1]) if len(parts) == 3 and parts[0] == "calls" else None
+                if campaign is None:
+                    self._reply(404)
+                    return
+                public_url, validator = server._routes.get(campaign.id, (None, None))
+                if public_url is None:  # detached in the meantime
+                    self._reply(404)
+                    return
+                if validator is not None and not validator.validate(
+                        public_url + self.path, params, self.headers.get("X-Twilio-Signature", "")):
+                    self._reply(403)
+                    return
+                server.received += 1
+                self._reply(204)
+                campaign.on_status(params.get("CallSid", ""), params.get("CallStatus", ""))
+
+        return Handler
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def attach(self, campaign, public_url=None, auth_token=None):
+        """Serve ``campaign``'s callbacks, checking them against its own account's ``auth_token``."""
+        public_url = public_url.rstrip("/") if public_url else self.public_url
+        if not public_url:
+            raise ValueError("a public URL is needed for status callbacks")
+        auth_token = auth_token or self.auth_token
+        if auth_token:
+            from twilio.request_validator import RequestValidator
+
+            validator = RequestValidator(auth_token)
+        else:
+            validator = None
+        campaign.status_callback = f"{public_url}/calls/{campaign.id}/status"
+        self._routes[campaign.id] = (public_url, validator)
+        self.campaigns[campaign.id] = campaign
+        campaign.add_done_callback(self.detach)
+        return campaign
+
+    def detach(self, campaign):
+        """Stop serving ``campaign``'s callbacks; later ones get a 404."""
+        self.campaigns.pop(campaign.id, None)
+        self._routes.pop(campaign.id, None)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def twilio_placer(account_sid, auth_token, from_number):
+    from automation.providers import twilio_client
+
+    def place(to, message, status_callback):
+        return notify.place_call(twilio_client(account_sid, auth_token), from_number, to, message, status_callback)
+
+    return place
+
+
+_servers = {}
+_servers_lock = threading.Lock()
+
+
+def get_callback_server(port):
+    """The process-wide callback server for ``port``, started on first use.
+
+    It has no public URL or auth token of its own: pass each campaign's to ``attach``.
+    """
+    with _servers_lock:
+        server = _servers.get(port)
+        if server is None:
+            server = _servers[port] = CallbackServer(port=port).start()
+        return server
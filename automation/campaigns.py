@@ -0,0 +1,118 @@
+"""Bulk SMS campaigns from a CSV, delivered through the outbox.
+
+A campaign is prepared from the CSV rows and a ``$column`` template: numbers
+are normalized to E.164, invalid ones are reported, and repeated numbers
+are sent once. Messages are queued with keys derived from the campaign id
+and the number, and the campaign id is a hash of the route, sender,
+template and recipients. Uploading the same campaign again after an
+interruption or restart therefore only queues what is missing, and
+messages already sent are not repeated. Throughput is capped by the
+route's token bucket in the outbox.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import re
+import time
+from dataclasses import dataclass, field
+
+from automation.mailer import render
+
+DEFAULT_PHONE_COLUMN = "phone"
+_SEPARATORS = re.compile(r"[\s().\-/]")
+
+
+def normalize_e164(number, default_country=""):
+    """``number`` as ``+<digits>``, or None if it cannot be a valid E.164 number.
+
+    National numbers (no ``+`` or ``00`` prefix) get ``default_country``
+    (e.g. ``"+91"``) prepended, dropping one leading trunk ``0``.
+    """
+    number = _SEPARATORS.sub("", number or "")
+    if number.startswith("00"):
+        number = "+" + number[2:]
+    if not number.startswith("+"):
+        if not default_country:
+            return None
+        number = "+" + default_country.lstrip("+") + number.removeprefix("0")
+    digits = number[1:]
+    if not digits.isdigit() or not 8 <= len(digits) <= 15 or digits[0] == "0":
+        return None
+    return number
+
+
+def read_rows(data):
+    text = data.decode("utf-8-sig") if isinstance(data, bytes) else data
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+@dataclass
+class Campaign:
+    id: str
+    messages: list = field(default_factory=list)  # (to, body)
+    invalid: list = field(default_factory=list)  # (row number, raw value)
+    duplicates: int = 0
+
+
+def prepare(rows, template, route, sender, phone_column=DEFAULT_PHONE_COLUMN, default_country="", kind="sms"):
+    """Normalize, deduplicate and render ``rows``. Uses ``phone_column`` if present, else the first column."""
+    campaign = Campaign("")
+    seen = set()
+    column = phone_column if not rows or phone_column in rows[0] else next(iter(rows[0]), None)
+    for number, row in enumerate(rows, start=2):  # row 1 is the CSV header
+        raw = (row.get(column) or "").strip()
+        to = normalize_e164(raw, default_country)
+        if to is None:
+            campaign.invalid.append((number, raw))
+        elif to in seen:
+            campaign.duplicates += 1
+        else:
+            seen.add(to)
+            campaign.messages.append((to, render(template, {**row, "phone": to})))
+    digest = hashlib.sha256("\0".join([route, sender, template, *sorted(seen)]).encode())
+    campaign.id = f"{kind}-{digest.hexdigest()[:16]}"
+    return campaign
+
+
+def enqueue(box, route, sender, campaign):
+    """Queue every message of ``campaign``; returns how many were not already queued."""
+    return box.enqueue_many(
+        ((route, {"from": sender, "to": to, "body": body}, f"{campaign.id}:{to}") for to, body in campaign.messages),
+        tag=campaign.id,
+    )
+
+
+@dataclass
+class Progress:
+    total: int
+    sent: int
+    failed: int
+    rate: float  # messages per second over the recent window
+
+    @property
+    def remaining(self):
+        return self.total - self.sent - self.failed
+
+    @property
+    def done(self):
+        return self.remaining == 0
+
+    @property
+    def eta(self):
+        """Seconds until the campaign is drained at the recent rate, or None if nothing is moving."""
+        return self.remaining / self.rate if self.rate else None
+
+
+def progress(box, campaign_id, window=30.0):
+    counts = box.counts(tag=campaign_id)
+    now = time.time()
+    recent, oldest = box.sent_since(campaign_id, now - window)
+    return Progress(
+        total=sum(counts.values()),
+        sent=counts.get("sent", 0),
+        failed=counts.get("failed", 0),
+        rate=recent / (now - oldest) if recent > 1 and now > oldest else 0.0,
+    )
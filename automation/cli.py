@@ -0,0 +1,456 @@
+"""Command-line entry point: the sidebar tools without Streamlit.
+
+    python -m automation scrape https://example.com/data --types .csv .pdf --dest downloads
+    python -m automation search "python asyncio" "streamlit fragments" --num 10
+    python -m automation email --recipients people.csv --subject "Hi $name" --body "..."
+    python -m automation sms --to +15551234567 --body "Build finished"
+    python -m automation image --count 500 --out images.zip
+    python -m automation faceswap face.jpg targets/ --out-dir swapped
+    python -m automation ram --top 10
+    python -m automation linux "uptime" --hosts "web[01-20].example.com" --backend ssh
+    python -m automation run jobs.json --workers 4
+
+Every tool is a function in ``TOOLS`` taking keyword parameters and
+returning an ``Outcome``; the subcommands and job files call the same
+functions. A job file is a JSON list of objects, or a CSV with one job per
+row; each job has a ``tool`` field, an optional ``name`` and the tool's
+parameters. In a CSV, cells starting with ``[`` or ``{`` are read as JSON
+(lists of queries, numbers or file types) and the rest are converted to the
+type of the parameter's default, so phone numbers and queries stay text.
+``run`` executes the jobs on ``--workers`` threads; each tool still uses its
+own pool for its items.
+
+Engine modules are imported when a job first needs them, so a tool whose
+library is missing fails on its own and Streamlit is never imported.
+Credentials default to environment variables (``AUTOMATION_SMTP_USER``,
+``AUTOMATION_SMTP_PASSWORD``, ``TWILIO_ACCOUNT_SID``, ``TWILIO_AUTH_TOKEN``,
+``TWILIO_FROM``) so they stay out of job files and shell history.
+
+Each job is reported with its wall time and throughput (items per second),
+as a table or, with ``--json``, one JSON object per line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import inspect
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class Outcome:
+    items: int
+    unit: str
+    failed: int = 0
+    detail: dict = field(default_factory=dict)
+
+
+@dataclass
+class JobReport:
+    name: str
+    tool: str
+    ok: bool
+    seconds: float
+    items: int = 0
+    unit: str = ""
+    failed: int = 0
+    error: str | None = None
+    detail: dict = field(default_factory=dict)
+
+    @property
+    def throughput(self):
+        """Items per second of wall time."""
+        return self.items / self.seconds if self.seconds > 0 else 0.0
+
+
+def _env(value, name):
+    value = value or os.environ.get(name)
+    if not value:
+        raise ValueError(f"missing credential: pass it in the job or set ${name}")
+    return value
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return [str(v) for v in value] if isinstance(value, (list, tuple)) else [str(value)]
+
+
+def run_scrape(url, types=(".csv", ".xlsx"), depth=0, same_host=True, dest="downloads", workers=8, per_host=4,
+               incremental=True):
+    from automation import scraper
+    from automation.manifest import Manifest
+
+    options = scraper.CrawlOptions(tuple(_as_list(types)), depth, same_host, workers, per_host)
+    with scraper.make_session(pool_size=workers) as session:
+        urls = scraper.crawl(session, url, options)
+        manifest = Manifest(dest) if incremental else None
+        try:
+            results = scraper.Downloader(session, dest, options, manifest).run(urls)
+        finally:
+            if manifest:
+                manifest.close()
+    failed = [r for r in results if not r.ok]
+    return Outcome(len(results) - len(failed), "files", len(failed), {
+        "dest": str(dest),
+        "bytes": sum(r.bytes for r in results),
+        "unchanged": sum(r.not_modified for r in results),
+        "errors": {r.url: r.error for r in failed},
+    })
+
+
+def run_search(queries=(), file=None, num=10, workers=4, rate=2.0):
+    from automation.search import SearchService
+
+    queries = _as_list(queries)
+    if file:
+        queries += Path(file).read_text(encoding="utf-8").splitlines()
+    per_query, merged, errors = SearchService(rate=rate).batch(queries, num, max_workers=workers)
+    return Outcome(len(per_query) - len(errors), "queries", len(errors), {
+        "results": [{"url": m.url, "title": m.title, "queries": m.queries} for m in merged],
+        "errors": errors,
+    })
+
+
+def run_email(subject, body, to=(), recipients=None, username=None, password=None, host=None, port=None,
+              starttls=True, connections=4, anonymous=False):
+    from automation import mailer
+
+    rows = [{"email": address} for address in _as_list(to)]
+    if recipients:
+        rows += mailer.read_recipients(Path(recipients).read_bytes())
+    username = _env(username, "AUTOMATION_SMTP_USER")
+    config = mailer.SmtpConfig(username, _env(password, "AUTOMATION_SMTP_PASSWORD"),
+                               host or mailer.GMAIL_HOST, int(port or mailer.GMAIL_PORT), starttls)
+    report = mailer.send_bulk(config, username, rows, subject, body, anonymous=anonymous, connections=connections)
+    return Outcome(report.sent, "emails", report.failed, {
+        "connections_opened": report.connections_opened,
+        "errors": {r.to: r.error for r in report.results if not r.ok},
+    })
+
+
+def run_sms(body, to=(), recipients=None, phone_column="phone", default_country="", sid=None, token=None,
+            sender=None, rate=1.0, workers=4):
+    from automation import campaigns, notify, providers
+    from automation.ratelimit import TokenBucket
+
+    rows = [{"phone": number} for number in _as_list(to)]
+    if recipients:
+        rows += campaigns.read_rows(Path(recipients).read_bytes())
+    sender = _env(sender, "TWILIO_FROM")
+    campaign = campaigns.prepare(rows, body, "sms", sender, phone_column, default_country)
+    client = providers.twilio_client(_env(sid, "TWILIO_ACCOUNT_SID"), _env(token, "TWILIO_AUTH_TOKEN"))
+    bucket = TokenBucket(rate)
+
+    def send(message):
+        to, text = message
+        bucket.acquire()
+        try:
+            notify.send_sms(client, sender, to, text)
+        except Exception as exc:
+            return to, str(exc)
+        return to, None
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        errors = {to: error for to, error in pool.map(send, campaign.messages) if error}
+    return Outcome(len(campaign.messages) - len(errors), "messages", len(errors) + len(campaign.invalid), {
+        "duplicates": campaign.duplicates,
+        "invalid": [raw for _, raw in campaign.invalid],
+        "errors": errors,
+    })
+
+
+def run_image(count=100, width=400, height=400, seed=None, specs=None, out="images.zip", workers=4):
+    from automation import imaging
+
+    if specs:
+        batch = imaging.read_specs(Path(specs).read_bytes())
+    else:
+        batch = list(imaging.random_specs(int(count), int(width), int(height), seed))
+    with open(out, "wb") as fh:
+        written = imaging.write_zip(fh, batch, workers)
+    return Outcome(written, "images", 0, {"out": str(out), "bytes": Path(out).stat().st_size})
+
+
+def run_faceswap(source, targets, out_dir="swapped", workers=None):
+    from automation import faceswap
+
+    files = []
+    for target in _as_list(targets):
+        path = Path(target)
+        files += faceswap.folder_targets(path) if path.is_dir() else [(path.name, str(path))]
+    errors = {}
+    for name, _, error in faceswap.swap_many(Path(source).read_bytes(), files, out_dir, workers):
+        if error:
+            errors[name] = error
+    return Outcome(len(files) - len(errors), "images", len(errors), {"out_dir": str(out_dir), "errors": errors})
+
+
+def run_ram(top=10, key="rss"):
+    import psutil
+
+    from automation.sysmon import ProcessTracker
+
+    tracker = ProcessTracker()
+    tracker.refresh(uss_for=int(top) if key == "uss" else 0)
+    memory, swap = psutil.virtual_memory(), psutil.swap_memory()
+    processes = tracker.top(int(top), key)
+    return Outcome(len(tracker.procs), "processes", 0, {
+        "mem_percent": memory.percent,
+        "mem_used": memory.used,
+        "mem_available": memory.available,
+        "mem_total": memory.total,
+        "swap_percent": swap.percent,
+        "top": [{"pid": p.pid, "name": p.name, "rss": p.rss, "uss": p.uss} for p in processes],
+    })
+
+
+def run_linux(command=None, script=None, hosts=(), backend="local", user=None, concurrency=64, timeout=None):
+    from automation import remote
+
+    hosts = remote.expand_hosts("\n".join(_as_list(hosts)))
+    if script:
+        script = Path(script).read_text(encoding="utf-8")
+    runner = remote.LocalBackend() if backend == "local" else remote.SshBackend(user=user)
+    run = remote.Run(hosts, runner, command=command, script=script, concurrency=concurrency, timeout=timeout)
+    run.execute()
+    ok = run.exit_codes()[0]
+    return Outcome(ok, "hosts", len(hosts) - ok, {
+        "exit_codes": {str(code): n for code, n in run.exit_codes().items()},
+        "groups": [{"hosts": g.hosts, "exit_code": g.exit_code, "status": g.status, "stdout": g.stdout,
+                    "stderr": g.stderr} for g in run.groups()],
+    })
+
+
+TOOLS = {
+    "scrape": run_scrape,
+    "search": run_search,
+    "email": run_email,
+    "sms": run_sms,
+    "image": run_image,
+    "faceswap": run_faceswap,
+    "ram": run_ram,
+    "linux": run_linux,
+}
+
+
+def run_job(tool, name=None, **params):
+    """Run one job and time it; errors are reported, not raised."""
+    start = time.perf_counter()
+    try:
+        if tool not in TOOLS:
+            raise ValueError(f"unknown tool {tool!r} (choose from {', '.join(TOOLS)})")
+        outcome = TOOLS[tool](**params)
+    except Exception as exc:
+        error = str(exc) or type(exc).__name__
+        return JobReport(name or tool, tool, False, time.perf_counter() - start, error=error)
+    return JobReport(name or tool, tool, True, time.perf_counter() - start, outcome.items, outcome.unit,
+                     outcome.failed, detail=outcome.detail)
+
+
+def _cell(value):
+    # Only lists and objects are decoded: a digits-only phone number or query must stay a string.
+    if value.lstrip().startswith(("[", "{")):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+# Numeric parameters whose default is None, so their type cannot be read from the signature.
+_NUMERIC = {"seed": int, "port": int, "workers": int, "timeout": float}
+_BOOLEANS = {"true": True, "yes": True, "1": True, "false": False, "no": False, "0": False}
+
+
+def _typed(tool, params):
+    """CSV ``params`` converted to the types of ``tool``'s defaults; other values stay strings."""
+    fn = TOOLS.get(tool)
+    if fn is None:
+        return params
+    defaults = {name: p.default for name, p in inspect.signature(fn).parameters.items()}
+    typed = {}
+    for key, value in params.items():
+        default = defaults.get(key)
+        if not isinstance(value, str):
+            typed[key] = value
+        elif isinstance(default, bool):
+            if value.strip().lower() not in _BOOLEANS:
+                raise ValueError(f"{key}: expected true or false, got {value!r}")
+            typed[key] = _BOOLEANS[value.strip().lower()]
+        elif type(default) in (int, float) or key in _NUMERIC:
+            cast = _NUMERIC.get(key, type(default))
+            try:
+                typed[key] = cast(value)
+            except ValueError:
+                raise ValueError(f"{key}: expected a number, got {value!r}") from None
+        else:
+            typed[key] = value
+    return typed
+
+
+def read_jobs(path):
+    """Jobs (dicts with a ``tool`` key) from a JSON list or a CSV file, by extension."""
+    path = Path(path)
+    text = path.read_text(encoding="utf-8-sig")
+    if path.suffix.lower() == ".csv":
+        jobs = []
+        for number, row in enumerate(csv.DictReader(io.StringIO(text)), start=2):  # row 1 is the header
+            cells = {k: v if k in ("tool", "name") else _cell(v) for k, v in row.items() if k and v not in (None, "")}
+            try:
+                jobs.append(_typed(cells.get("tool"), cells))
+            except ValueError as exc:
+                raise ValueError(f"{path}: row {number}: {exc}") from None
+    else:
+        jobs = json.loads(text)
+        if isinstance(jobs, dict):
+            jobs = [jobs]
+    for number, job in enumerate(jobs, start=1):
+        if not isinstance(job, dict) or "tool" not in job:
+            raise ValueError(f"{path}: job {number} has no 'tool'")
+        job.setdefault("name", f"{job['tool']}-{number}")
+    return jobs
+
+
+def run_jobs(jobs, workers=4, on_report=None):
+    """Run ``jobs`` on ``workers`` threads; ``on_report(report)`` as each one finishes.
+
+    Returns the reports in job order.
+    """
+    reports = [None] * len(jobs)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="cli-job") as pool:
+        futures = {pool.submit(run_job, **job): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            reports[futures[future]] = report = future.result()
+            if on_report:
+                on_report(report)
+    return reports
+
+
+def format_report(report):
+    if not report.ok:
+        return f"{report.name:24} {report.tool:9} FAILED {report.seconds:9.2f}s  {report.error}"
+    failed = f" ({report.failed} failed)" if report.failed else ""
+    return (f"{report.name:24} {report.tool:9} ok     {report.seconds:9.2f}s  "
+            f"{report.items} {report.unit}{failed} · {report.throughput:.1f} {report.unit}/s")
+
+
+def _printer(as_json, out):
+    def emit(report):
+        if as_json:
+            out.write(json.dumps({**asdict(report), "throughput": report.throughput}, default=str) + "\n")
+        else:
+            out.write(format_report(report) + "\n")
+        out.flush()
+    return emit
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m automation", description=__doc__.splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="print one JSON object per job")
+    commands = parser.add_subparsers(dest="tool", required=True)
+
+    run = commands.add_parser("run", help="run a JSON or CSV job file")
+    run.add_argument("jobfile")
+    run.add_argument("--workers", type=int, default=4, help="jobs run at the same time")
+
+    scrape = commands.add_parser("scrape", help="download the matching files linked from a page")
+    scrape.add_argument("url")
+    scrape.add_argument("--types", nargs="+", default=[".csv", ".xlsx"])
+    scrape.add_argument("--depth", type=int, default=0)
+    scrape.add_argument("--any-host", dest="same_host", action="store_false")
+    scrape.add_argument("--dest", default="downloads")
+    scrape.add_argument("--workers", type=int, default=8)
+    scrape.add_argument("--per-host", type=int, default=4)
+    scrape.add_argument("--full", dest="incremental", action="store_false", help="ignore the manifest")
+
+    search = commands.add_parser("search", help="run search queries and merge the results")
+    search.add_argument("queries", nargs="*")
+    search.add_argument("--file", help="one query per line")
+    search.add_argument("--num", type=int, default=10)
+    search.add_argument("--workers", type=int, default=4)
+    search.add_argument("--rate", type=float, default=2.0, help="queries per second")
+
+    email = commands.add_parser("email", help="send one templated email per recipient")
+    email.add_argument("--to", nargs="+", default=[])
+    email.add_argument("--recipients", help="CSV with an email column; other columns fill $placeholders")
+    email.add_argument("--subject", required=True)
+    email.add_argument("--body", required=True)
+    email.add_argument("--username", help="default: $AUTOMATION_SMTP_USER")
+    email.add_argument("--host")
+    email.add_argument("--port", type=int)
+    email.add_argument("--no-starttls", dest="starttls", action="store_false")
+    email.add_argument("--connections", type=int, default=4)
+    email.add_argument("--anonymous", action="store_true")
+
+    sms = commands.add_parser("sms", help="send one templated SMS per number through Twilio")
+    sms.add_argument("--to", nargs="+", default=[])
+    sms.add_argument("--recipients", help="CSV with a phone column; other columns fill $placeholders")
+    sms.add_argument("--body", required=True)
+    sms.add_argument("--phone-column", default="phone")
+    sms.add_argument("--default-country", default="")
+    sms.add_argument("--sender", help="default: $TWILIO_FROM")
+    sms.add_argument("--rate", type=float, default=1.0, help="messages per second")
+    sms.add_argument("--workers", type=int, default=4)
+
+    image = commands.add_parser("image", help="render a batch of images into a ZIP")
+    image.add_argument("--count", type=int, default=100)
+    image.add_argument("--width", type=int, default=400)
+    image.add_argument("--height", type=int, default=400)
+    image.add_argument("--seed", type=int)
+    image.add_argument("--specs", help="CSV of image parameters instead of random ones")
+    image.add_argument("--out", default="images.zip")
+    image.add_argument("--workers", type=int, default=4)
+
+    faceswap = commands.add_parser("faceswap", help="swap a face onto target images")
+    faceswap.add_argument("source")
+    faceswap.add_argument("targets", nargs="+", help="images or folders of images")
+    faceswap.add_argument("--out-dir", default="swapped")
+    faceswap.add_argument("--workers", type=int)
+
+    ram = commands.add_parser("ram", help="memory usage and the largest processes")
+    ram.add_argument("--top", type=int, default=10)
+    ram.add_argument("--key", choices=["rss", "uss", "growth"], default="rss")
+
+    linux = commands.add_parser("linux", help="run a command or script on many hosts")
+    linux.add_argument("command", nargs="?")
+    linux.add_argument("--script", help="bash script file, fed to each host on stdin")
+    linux.add_argument("--hosts", nargs="+", required=True, help="host names; ranges like node[1-20] expand")
+    linux.add_argument("--backend", choices=["local", "ssh"], default="local")
+    linux.add_argument("--user")
+    linux.add_argument("--concurrency", type=int, default=64)
+    linux.add_argument("--timeout", type=float)
+    return parser
+
+
+def main(argv=None, out=sys.stdout):
+    args = vars(build_parser().parse_args(argv))
+    tool, as_json = args.pop("tool"), args.pop("json")
+    emit = _printer(as_json, out)
+    if tool == "run":
+        try:
+            jobs = read_jobs(args["jobfile"])
+        except (OSError, ValueError) as exc:
+            sys.exit(f"error: {exc}")
+        start = time.perf_counter()
+        reports = run_jobs(jobs, args["workers"], emit)
+        elapsed = time.perf_counter() - start
+        if not as_json:
+            failed = sum(not report.ok for report in reports)
+            out.write(f"{len(reports)} jobs ({failed} failed) in {elapsed:.2f}s · "
+                      f"{len(reports) / elapsed if elapsed > 0 else 0.0:.2f} jobs/s on {args['workers']} workers\n")
+    else:
+        report = run_job(tool, **args)
+        emit(report)
+        if report.ok and not as_json and report.detail:
+            out.write(json.dumps(report.detail, indent=2, default=str) + "\n")
+        reports = [report]
+    return 0 if all(report.ok for report in reports) else 1
@@ -0,0 +1,242 @@
+"""Face swapping with OpenCV and MediaPipe Face Mesh.
+
+Landmark detection is the expensive step, so it runs on a downscaled copy of
+each image (Face Mesh returns normalised coordinates, which map straight back
+onto the full-resolution image), and the landmarks plus the Delaunay
+triangulation are cached by the SHA-256 of the image bytes. A Streamlit
+rerun with the same uploads never runs detection again.
+
+Batch swaps run on a process pool. The source face is analysed once in the
+parent and handed to every worker through the pool initializer, so each task
+only carries its target image.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from automation import metrics
+
+DETECT_MAX_SIDE = 640
+FACE_CACHE_SIZE = 64
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+
+
+class NoFaceFound(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class FaceData:
+    landmarks: np.ndarray  # (468, 2) float32, full-resolution pixel coordinates
+    triangles: np.ndarray  # (n, 3) int32 indices into ``landmarks``
+    hull: np.ndarray  # convex hull indices into ``landmarks``
+
+
+_local = threading.local()
+
+
+def _face_mesh():
+    # FaceMesh graphs are not thread-safe; keep one per thread (and so per process).
+    mesh = getattr(_local, "mesh", None)
+    if mesh is None:
+        mesh = _local.mesh = mp.solutions.face_mesh.FaceMesh(static_image_mode=True, max_num_faces=1)
+    return mesh
+
+
+def decode(data):
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("could not decode image")
+    return image
+
+
+def landmarks_with(mesh, image, max_side=DETECT_MAX_SIDE):
+    """Run ``mesh`` on a copy of ``image`` no larger than ``max_side``; return its 468 landmarks.
+
+    Face Mesh returns normalised coordinates, so the points come back in
+    ``image``'s full-resolution pixel space.
+    """
+    h, w = image.shape[:2]
+    scale = max_side / max(h, w)
+    small = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1 else image
+    result = mesh.process(cv2.cvtColor(small, cv2.COLOR_BGR2RGB))
+    if not result.multi_face_landmarks:
+        raise NoFaceFound("no face found in image")
+    points = result.multi_face_landmarks[0].landmark
+    landmarks = np.array([(p.x * w, p.y * h) for p in points], dtype=np.float32)
+    return np.clip(landmarks, 0, [w - 1, h - 1]).astype(np.float32)
+
+
+def detect_landmarks(image, max_side=DETECT_MAX_SIDE):
+    return landmarks_with(_face_mesh(), image, max_side)
+
+
+def triangulate(landmarks, shape):
+    h, w = shape[:2]
+    subdiv = cv2.Subdiv2D((0, 0, w, h))
+    lookup = {}
+    for i, (x, y) in enumerate(landmarks):
+        lookup.setdefault((int(round(x)), int(round(y))), i)
+        subdiv.insert((float(x), float(y)))
+    triangles = []
+    for x1, y1, x2, y2, x3, y3 in subdiv.getTriangleList():
+        idx = [lookup.get((int(round(x)), int(round(y)))) for x, y in ((x1, y1), (x2, y2), (x3, y3))]
+        if None not in idx:
+            triangles.append(idx)
+    return np.array(triangles, dtype=np.int32)
+
+
+def analyze(image, triangles=True):
+    """Landmarks, hull and (unless ``triangles`` is false) triangulation for the face in ``image``.
+
+    Only the source face's triangulation is used when swapping, so targets can skip it.
+    """
+    landmarks = detect_landmarks(image)
+    hull = cv2.convexHull(landmarks, returnPoints=False).ravel()
+    tris = triangulate(landmarks, image.shape) if triangles else np.empty((0, 3), dtype=np.int32)
+    return FaceData(landmarks, tris, hull)
+
+
+class FaceCache:
+    """Bounded LRU of ``FaceData`` keyed by the SHA-256 of the encoded image."""
+
+    def __init__(self, maxsize=FACE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_analyze(self, data, image=None):
+        key = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+        face = analyze(decode(data) if image is None else image)
+        with self._lock:
+            self._data[key] = face
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return face
+
+
+face_cache = FaceCache()
+
+
+def swap(src, src_face, dst, dst_face):
+    """Warp the face in ``src`` onto the face in ``dst`` and blend it in."""
+    warped = np.zeros_like(dst)
+    for tri in src_face.triangles:
+        s = src_face.landmarks[tri]
+        d = dst_face.landmarks[tri]
+        sx, sy, sw, sh = cv2.boundingRect(s)
+        dx, dy, dw, dh = cv2.boundingRect(d)
+        if min(sw, sh, dw, dh) == 0:
+            continue
+        s_local = s - np.float32((sx, sy))
+        d_local = d - np.float32((dx, dy))
+        matrix = cv2.getAffineTransform(s_local, d_local)
+        patch = cv2.warpAffine(
+            src[sy:sy + sh, sx:sx + sw], matrix, (dw, dh),
+            flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REFLECT_101,
+        )
+        mask = np.zeros((dh, dw), dtype=np.uint8)
+        cv2.fillConvexPoly(mask, np.int32(d_local), 255)
+        region = warped[dy:dy + dh, dx:dx + dw]
+        h, w = region.shape[:2]
+        covered = (mask[:h, :w] > 0) & (region.max(axis=2) == 0)
+        region[covered] = patch[:h, :w][covered]
+
+    hull = np.int32(dst_face.landmarks[dst_face.hull])
+    face_mask = np.zeros(dst.shape[:2], dtype=np.uint8)
+    cv2.fillConvexPoly(face_mask, hull, 255)
+    x, y, w, h = cv2.boundingRect(hull)
+    center = (x + w // 2, y + h // 2)
+    return cv2.seamlessClone(warped, dst, face_mask, center, cv2.NORMAL_CLONE)
+
+
+def encode(image, ext=".jpg"):
+    ok, buffer = cv2.imencode(ext, image)
+    if not ok:
+        raise ValueError(f"could not encode image as {ext}")
+    return buffer.tobytes()
+
+
+@metrics.timed("operation", op="face_swap")
+def swap_bytes(src_data, dst_data, ext=".png"):
+    """Swap the face from ``src_data`` onto ``dst_data``; both are encoded images."""
+    src, dst = decode(src_data), decode(dst_data)
+    result = swap(src, face_cache.get_or_analyze(src_data, src), dst, face_cache.get_or_analyze(dst_data, dst))
+    return encode(result, ext)
+
+
+# -- batch -------------------------------------------------------------------
+
+_worker_source = None
+
+
+def _init_worker(src_data, src_face):
+    global _worker_source
+    _worker_source = (decode(src_data), src_face)
+
+
+def _swap_task(name, target, output_dir):
+    """Worker entry point. ``target`` is encoded bytes or a path to read."""
+    src, src_face = _worker_source
+    try:
+        data = Path(target).read_bytes() if isinstance(target, (str, Path)) else target
+        dst = decode(data)
+        result = swap(src, src_face, dst, analyze(dst, triangles=False))
+        ext = Path(name).suffix.lower() or ".jpg"
+        if output_dir is None:
+            return name, encode(result, ext), None
+        cv2.imwrite(str(Path(output_dir, name)), result)
+        return name, None, None
+    except (ValueError, OSError, cv2.error) as exc:
+        return name, None, str(exc)
+
+
+def folder_targets(input_dir):
+    return [
+        (path.name, str(path)) for path in sorted(Path(input_dir).iterdir())
+        if path.suffix.lower() in IMAGE_SUFFIXES
+    ]
+
+
+def swap_many(src_data, targets, output_dir=None, workers=None, on_progress=None):
+    """Swap the source face onto every ``(name, bytes_or_path)`` target on a process pool.
+
+    With ``output_dir`` results are written there and not sent back to the
+    parent; otherwise the encoded result bytes are returned. Yields
+    ``(name, data_or_None, error_or_None)`` as images finish;
+    ``on_progress(done, total)`` runs in the calling thread.
+    """
+    src_face = face_cache.get_or_analyze(src_data)
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    # "spawn" keeps workers from inheriting the Streamlit server's threads.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                             initargs=(src_data, src_face)) as pool:
+        futures = [pool.submit(_swap_task, name, target, output_dir) for name, target in targets]
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                if on_progress:
+                    on_progress(done, len(futures))
+                yield future.result()
+        except BaseException:
+            # A cancelled job or a consumer that stopped iterating: drop the images not started yet
+            pool.shutdown(cancel_futures=True)
+            raise
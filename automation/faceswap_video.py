@@ -0,0 +1,255 @@
+"""Video face swap with landmark tracking and a pipelined frame path.
+
+Running face detection plus mesh estimation on every frame is what makes
+naive video swapping slow. Face Mesh in video mode detects the face once and
+then tracks it: each frame's mesh is estimated from a region around the
+previous frame's landmarks, and the detector only runs again when the
+model's tracking confidence drops (a cut, occlusion, fast motion).
+
+Frames move through four stages on their own threads, connected by bounded
+queues:
+
+    decode -> track -> swap (N processes) -> encode
+
+Tracking is inherently sequential, but swapping a frame only needs that
+frame's landmarks. The per-triangle warp loop is Python-heavy and would
+serialise on the GIL, so the swap stage hands frames to a process pool and
+collects them back in order. Per-stage busy time is recorded so the report
+shows which stage is the bottleneck.
+"""
+
+from __future__ import annotations
+
+import collections
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import cv2
+import mediapipe as mp
+
+from automation import faceswap
+
+TRACK_MAX_SIDE = 480
+MIN_CONFIDENCE = 0.5  # re-detect when the mesh tracking score falls below this
+QUEUE_SIZE = 16
+
+_END = object()
+
+
+class LandmarkTracker:
+    """Face Mesh in video mode on a downscaled copy of each frame.
+
+    The face detector runs on the first frame only. After that the mesh
+    model follows the face from the previous frame's landmarks, and the
+    detector runs again only when the tracking score falls below
+    ``min_confidence``. Must be driven from a single thread.
+    """
+
+    def __init__(self, min_confidence=MIN_CONFIDENCE, max_side=TRACK_MAX_SIDE):
+        self.max_side = max_side
+        self.lost = 0
+        self._mesh = mp.solutions.face_mesh.FaceMesh(
+            static_image_mode=False, max_num_faces=1, min_tracking_confidence=min_confidence,
+        )
+
+    def update(self, frame):
+        """Landmarks for ``frame`` in full-resolution pixels, or ``None`` if no face."""
+        try:
+            return faceswap.landmarks_with(self._mesh, frame, self.max_side)
+        except faceswap.NoFaceFound:
+            self.lost += 1
+            return None
+
+    def close(self):
+        self._mesh.close()
+
+
+@dataclass
+class StageStats:
+    name: str
+    workers: int = 1
+    frames: int = 0
+    busy: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def mean_ms(self):
+        """Mean time one frame spends in this stage."""
+        return self.busy / self.frames * 1000 if self.frames else 0.0
+
+    def utilization(self, elapsed):
+        """Fraction of the run this stage's workers were busy; the bottleneck is near 1."""
+        return self.busy / (self.workers * elapsed) if elapsed > 0 else 0.0
+
+    def record(self, seconds):
+        with self._lock:
+            self.busy += seconds
+            self.frames += 1
+
+    def timed(self, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        self.record(time.perf_counter() - start)
+        return result
+
+
+@dataclass
+class VideoReport:
+    frames: int = 0
+    total_frames: int = 0
+    elapsed: float = 0.0
+    frames_without_face: int = 0
+    stages: dict[str, StageStats] = field(default_factory=dict)
+
+    @property
+    def fps(self):
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bottleneck(self):
+        return max(self.stages.values(), key=lambda stage: stage.utilization(self.elapsed))
+
+
+def _swap_frame(frame, landmarks):
+    """Process-pool task: swap the worker's source face onto one frame."""
+    start = time.perf_counter()
+    if landmarks is not None:
+        src, src_face = faceswap._worker_source
+        hull = cv2.convexHull(landmarks, returnPoints=False).ravel()
+        frame = faceswap.swap(src, src_face, frame, faceswap.FaceData(landmarks, src_face.triangles, hull))
+    return frame, time.perf_counter() - start
+
+
+def swap_video(src_data, input_path, output_path, swap_workers=2, min_confidence=MIN_CONFIDENCE,
+               on_progress=None, progress_interval=0.25):
+    """Swap the face in the encoded image ``src_data`` onto every frame of ``input_path``.
+
+    Frames without a detectable face are written unchanged. ``on_progress``
+    receives the live ``VideoReport`` from the calling thread.
+    """
+    src = faceswap.decode(src_data)
+    src_face = faceswap.face_cache.get_or_analyze(src_data, src)
+
+    capture = cv2.VideoCapture(str(input_path))
+    if not capture.isOpened():
+        raise ValueError(f"could not open video {input_path}")
+    fps = capture.get(cv2.CAP_PROP_FPS) or 25.0
+    size = (int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+    writer = cv2.VideoWriter(str(output_path), cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+
+    report = VideoReport(total_frames=int(capture.get(cv2.CAP_PROP_FRAME_COUNT)))
+    stages = {name: StageStats(name, swap_workers if name == "swap" else 1)
+              for name in ("decode", "track", "swap", "encode")}
+    report.stages = stages
+    decoded = queue.Queue(QUEUE_SIZE)
+    tracked = queue.Queue(QUEUE_SIZE)
+    swapped = queue.Queue(QUEUE_SIZE)
+    stop = threading.Event()
+    errors = []
+    tracker = LandmarkTracker(min_confidence)
+
+    # Every blocking queue call polls ``stop`` so one failing stage unwinds the rest.
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(q):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return _END
+
+    def guarded(fn):
+        def run():
+            try:
+                fn()
+            except Exception as exc:  # surface in the caller, then unwind every stage
+                errors.append(exc)
+                stop.set()
+        return run
+
+    @guarded
+    def decode():
+        while not stop.is_set():
+            ok, frame = stages["decode"].timed(capture.read)
+            if not ok:
+                break
+            if not put(decoded, frame):
+                return
+        put(decoded, _END)
+
+    @guarded
+    def track():
+        while (item := get(decoded)) is not _END:
+            landmarks = stages["track"].timed(tracker.update, item)
+            if not put(tracked, (item, landmarks)):
+                return
+        put(tracked, _END)
+
+    @guarded
+    def swap():
+        # Frames go to the process pool in order and come back in order; the
+        # window keeps every worker busy without unbounded buffering.
+        in_flight = collections.deque()
+        window = swap_workers * 2
+        item = None
+        while item is not _END or in_flight:
+            if item is not _END and len(in_flight) < window:
+                item = get(tracked)
+                if item is not _END:
+                    in_flight.append(pool.submit(_swap_frame, *item))
+                continue
+            frame, seconds = in_flight.popleft().result()
+            stages["swap"].record(seconds)
+            if not put(swapped, frame):
+                return
+        put(swapped, _END)
+
+    @guarded
+    def encode():
+        while (frame := get(swapped)) is not _END:
+            stages["encode"].timed(writer.write, frame)
+            report.frames += 1
+
+    threads = [threading.Thread(target=decode, name="video-decode"),
+               threading.Thread(target=track, name="video-track"),
+               threading.Thread(target=swap, name="video-swap"),
+               threading.Thread(target=encode, name="video-encode")]
+    pool = ProcessPoolExecutor(swap_workers, mp_context=multiprocessing.get_context("spawn"),
+                               initializer=faceswap._init_worker, initargs=(src_data, src_face))
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    try:
+        while any(thread.is_alive() for thread in threads):
+            threads[-1].join(progress_interval)
+            report.elapsed = time.perf_counter() - start
+            report.frames_without_face = tracker.lost
+            if on_progress:
+                on_progress(report)
+            if errors:
+                break
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        pool.shutdown(cancel_futures=True)
+        capture.release()
+        writer.release()
+        tracker.close()
+    if errors:
+        raise errors[0]
+    report.elapsed = time.perf_counter() - start
+    report.frames_without_face = tracker.lost
+    return report
@@ -0,0 +1,358 @@
+"""Process-wide background jobs for the long-running tools.
+
+A page submits a function and keeps the returned job id; the work runs on a
+shared pool instead of the session's script thread, so reruns and page
+switches do not interrupt it and the page only polls the job table.
+
+Job functions take the job as their first argument and call
+``job.report(progress, message)`` as they go. Once cancellation has been
+requested ``report`` raises ``Cancelled``, so the work stops at its next
+progress update and its ``finally`` blocks clean up.
+
+Two backends are available:
+
+* ``"thread"``: for I/O-bound work and for engines that already run their
+  own thread or process pools;
+* ``"process"``: for CPU-bound work that should not compete with the
+  Streamlit server for the GIL. The function and its arguments must be
+  picklable (module-level functions), and progress comes back through a
+  manager queue.
+
+A thread job that starts its own process pool passes ``processes=n``: it
+waits until ``n`` process slots are free and holds them while it runs, so
+those pools and the process backend together never exceed ``processes``
+workers.
+
+Each owner (a browser session) runs at most ``per_owner`` jobs at once;
+further jobs wait in the queue, so one user cannot take every worker. The
+table keeps each owner's ``keep`` most recent finished jobs, for at most
+``max_age`` seconds.
+
+A job that produces a large file asks for a path with
+``job.output_file(suffix)`` and returns the path instead of the data. The
+files live in the manager's own temporary directory and are deleted when
+their job leaves the table or the manager closes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+THREAD, PROCESS = "thread", "process"
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+ACTIVE = (QUEUED, RUNNING)
+
+REMOTE_REPORT_INTERVAL = 0.1  # process jobs send progress (and poll cancellation) at most this often
+MAX_AGE = 24 * 3600  # finished jobs (and their output files) are forgotten after this long
+
+
+def _output_file(directory, job_id, suffix):
+    fd, path = tempfile.mkstemp(prefix=f"{job_id}-", suffix=suffix, dir=directory)
+    os.close(fd)
+    return path
+
+
+class Cancelled(Exception):
+    """Raised by ``report`` in a job whose cancellation was requested."""
+
+
+@dataclass(eq=False)
+class Job:
+    id: str
+    kind: str
+    name: str
+    owner: str
+    backend: str
+    status: str = QUEUED
+    progress: float = 0.0
+    message: str = ""
+    result: object = None
+    error: str | None = None
+    created: float = field(default_factory=time.time)
+    started: float | None = None
+    finished: float | None = None
+    processes: int = 0  # process slots held by a thread job's own pool
+    output_dir: str | None = field(default=None, repr=False)
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def active(self):
+        return self.status in ACTIVE
+
+    @property
+    def cancel_requested(self):
+        return self._cancel.is_set()
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    def output_file(self, suffix=""):
+        """Path of a new empty file for this job's result, deleted when the job leaves the table."""
+        return _output_file(self.output_dir, self.id, suffix)
+
+    def report(self, progress=None, message=None):
+        if progress is not None:
+            self.progress = min(1.0, max(0.0, progress))
+        if message is not None:
+            self.message = message
+        if self._cancel.is_set():
+            raise Cancelled()
+
+
+class _RemoteJob:
+    """The ``job`` argument of a process job: forwards progress to the parent's job table."""
+
+    def __init__(self, job_id, updates, cancel, output_dir):
+        self.id = job_id
+        self.output_dir = output_dir
+        self._updates = updates
+        self._cancel = cancel
+        self._last = 0.0
+        self._cancelled = False
+
+    @property
+    def cancel_requested(self):
+        return self._cancelled or self._cancel.is_set()
+
+    def output_file(self, suffix=""):
+        return _output_file(self.output_dir, self.id, suffix)
+
+    def report(self, progress=None, message=None):
+        now = time.monotonic()
+        if now - self._last < REMOTE_REPORT_INTERVAL and progress != 1.0:
+            return
+        self._last = now
+        self._updates.put((self.id, progress, message))
+        self._cancelled = self._cancel.is_set()
+        if self._cancelled:
+            raise Cancelled()
+
+
+def _run_remote(job_id, updates, cancel, output_dir, fn, args, kwargs):
+    return fn(_RemoteJob(job_id, updates, cancel, output_dir), *args, **kwargs)
+
+
+class JobManager:
+    def __init__(self, threads=8, processes=None, per_owner=2, keep=20, max_age=MAX_AGE):
+        self.per_owner = per_owner
+        self.keep = keep
+        self.max_age = max_age
+        self.output_dir = tempfile.mkdtemp(prefix="automation-jobs-")
+        self._limits = {THREAD: threads, PROCESS: processes or os.cpu_count() or 1}
+        self._executors = {}
+        self._jobs = {}
+        self._calls = {}
+        self._queue = deque()
+        self._running = Counter()
+        self._owners = Counter()
+        self._lock = threading.Lock()
+        self._manager = None
+        self._updates = None
+        self._remote_cancel = {}
+
+    @property
+    def process_limit(self):
+        return self._limits[PROCESS]
+
+    def submit(self, kind, name, fn, *args, owner="", backend=THREAD, processes=0, **kwargs):
+        if backend not in self._limits:
+            raise ValueError(f"unknown backend {backend!r}")
+        if processes and backend != THREAD:
+            raise ValueError("only thread jobs can hold process slots")
+        job = Job(uuid.uuid4().hex[:12], kind, name, owner, backend, processes=min(processes, self.process_limit),
+                  output_dir=self.output_dir)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._calls[job.id] = (fn, args, kwargs)
+            self._queue.append(job)
+            started = self._dispatch()
+            dropped = self._trim(owner)
+        self._watch(started)
+        self._remove_outputs(dropped)
+        return job
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def jobs(self, owner=None, kind=None):
+        """Jobs, newest first, optionally only one owner's and one kind."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [j for j in reversed(jobs)
+                if (owner is None or j.owner == owner) and (kind is None or j.kind == kind)]
+
+    def cancel(self, job_id):
+        """Request cancellation; queued jobs are dropped at once. False if the job is not active."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.active:
+                return False
+            job._cancel.set()
+            if job.status == QUEUED:
+                self._queue.remove(job)
+                self._calls.pop(job.id, None)
+                job.status, job.finished = CANCELLED, time.time()
+            elif job.id in self._remote_cancel:
+                self._remote_cancel[job.id].set()
+        return True
+
+    def counts(self, owner=None):
+        return Counter(job.status for job in self.jobs(owner))
+
+    def _executor(self, backend):
+        if backend not in self._executors:
+            if backend == THREAD:
+                self._executors[backend] = ThreadPoolExecutor(self._limits[THREAD], thread_name_prefix="job")
+            else:
+                # "spawn" keeps workers from inheriting the Streamlit server's threads.
+                context = multiprocessing.get_context("spawn")
+                self._manager = context.Manager()
+                self._updates = self._manager.Queue()
+                threading.Thread(target=self._listen, name="job-progress", daemon=True).start()
+                self._executors[backend] = ProcessPoolExecutor(self._limits[PROCESS], mp_context=context)
+        return self._executors[backend]
+
+    def _dispatch(self):
+        # Called with the lock held. Jobs are only handed to an executor when
+        # it has a free worker, so queued jobs stay cancellable here. Returns
+        # the started ``(job, future)`` pairs for ``_watch``.
+        started = []
+        for job in list(self._queue):
+            if (self._running[job.backend] >= self._limits[job.backend]
+                    or self._running[PROCESS] + job.processes > self._limits[PROCESS]
+                    or self._owners[job.owner] >= self.per_owner):
+                continue
+            self._queue.remove(job)
+            self._take(job, 1)
+            job.status, job.started = RUNNING, time.time()
+            fn, args, kwargs = self._calls.pop(job.id)
+            try:
+                executor = self._executor(job.backend)
+                if job.backend == THREAD:
+                    future = executor.submit(fn, job, *args, **kwargs)
+                else:
+                    cancel = self._manager.Event()
+                    self._remote_cancel[job.id] = cancel
+                    future = executor.submit(_run_remote, job.id, self._updates, cancel, self.output_dir, fn,
+                                             args, kwargs)
+            except Exception as exc:  # e.g. worker processes that could not start
+                job.status, job.error, job.finished = FAILED, str(exc) or type(exc).__name__, time.time()
+                self._remote_cancel.pop(job.id, None)
+                self._take(job, -1)
+                continue
+            started.append((job, future))
+        return started
+
+    def _watch(self, started):
+        # Outside the lock: a future that is already done runs its callback right here.
+        for job, future in started:
+            future.add_done_callback(functools.partial(self._finished, job))
+
+    def _finished(self, job, future):
+        try:
+            job.result = future.result()
+            job.status, job.progress = DONE, 1.0
+        except Cancelled:
+            job.status = CANCELLED
+        except Exception as exc:  # the job's own error, or a broken worker process
+            job.status, job.error = FAILED, str(exc) or type(exc).__name__
+        job.finished = time.time()
+        with self._lock:
+            self._remote_cancel.pop(job.id, None)
+            self._take(job, -1)
+            started = self._dispatch()
+        self._watch(started)
+
+    def _take(self, job, sign):
+        # Called with the lock held: claim (``sign=1``) or release (``-1``) the job's worker slots.
+        self._running[job.backend] += sign
+        self._running[PROCESS] += sign * job.processes
+        self._owners[job.owner] += sign
+
+    def _listen(self):
+        while True:
+            try:
+                update = self._updates.get()
+            except (EOFError, OSError):  # manager shut down
+                return
+            if update is None:
+                return
+            job_id, progress, message = update
+            job = self._jobs.get(job_id)
+            if job is not None and job.active:
+                if progress is not None:
+                    job.progress = min(1.0, max(0.0, progress))
+                if message is not None:
+                    job.message = message
+
+    def _trim(self, owner):
+        # Called with the lock held: forget ``owner``'s oldest finished jobs beyond ``keep``,
+        # so one busy session cannot push other sessions' results out of the table, and
+        # anyone's finished more than ``max_age`` ago. Returns the jobs forgotten.
+        finished = [job for job in self._jobs.values() if job.owner == owner and not job.active]
+        dropped = finished[:max(0, len(finished) - self.keep)]
+        cutoff = time.time() - self.max_age
+        dropped += [job for job in self._jobs.values()
+                    if not job.active and (job.finished or cutoff) < cutoff and job not in dropped]
+        for job in dropped:
+            del self._jobs[job.id]
+        return dropped
+
+    def _remove_outputs(self, dropped):
+        ids = {job.id for job in dropped}
+        if not ids:
+            return
+        for name in os.listdir(self.output_dir):
+            if name.partition("-")[0] in ids:
+                os.unlink(os.path.join(self.output_dir, name))
+
+    def close(self):
+        with self._lock:
+            for job in self._queue:
+                job.status, job.finished = CANCELLED, time.time()
+            self._queue.clear()
+            for job in self._jobs.values():
+                job._cancel.set()
+            for cancel in self._remote_cancel.values():
+                cancel.set()
+        for executor in self._executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        if self._manager is not None:
+            self._updates.put(None)
+            self._manager.shutdown()
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_jobs = None
+_jobs_lock = threading.Lock()
+
+
+def get_jobs(**options):
+    """The process-wide job manager. ``options`` only apply when it is first created."""
+    global _jobs
+    with _jobs_lock:
+        if _jobs is None:
+            _jobs = JobManager(**options)
+            # The manager itself lives until the process exits; its output files should not.
+            atexit.register(shutil.rmtree, _jobs.output_dir, True)
+        return _jobs
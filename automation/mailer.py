@@ -0,0 +1,276 @@
+"""SMTP sending with a small pool of authenticated, reused connections.
+
+Opening an SMTP session costs a TCP connect, a TLS handshake and an AUTH
+round trip, which is more than sending one message. ``SmtpPool`` keeps a
+few logged-in connections open and hands them to worker threads, so a bulk
+run pays that setup once per connection instead of once per message.
+Transient failures (dropped connections, 4xx replies) close the connection,
+back off and retry on a fresh one.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import queue
+import smtplib
+import socket
+import ssl
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+from email.utils import formataddr
+
+from automation import metrics
+
+GMAIL_HOST = "smtp.gmail.com"
+GMAIL_PORT = 587
+
+TRANSIENT_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    ConnectionError,
+    socket.timeout,
+)
+
+
+@dataclass(frozen=True)
+class SmtpConfig:
+    username: str
+    password: str
+    host: str = GMAIL_HOST
+    port: int = GMAIL_PORT
+    starttls: bool = True
+    timeout: float = 30.0
+
+
+@dataclass
+class SendResult:
+    to: str
+    ok: bool
+    attempts: int
+    error: str | None = None
+
+
+@dataclass
+class BulkReport:
+    results: list[SendResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    connections_opened: int = 0
+
+    @property
+    def sent(self):
+        return sum(r.ok for r in self.results)
+
+    @property
+    def failed(self):
+        return len(self.results) - self.sent
+
+    @property
+    def rate(self):
+        """Messages sent per second."""
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def connect(config):
+    server = smtplib.SMTP(config.host, config.port, timeout=config.timeout)
+    try:
+        server.ehlo()
+        if config.starttls:
+            server.starttls(context=ssl.create_default_context())
+            server.ehlo()
+        if config.password:
+            server.login(config.username, config.password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def is_transient(exc):
+    if isinstance(exc, TRANSIENT_ERRORS):
+        return True
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in exc.recipients.values())
+    return isinstance(exc, smtplib.SMTPResponseException) and 400 <= exc.smtp_code < 500
+
+
+class SmtpPool:
+    """Up to ``size`` open SMTP connections, created on demand and reused.
+
+    Connections idle for longer than ``idle_check`` seconds are probed with
+    ``NOOP`` before reuse, since servers drop quiet sessions.
+    """
+
+    def __init__(self, config, size=4, idle_check=30.0):
+        self.config = config
+        self.size = size
+        self.idle_check = idle_check
+        self.opened = 0
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+
+    def _open(self):
+        server = connect(self.config)
+        with self._lock:
+            self.opened += 1
+        return server
+
+    def _checkout(self):
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    server, last_used = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._open()
+                if time.monotonic() - last_used < self.idle_check:
+                    return server
+                try:
+                    server.noop()
+                    return server
+                except (smtplib.SMTPException, OSError):
+                    _quietly_close(server)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection.
+
+        A rejected message (an SMTP error reply) resets the session and keeps
+        the connection; anything else discards it.
+        """
+        server = self._checkout()
+        try:
+            yield server
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            self._release(server, reset=True)
+            raise
+        except BaseException:
+            _quietly_close(server)
+            self._slots.release()
+            raise
+        self._release(server)
+
+    def _release(self, server, reset=False):
+        try:
+            if reset:
+                server.rset()
+            self._idle.put((server, time.monotonic()))
+        except (smtplib.SMTPException, OSError):
+            _quietly_close(server)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                _quietly_close(server)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _quietly_close(server):
+    try:
+        server.close()
+    except OSError:
+        pass
+
+
+def build_message(sender, to, subject, body, anonymous=False):
+    message = EmailMessage()
+    message["From"] = formataddr(("Anonymous", sender)) if anonymous else sender
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+    return message
+
+
+def send_with_retry(pool, message, retries=3, backoff=0.5):
+    to = message["To"]
+    for attempt in range(1, retries + 2):
+        try:
+            with metrics.timer("operation", op="smtp_send"), pool.connection() as server:
+                server.send_message(message)
+            return SendResult(to, True, attempt)
+        except (smtplib.SMTPException, OSError) as exc:
+            if attempt > retries or not is_transient(exc):
+                return SendResult(to, False, attempt, str(exc))
+            time.sleep(backoff * 2 ** (attempt - 1))
+
+
+def send_one(config, message):
+    """Send a single message on a short-lived connection."""
+    with SmtpPool(config, size=1) as pool:
+        return send_with_retry(pool, message)
+
+
+def render(template, row):
+    """Fill ``$name`` / ``${name}`` placeholders from ``row``; unknown names are left as-is."""
+    return string.Template(template).safe_substitute(row)
+
+
+def read_recipients(data, email_column="email"):
+    """Rows of a recipients CSV. Uses ``email_column`` if present, else the first column."""
+    text = data.decode("utf-8-sig") if isinstance(data, bytes) else data
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        return []
+    column = email_column if email_column in reader.fieldnames else reader.fieldnames[0]
+    rows = []
+    for row in reader:
+        address = (row.get(column) or "").strip()
+        if address:
+            rows.append({**row, "email": address})
+    return rows
+
+
+def send_bulk(config, sender, rows, subject, body, *, anonymous=False, connections=4,
+              retries=3, on_progress=None):
+    """Render and send one message per row over a pool of ``connections``.
+
+    Each worker thread keeps its pooled connection busy back to back, so the
+    handshake cost is spread across every message that connection carries.
+    ``on_progress(done, total, report)`` runs on the calling thread.
+    """
+    report = BulkReport()
+    start = time.perf_counter()
+    with SmtpPool(config, size=connections) as pool, ThreadPoolExecutor(max_workers=connections) as workers:
+        futures = [
+            workers.submit(
+                send_with_retry, pool,
+                build_message(sender, row["email"], render(subject, row), render(body, row), anonymous),
+                retries,
+            )
+            for row in rows
+        ]
+        try:
+            for future in as_completed(futures):
+                report.results.append(future.result())
+                report.elapsed = time.perf_counter() - start
+                if on_progress:
+                    on_progress(len(report.results), len(futures), report)
+        except BaseException:
+            # e.g. a cancelled job raising from on_progress: don't send the rest
+            workers.shutdown(cancel_futures=True)
+            raise
+        report.connections_opened = pool.opened
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -0,0 +1,147 @@
+"""Persistent download manifest for incremental re-crawls.
+
+The manifest is a SQLite database keyed by URL. For every file it records the
+validators the server sent (``ETag`` / ``Last-Modified``), the size, and the
+SHA-256 of the content. On the next crawl the downloader turns those into
+conditional request headers, so unchanged files come back as ``304 Not
+Modified`` and are not transferred again.
+
+File content is stored once per hash under ``<dest>/.objects/`` and the
+mirrored path for each URL is a hard link to that object, so identical files
+served under different URLs take the disk space of one.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+MANIFEST_NAME = ".manifest.sqlite3"
+OBJECTS_DIR = ".objects"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    url           TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    size          INTEGER NOT NULL,
+    sha256        TEXT NOT NULL,
+    path          TEXT NOT NULL,
+    fetched_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_sha256 ON files (sha256);
+"""
+
+
+@dataclass(frozen=True)
+class Entry:
+    url: str
+    etag: str | None
+    last_modified: str | None
+    size: int
+    sha256: str
+    path: str
+    fetched_at: float
+
+
+class Manifest:
+    """URL → content index stored next to the downloads.
+
+    One connection is shared by all download threads behind a lock; every
+    write is a single small statement, so contention is negligible next to
+    network time.
+    """
+
+    def __init__(self, dest):
+        self.dest = Path(dest)
+        self.dest.mkdir(parents=True, exist_ok=True)
+        self.objects = self.dest / OBJECTS_DIR
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.dest / MANIFEST_NAME, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, url):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, etag, last_modified, size, sha256, path, fetched_at FROM files WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return Entry(*row) if row else None
+
+    def conditional_headers(self, url):
+        """Validator headers for ``url``, or ``{}`` if it has no usable local copy."""
+        entry = self.get(url)
+        if entry is None or not self.object_path(entry.sha256).exists():
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def record(self, url, *, etag, last_modified, size, sha256, path):
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, size, sha256, str(path), time.time()),
+            )
+
+    def touch(self, url):
+        with self._lock, self._db:
+            self._db.execute("UPDATE files SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def object_path(self, sha256):
+        return self.objects / sha256[:2] / sha256
+
+    def store(self, part, sha256):
+        """Move a finished ``.part`` file into the object store.
+
+        Returns ``True`` if the content was already stored (the part file is
+        discarded), ``False`` if this is the first copy.
+        """
+        obj = self.object_path(sha256)
+        if obj.exists():
+            Path(part).unlink(missing_ok=True)
+            return True
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(part, obj)
+        return False
+
+    def link(self, sha256, target):
+        """Make ``target`` point at the stored object, replacing whatever was there."""
+        obj = self.object_path(sha256)
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".link")
+        tmp.unlink(missing_ok=True)
+        try:
+            os.link(obj, tmp)
+        except OSError:
+            # Filesystems without hard links get a plain copy.
+            shutil.copyfile(obj, tmp)
+        os.replace(tmp, target)
+
+    def stats(self):
+        with self._lock:
+            files, logical = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM files").fetchone()
+            objects, stored = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM (SELECT sha256, MAX(size) AS size FROM files GROUP BY sha256)"
+            ).fetchone()
+        return {"files": files, "objects": objects, "bytes": logical, "stored_bytes": stored}
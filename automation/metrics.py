@@ -0,0 +1,261 @@
+"""Process-wide latency histograms and a Prometheus text exporter.
+
+Three families are recorded:
+
+* ``script_run``: one full run of the dashboard script (``main()``);
+* ``page_render``: one render of a page function, labelled ``page``; fragment
+  reruns are counted here too, since they only run the page;
+* ``operation``: one tool operation (HTTP fetch, SMTP send, image render,
+  Twilio request...), labelled ``op``.
+
+Each series is a fixed-bucket histogram with a count, a sum and an error
+count. Observing is a ``bisect`` and a few integer increments under the
+series' own lock, so the engines can record every operation without
+measurable overhead, and memory is fixed by the number of series.
+
+The exporter serves ``/metrics`` in the Prometheus text format from a daemon
+thread on a local port. It starts when ``AUTOMATION_METRICS_PORT`` is set, or
+from the Diagnostics page.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PORT_ENV = "AUTOMATION_METRICS_PORT"
+DEFAULT_PORT = 9464
+PREFIX = "automation"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed upper bounds (seconds)."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # the last one is +Inf
+        self._sum = 0.0
+        self._errors = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds, error=False):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += seconds
+            self._errors += bool(error)
+
+    def snapshot(self):
+        """``(bucket counts, sum, errors)``; counts are per bucket, not cumulative."""
+        with self._lock:
+            return list(self._counts), self._sum, self._errors
+
+    @property
+    def count(self):
+        with self._lock:
+            return sum(self._counts)
+
+    def quantile(self, q, counts=None):
+        """Estimate the ``q`` quantile by interpolating inside its bucket, as Prometheus does."""
+        counts = counts if counts is not None else self.snapshot()[0]
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if seen + count >= rank and count:
+                if index == len(self.buckets):  # +Inf bucket: the best answer is the largest bound
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs):
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in pairs)
+
+
+class Metrics:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.started = time.time()
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault(key, Histogram(self.buckets))
+        return series
+
+    def observe(self, name, seconds, error=False, **labels):
+        self.histogram(name, **labels).observe(seconds, error)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Time the block; an ``Exception`` escaping it counts as an error.
+
+        ``BaseException``s such as Streamlit's rerun and stop signals are
+        control flow, not failures, and are recorded as successes.
+        """
+        series = self.histogram(name, **labels)
+        error = False
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            series.observe(time.perf_counter() - start, error)
+
+    def timed(self, name, **labels):
+        """Decorator form of ``timer``."""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def series(self):
+        """``(name, labels dict, histogram)`` for every series, sorted by name and labels."""
+        with self._lock:
+            items = sorted(self._series.items())
+        return [(name, dict(labels), histogram) for (name, labels), histogram in items]
+
+    def summary(self):
+        """One dict per series with count, error rate, mean and estimated percentiles (seconds)."""
+        rows = []
+        for name, labels, histogram in self.series():
+            counts, total, errors = histogram.snapshot()
+            count = sum(counts)
+            rows.append({
+                "name": name,
+                **labels,
+                "count": count,
+                "errors": errors,
+                "error_rate": errors / count if count else 0.0,
+                "mean": total / count if count else None,
+                "p50": histogram.quantile(0.5, counts),
+                "p95": histogram.quantile(0.95, counts),
+                "p99": histogram.quantile(0.99, counts),
+            })
+        return rows
+
+    def prometheus(self):
+        """All series in the Prometheus text exposition format."""
+        families = {}
+        for name, labels, histogram in self.series():
+            families.setdefault(name, []).append((sorted(labels.items()), histogram))
+        lines = []
+        for name, members in families.items():
+            metric = f"{PREFIX}_{name}_seconds"
+            lines.append(f"# HELP {metric} Latency of {name.replace('_', ' ')}s.")
+            lines.append(f"# TYPE {metric} histogram")
+            for pairs, histogram in members:
+                counts, total, _ = histogram.snapshot()
+                cumulative = 0
+                for bound, count in zip((*histogram.buckets, "+Inf"), counts):
+                    cumulative += count
+                    lines.append(f"{metric}_bucket{{{_labels([*pairs, ('le', bound)])}}} {cumulative}")
+                braces = f"{{{_labels(pairs)}}}" if pairs else ""
+                lines.append(f"{metric}_sum{braces} {total}")
+                lines.append(f"{metric}_count{braces} {cumulative}")
+            errors = f"{PREFIX}_{name}_errors_total"
+            lines.append(f"# HELP {errors} Failed {name.replace('_', ' ')}s.")
+            lines.append(f"# TYPE {errors} counter")
+            for pairs, histogram in members:
+                braces = f"{{{_labels(pairs)}}}" if pairs else ""
+                lines.append(f"{errors}{braces} {histogram.snapshot()[2]}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+            self.started = time.time()
+
+
+_metrics = Metrics()
+
+
+def get_metrics():
+    return _metrics
+
+
+def observe(name, seconds, error=False, **labels):
+    _metrics.observe(name, seconds, error, **labels)
+
+
+def timer(name, **labels):
+    return _metrics.timer(name, **labels)
+
+
+def timed(name, **labels):
+    return _metrics.timed(name, **labels)
+
+
+# -- exporter ------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = _metrics.prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def serve(port=DEFAULT_PORT, host="127.0.0.1"):
+    """Start the exporter once per process and return its server; later calls return the same one."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _Handler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-exporter", daemon=True).start()
+        return _server
+
+
+def exporter():
+    """The running exporter's ``(host, port)``, or None."""
+    return _server.server_address[:2] if _server is not None else None
+
+
+def serve_from_env():
+    """Start the exporter on ``$AUTOMATION_METRICS_PORT`` if it is set."""
+    port = os.environ.get(PORT_ENV)
+    if port and _server is None:
+        try:
+            serve(int(port))
+        except (OSError, ValueError):  # port taken or invalid: the app works without the exporter
+            pass
+    return exporter()
@@ -0,0 +1,169 @@
+"""Micro-benchmarks behind the Tuple vs List page.
+
+Two families are measured on the running interpreter:
+
+* sequences of ``n`` integers (list, tuple, ``array.array``, NumPy array),
+  timed for creation, iteration, indexing, hashing and unpacking at each
+  size, with shallow (``sys.getsizeof``) and traced (``tracemalloc``) memory;
+* three-field records (tuple, list, namedtuple, ``__slots__`` class, plain
+  class), timed for creation, field access, hashing and unpacking, with
+  memory per instance.
+
+Timings use ``timeit`` with the loop count grown until one run takes at
+least ``min_time``, and report the best of ``repeat`` runs. An operation a
+type does not support (hashing a list, unpacking a class) is ``None``.
+"""
+
+from __future__ import annotations
+
+import array
+import gc
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections import namedtuple
+
+SIZES = (10, 1_000, 100_000)
+SEQUENCE_OPERATIONS = {
+    "create": "make(source)",
+    "iterate": "for _ in c: pass",
+    "index": "c[mid]",
+    "hash": "hash(c)",
+    "unpack": "first, *rest = c",
+}
+RECORD_OPERATIONS = ("create", "access", "hash", "unpack")
+RECORD_COUNT = 10_000
+
+Point = namedtuple("Point", "x y z")
+
+
+class SlotsPoint:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+
+class PlainPoint:
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+
+def interpreter():
+    """Identifies the interpreter results belong to, e.g. ``CPython 3.11.7 (numpy 2.4.0)``."""
+    label = f"{platform.python_implementation()} {platform.python_version()}"
+    try:
+        import numpy
+    except ImportError:
+        return label
+    return f"{label} (numpy {numpy.__version__})"
+
+
+def sequence_types():
+    types = {
+        "list": list,
+        "tuple": tuple,
+        "array.array": lambda source: array.array("q", source),
+    }
+    try:
+        import numpy
+    except ImportError:
+        return types
+    types["numpy"] = numpy.array
+    return types
+
+
+# name -> (creation expression, field access expression, hashable, unpackable)
+RECORD_TYPES = {
+    "tuple": ("(x, y, z)", "r[1]", True, True),
+    "list": ("[x, y, z]", "r[1]", False, True),
+    "namedtuple": ("Point(x, y, z)", "r.y", True, True),
+    "__slots__ class": ("SlotsPoint(x, y, z)", "r.y", False, False),
+    "plain class": ("PlainPoint(x, y, z)", "r.y", False, False),
+}
+
+
+def time_statement(stmt, namespace, min_time=0.02, repeat=3):
+    """Best seconds per execution of ``stmt``."""
+    timer = timeit.Timer(stmt, globals=namespace)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    return min([elapsed, *timer.repeat(repeat - 1, number)]) / number
+
+
+def traced_bytes(build):
+    """Bytes still allocated after ``build()``, as seen by ``tracemalloc``; the result is kept alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def _supports(stmt, namespace):
+    try:
+        exec(stmt, dict(namespace))
+    except TypeError:
+        return False
+    return True
+
+
+def run_sequences(sizes=SIZES, min_time=0.02, on_progress=None):
+    """Timing rows ``{type, operation, size, seconds}`` and memory rows ``{type, size, getsizeof, traced}``."""
+    types = sequence_types()
+    timings, memory = [], []
+    steps, done = len(sizes) * len(types), 0
+    for size in sizes:
+        # Large ints, so every container holds the same shared objects.
+        source = list(range(10**6, 10**6 + size))
+        for name, make in types.items():
+            c = make(source)
+            namespace = {"make": make, "source": source, "c": c, "mid": size // 2}
+            for operation, stmt in SEQUENCE_OPERATIONS.items():
+                seconds = time_statement(stmt, namespace, min_time) if _supports(stmt, namespace) else None
+                timings.append({"type": name, "operation": operation, "size": size, "seconds": seconds})
+            memory.append({
+                "type": name, "size": size, "getsizeof": sys.getsizeof(c),
+                "traced": traced_bytes(lambda: make(source)),
+            })
+            done += 1
+            if on_progress:
+                on_progress(done, steps)
+    return timings, memory
+
+
+def run_records(count=RECORD_COUNT, min_time=0.02):
+    """Timing rows ``{type, operation, seconds}`` and memory rows ``{type, getsizeof, traced}`` per instance."""
+    timings, memory = [], []
+    base = {"Point": Point, "SlotsPoint": SlotsPoint, "PlainPoint": PlainPoint, "x": 10**6, "y": 10**6 + 1,
+            "z": 10**6 + 2}
+    for name, (create, access, hashable, unpackable) in RECORD_TYPES.items():
+        namespace = {**base, "r": eval(create, base)}
+        statements = {
+            "create": create,
+            "access": access,
+            "hash": "hash(r)" if hashable else None,
+            "unpack": "a, b, c = r" if unpackable else None,
+        }
+        for operation in RECORD_OPERATIONS:
+            stmt = statements[operation]
+            seconds = time_statement(stmt, namespace, min_time) if stmt else None
+            timings.append({"type": name, "operation": operation, "seconds": seconds})
+        record = namespace["r"]
+        shallow = sys.getsizeof(record) + (sys.getsizeof(record.__dict__) if hasattr(record, "__dict__") else 0)
+        code = compile(f"[{create} for _ in range({count})]", "<records>", "eval")
+        memory.append({
+            "type": name, "getsizeof": shallow,
+            "traced": traced_bytes(lambda: eval(code, base)) / count,
+        })
+    return timings, memory
@@ -0,0 +1,187 @@
+"""Send one alert to several channels at once.
+
+Each selected channel runs on a shared thread pool with its own deadline and
+retry loop, so an alert's end-to-end latency is that of the slowest channel
+rather than the sum of all of them. The dispatcher returns a per-channel
+report of status, attempts and latency.
+
+A channel is any object with a ``name`` and a ``send(alert)`` method that
+returns a provider reference (message or call SID) or raises. ``StubChannel``
+stands in for a real provider in tests and demos.
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from xml.sax.saxutils import escape
+
+from automation import metrics
+
+SMS = "SMS"
+VOICE = "Voice Call"
+WHATSAPP = "WhatsApp"
+
+DEFAULT_TIMEOUT = 15.0
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="notify")
+
+
+@dataclass(frozen=True)
+class Alert:
+    message: str
+    to: str
+
+
+@dataclass
+class ChannelResult:
+    channel: str
+    status: str  # "sent", "failed" or "timeout"
+    latency: float
+    attempts: int = 0
+    reference: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self):
+        return self.status == "sent"
+
+
+@dataclass(frozen=True)
+class TwilioConfig:
+    account_sid: str
+    auth_token: str
+    from_number: str
+    whatsapp_from: str = ""
+
+
+@functools.lru_cache(maxsize=1024)
+def voice_twiml(message):
+    """TwiML that reads ``message`` aloud; cached per distinct text."""
+    return f"<Response><Say>{escape(message)}</Say></Response>"
+
+
+@metrics.timed("operation", op="twilio_sms")
+def send_sms(client, from_, to, body):
+    return client.messages.create(body=body, from_=from_, to=to).sid
+
+
+@metrics.timed("operation", op="twilio_call")
+def place_call(client, from_, to, message, status_callback=None):
+    """Start a call that speaks ``message``; Twilio POSTs status changes to ``status_callback`` if given."""
+    if status_callback is None:
+        return client.calls.create(twiml=voice_twiml(message), from_=from_, to=to).sid
+    return client.calls.create(
+        twiml=voice_twiml(message), from_=from_, to=to, status_callback=status_callback,
+        status_callback_event=["initiated", "ringing", "answered", "completed"], status_callback_method="POST",
+    ).sid
+
+
+@metrics.timed("operation", op="twilio_whatsapp")
+def send_whatsapp(client, from_, to, body):
+    return client.messages.create(body=body, from_=f"whatsapp:{from_}", to=f"whatsapp:{to}").sid
+
+
+class _TwilioChannel:
+    def __init__(self, config):
+        from automation.providers import twilio_client
+
+        self.config = config
+        self.client = twilio_client(config.account_sid, config.auth_token)
+
+
+class TwilioSms(_TwilioChannel):
+    name = SMS
+
+    def send(self, alert):
+        return send_sms(self.client, self.config.from_number, alert.to, alert.message)
+
+
+class TwilioVoice(_TwilioChannel):
+    name = VOICE
+
+    def send(self, alert):
+        return place_call(self.client, self.config.from_number, alert.to, alert.message)
+
+
+class TwilioWhatsApp(_TwilioChannel):
+    name = WHATSAPP
+
+    def send(self, alert):
+        return send_whatsapp(self.client, self.config.whatsapp_from or self.config.from_number,
+                             alert.to, alert.message)
+
+
+class StubChannel:
+    """Local stand-in for a provider: sleeps ``latency`` seconds and fails ``fail_rate`` of the time."""
+
+    def __init__(self, name, latency=0.2, fail_rate=0.0, seed=None):
+        self.name = name
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.sent = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def send(self, alert):
+        time.sleep(self.latency)
+        with self._lock:
+            if self._random.random() < self.fail_rate:
+                raise ConnectionError(f"{self.name} stub: simulated failure")
+            self.sent.append(alert)
+            return f"stub-{self.name.lower().replace(' ', '-')}-{len(self.sent)}"
+
+
+def twilio_channels(config):
+    return {c.name: c for c in (TwilioSms(config), TwilioVoice(config), TwilioWhatsApp(config))}
+
+
+def stub_channels(latency=0.2, fail_rate=0.0):
+    return {name: StubChannel(name, latency, fail_rate) for name in (SMS, VOICE, WHATSAPP)}
+
+
+def _send_with_retry(channel, alert, deadline, retries, backoff):
+    start = time.perf_counter()
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            reference = channel.send(alert)
+            return ChannelResult(channel.name, "sent", time.perf_counter() - start, attempts, reference)
+        except Exception as exc:  # provider SDKs raise their own exception types
+            delay = backoff * 2 ** (attempts - 1) * random.uniform(0.5, 1.5)
+            if attempts > retries or time.monotonic() + delay >= deadline:
+                return ChannelResult(channel.name, "failed", time.perf_counter() - start, attempts,
+                                     error=str(exc))
+            time.sleep(delay)
+
+
+def dispatch(alert, channels, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+    """Send ``alert`` on every channel in ``channels`` concurrently.
+
+    Each channel gets ``timeout`` seconds in total, retries included; a
+    channel still running at its deadline is reported as ``"timeout"`` and
+    the call returns without waiting for it. Results keep the order of
+    ``channels``.
+    """
+    start = time.perf_counter()
+    deadline = time.monotonic() + timeout
+    futures = {
+        _executor.submit(_send_with_retry, channel, alert, deadline, retries, backoff): channel
+        for channel in channels
+    }
+    wait(futures, timeout=timeout)
+    results = []
+    for future, channel in futures.items():
+        if future.done():
+            results.append(future.result())
+        else:
+            results.append(ChannelResult(channel.name, "timeout", time.perf_counter() - start,
+                                         error=f"no response within {timeout:g}s"))
+    return results
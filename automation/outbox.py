@@ -0,0 +1,426 @@
+"""Durable outbox for SMS, calls, WhatsApp and email.
+
+Pages write each outbound message to a SQLite table (WAL mode) and return
+immediately; a background worker drains the table in batches and hands each
+message to the sender registered for its route (``"sms:<account sid>:<token
+hash>"``, ``"email:<user>@<host>:<port>:<password hash>"``, ...).
+
+Every message carries an idempotency key that is unique in the table, so
+enqueueing the same message twice is a no-op. A batch is claimed by marking
+its rows ``sending`` with a lease; if the process dies mid-send the lease
+expires and the rows go back to ``pending`` for the next worker. A message is
+only marked ``sent`` once the provider has accepted it, so the one remaining
+window for a duplicate is a crash between the provider's reply and that
+write. Senders get the key so providers that deduplicate on it can close
+that window too (email uses it as the ``Message-ID``).
+
+Credentials are never written to the database. Senders live in memory, so
+after a restart queued messages wait until a page registers their route
+again.
+
+Each route can have a messages-per-second limit (a token bucket, so
+provider throughput limits are respected) and routes drain independently:
+a long, rate-limited campaign on one route does not hold up messages on
+another. Messages can carry a ``tag`` (a campaign id) for progress queries.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from automation.ratelimit import TokenBucket
+
+DEFAULT_PATH = Path.home() / ".automation_suite" / "outbox.sqlite3"
+PENDING, SENDING, SENT, FAILED = "pending", "sending", "sent", "failed"
+FLUSH_EVERY = 50  # outcomes written per transaction while a batch is in flight...
+FLUSH_SECONDS = 1.0  # ...or at least this often
+
+_TABLE = """
+CREATE TABLE IF NOT EXISTS messages (
+    id          INTEGER PRIMARY KEY,
+    key         TEXT NOT NULL UNIQUE,
+    route       TEXT NOT NULL,
+    tag         TEXT,
+    payload     TEXT NOT NULL,
+    status      TEXT NOT NULL DEFAULT 'pending',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    next_try    REAL NOT NULL,
+    lease_until REAL,
+    reference   TEXT,
+    error       TEXT,
+    created_at  REAL NOT NULL,
+    updated_at  REAL NOT NULL
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS messages_ready ON messages (status, next_try);
+CREATE INDEX IF NOT EXISTS messages_route ON messages (route, id);
+CREATE INDEX IF NOT EXISTS messages_tag ON messages (tag, status);
+"""
+
+
+class PermanentError(Exception):
+    """Raised by a sender when retrying cannot help (bad number, rejected address, ...)."""
+
+
+@dataclass(frozen=True)
+class Entry:
+    id: int
+    key: str
+    route: str
+    payload: dict
+    status: str
+    attempts: int
+    reference: str | None
+    error: str | None
+    created_at: float
+    updated_at: float
+
+
+class Outbox:
+    """Persistent message queue with a batch-draining worker thread.
+
+    ``register(route, send)`` installs ``send(payload, key) -> reference`` for
+    a route. Only routes with a registered sender are claimed. Each route is
+    claimed at most ``batch_size`` rows at a time (fewer when rate-limited, so
+    a batch finishes well within its lease) and delivered on the shared pool
+    of ``workers`` send threads.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=100, workers=8, max_attempts=5,
+                 backoff=2.0, lease=120.0, poll=1.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = lease
+        self.poll = poll
+        self._senders = {}
+        self._limits = {}
+        self._lock = threading.Lock()
+        # Autocommit mode; writes go through _transaction() so claims are
+        # atomic even when several server processes share the file.
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # NORMAL only risks the last commits on power loss, not on a process crash.
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA busy_timeout=5000")
+        self._db.executescript(_TABLE)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(messages)")}
+        if "tag" not in columns:  # outboxes created before campaigns existed
+            self._db.execute("ALTER TABLE messages ADD COLUMN tag TEXT")
+        self._db.executescript(_INDEXES)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="outbox-send")
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def register(self, route, send, rate=None):
+        """Install the sender for ``route``, limited to ``rate`` messages per second if given."""
+        self._senders[route] = send
+        limit = self._limits.get(route)
+        if not rate:
+            self._limits.pop(route, None)
+        elif limit is None or limit.rate != rate:
+            self._limits[route] = TokenBucket(rate)
+        self._wake.set()
+
+    def enqueue(self, route, payload, key=None, tag=None):
+        """Queue one message; returns ``(key, created)``. ``created`` is False for a duplicate key."""
+        key = key or uuid.uuid4().hex
+        now = time.time()
+        with self._transaction() as db:
+            cursor = db.execute(
+                "INSERT OR IGNORE INTO messages (key, route, tag, payload, next_try, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, route, tag, json.dumps(payload), now, now, now),
+            )
+        self._wake.set()
+        return key, cursor.rowcount == 1
+
+    def enqueue_many(self, items, tag=None):
+        """Queue ``(route, payload, key)`` tuples in one transaction; returns how many were new."""
+        now = time.time()
+        rows = [(key or uuid.uuid4().hex, route, tag, json.dumps(payload), now, now, now)
+                for route, payload, key in items]
+        with self._transaction() as db:
+            before = db.total_changes
+            db.executemany(
+                "INSERT OR IGNORE INTO messages (key, route, tag, payload, next_try, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = db.total_changes - before
+        self._wake.set()
+        return added
+
+    def _entries(self, sql, params):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, key, route, payload, status, attempts, reference, error, created_at, updated_at "
+                f"FROM messages {sql}", params,
+            ).fetchall()
+        return [Entry(r[0], r[1], r[2], json.loads(r[3]), *r[4:]) for r in rows]
+
+    def get(self, key):
+        entries = self._entries("WHERE key = ?", (key,))
+        return entries[0] if entries else None
+
+    def recent(self, route=None, limit=20):
+        if route is None:
+            return self._entries("ORDER BY id DESC LIMIT ?", (limit,))
+        return self._entries("WHERE route = ? ORDER BY id DESC LIMIT ?", (route, limit))
+
+    def counts(self, route=None, tag=None):
+        if tag is not None:
+            sql, params = "SELECT status, COUNT(*) FROM messages WHERE tag = ?", (tag,)
+        elif route is not None:
+            sql, params = "SELECT status, COUNT(*) FROM messages WHERE route = ?", (route,)
+        else:
+            sql, params = "SELECT status, COUNT(*) FROM messages", ()
+        with self._lock:
+            return dict(self._db.execute(sql + " GROUP BY status", params).fetchall())
+
+    def sent_since(self, tag, since):
+        """``(count, oldest)``: messages tagged ``tag`` delivered after ``since``, and the earliest time."""
+        with self._lock:
+            count, oldest = self._db.execute(
+                "SELECT COUNT(*), MIN(updated_at) FROM messages WHERE tag = ? AND status = ? AND updated_at >= ?",
+                (tag, SENT, since),
+            ).fetchone()
+        return count, oldest or since
+
+    def _batch_limit(self, route):
+        limit = self._limits.get(route)
+        if limit is None:
+            return self.batch_size
+        return max(1, min(self.batch_size, int(limit.rate * self.lease / 2)))
+
+    def _claim(self, exclude=()):
+        routes = [route for route in self._senders if route not in exclude]
+        if not routes:
+            return []
+        now = time.time()
+        rows = []
+        with self._transaction() as db:
+            # Rows left in flight by a crashed worker become claimable again.
+            db.execute("UPDATE messages SET status = ?, lease_until = NULL WHERE status = ? AND lease_until < ?",
+                       (PENDING, SENDING, now))
+            for route in routes:
+                rows += db.execute(
+                    "SELECT id, key, route, payload, attempts FROM messages "
+                    "WHERE route = ? AND status = ? AND next_try <= ? ORDER BY id LIMIT ?",
+                    (route, PENDING, now, self._batch_limit(route)),
+                ).fetchall()
+            db.executemany(
+                "UPDATE messages SET status = ?, attempts = attempts + 1, lease_until = ?, updated_at = ? "
+                "WHERE id = ?",
+                [(SENDING, now + self.lease, now, row[0]) for row in rows],
+            )
+        return rows
+
+    def _deliver(self, row):
+        id_, key, route, payload, attempts = row
+        try:
+            return id_, attempts + 1, self._senders[route](json.loads(payload), key), None, False
+        except PermanentError as exc:
+            return id_, attempts + 1, None, str(exc), True
+        except Exception as exc:  # provider SDKs raise their own exception types
+            return id_, attempts + 1, None, str(exc) or type(exc).__name__, False
+
+    def _finish(self, outcomes):
+        now = time.time()
+        updates = []
+        for id_, attempts, reference, error, permanent in outcomes:
+            if error is None:
+                updates.append((SENT, reference, None, now, now, id_))
+            elif permanent or attempts >= self.max_attempts:
+                updates.append((FAILED, None, error, now, now, id_))
+            else:
+                updates.append((PENDING, None, error, now + self.backoff * 2 ** (attempts - 1), now, id_))
+        with self._transaction() as db:
+            db.executemany(
+                "UPDATE messages SET status = ?, reference = ?, error = ?, next_try = ?, updated_at = ?, "
+                "lease_until = NULL WHERE id = ?",
+                updates,
+            )
+
+    def _release(self, rows):
+        """Hand claimed but unsent rows back, as if they had never been claimed."""
+        with self._transaction() as db:
+            db.executemany(
+                "UPDATE messages SET status = ?, attempts = attempts - 1, lease_until = NULL WHERE id = ?",
+                [(PENDING, row[0]) for row in rows],
+            )
+
+    def _record_done(self, futures):
+        done = [f for f in futures if f.done()]
+        if done:
+            self._finish([f.result() for f in done])
+        return [f for f in futures if f not in done]
+
+    def _deliver_batch(self, rows):
+        limit = self._limits.get(rows[0][2])
+        futures = []
+        flushed = time.monotonic()
+        for i, row in enumerate(rows):
+            if self._stop.is_set():
+                self._release(rows[i:])
+                break
+            # Wait for tokens here rather than in the send threads, so a
+            # throttled route never ties up the pool other routes share.
+            if limit is not None:
+                limit.acquire()
+            futures.append(self._pool.submit(self._deliver, row))
+            # Record outcomes as they arrive, so progress moves during long batches.
+            if time.monotonic() - flushed >= FLUSH_SECONDS:
+                futures, flushed = self._record_done(futures), time.monotonic()
+        outcomes = []
+        for future in as_completed(futures):
+            outcomes.append(future.result())
+            if len(outcomes) >= FLUSH_EVERY or time.monotonic() - flushed >= FLUSH_SECONDS:
+                self._finish(outcomes)
+                outcomes, flushed = [], time.monotonic()
+        if outcomes:
+            self._finish(outcomes)
+
+    def drain_once(self):
+        """Claim and deliver one batch per route; returns the number of messages attempted."""
+        rows = self._claim()
+        by_route = defaultdict(list)
+        for row in rows:
+            by_route[row[2]].append(row)
+        for batch in by_route.values():
+            self._deliver_batch(batch)
+        return len(rows)
+
+    def _run(self):
+        busy = {}  # route -> future of its batch in flight
+        with ThreadPoolExecutor(thread_name_prefix="outbox-batch") as batches:
+            while not self._stop.is_set():
+                for route, future in list(busy.items()):
+                    if future.done():
+                        del busy[route]
+                try:
+                    rows = self._claim(exclude=busy)
+                except sqlite3.Error:
+                    rows = []
+                by_route = defaultdict(list)
+                for row in rows:
+                    by_route[row[2]].append(row)
+                for route, batch in by_route.items():
+                    busy[route] = batches.submit(self._deliver_batch, batch)
+                    busy[route].add_done_callback(lambda _: self._wake.set())
+                if not rows:
+                    self._wake.wait(self.poll)
+                    self._wake.clear()
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="outbox-worker", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def close(self):
+        self.stop()
+        self._pool.shutdown()
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def twilio_sender(kind, account_sid, auth_token):
+    """Sender for ``"sms"``, ``"call"`` or ``"whatsapp"`` payloads ``{"from", "to", "body"}``."""
+    from twilio.base.exceptions import TwilioRestException
+
+    from automation import notify
+    from automation.providers import twilio_client
+
+    action = {"sms": notify.send_sms, "call": notify.place_call, "whatsapp": notify.send_whatsapp}[kind]
+
+    def send(payload, key):
+        # Looked up per send so an evicted client is transparently rebuilt.
+        client = twilio_client(account_sid, auth_token)
+        try:
+            return action(client, payload["from"], payload["to"], payload["body"])
+        except TwilioRestException as exc:
+            if 400 <= exc.status < 500 and exc.status != 429:
+                raise PermanentError(exc.msg) from exc
+            raise
+
+    return send
+
+
+def email_sender(config, connections=2):
+    """Sender for ``{"sender", "to", "subject", "body", "anonymous"}`` payloads over pooled SMTP."""
+    import smtplib
+
+    from automation import mailer, metrics
+
+    pool = mailer.SmtpPool(config, size=connections)
+
+    def send(payload, key):
+        message = mailer.build_message(payload["sender"], payload["to"], payload["subject"], payload["body"],
+                                       payload.get("anonymous", False))
+        message["Message-ID"] = f"<{key}@automation-suite>"
+        try:
+            with metrics.timer("operation", op="smtp_send"), pool.connection() as server:
+                server.send_message(message)
+        except (smtplib.SMTPException, OSError) as exc:
+            if not mailer.is_transient(exc):
+                raise PermanentError(str(exc)) from exc
+            raise
+        return message["Message-ID"]
+
+    return send
+
+
+_outbox = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox():
+    """The process-wide outbox, started on first use.
+
+    Stored at ``$AUTOMATION_OUTBOX`` or ``~/.automation_suite/outbox.sqlite3``.
+    """
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = Outbox(os.environ.get("AUTOMATION_OUTBOX", DEFAULT_PATH))
+        return _outbox.start()
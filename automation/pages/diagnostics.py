@@ -0,0 +1,108 @@
+import streamlit as st
+
+from automation import metrics, profiling
+
+FAMILIES = {
+    "script_run": "Script runs",
+    "page_render": "Page renders",
+    "operation": "Tool operations",
+}
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def show_latency_tables(rows):
+    for family, title in FAMILIES.items():
+        members = [row for row in rows if row["name"] == family]
+        if not members:
+            continue
+        st.markdown(f"**{title}**")
+        label = {"page_render": "page", "operation": "op"}.get(family)
+        st.dataframe(
+            {
+                **({label.title(): [row.get(label, "") for row in members]} if label else {}),
+                "Count": [row["count"] for row in members],
+                "Errors": [row["errors"] for row in members],
+                "Error rate": [f"{row['error_rate']:.1%}" for row in members],
+                "Mean (ms)": [_ms(row["mean"]) for row in members],
+                "p50 (ms)": [_ms(row["p50"]) for row in members],
+                "p95 (ms)": [_ms(row["p95"]) for row in members],
+                "p99 (ms)": [_ms(row["p99"]) for row in members],
+            },
+            use_container_width=True,
+            hide_index=True,
+        )
+
+
+def show_exporter():
+    st.subheader("📤 Prometheus Exporter")
+    address = metrics.exporter()
+    if address:
+        host, port = address
+        st.success(f"Serving `http://{host}:{port}/metrics`")
+    else:
+        col1, col2 = st.columns([1, 2])
+        port = col1.number_input("Port", 1024, 65535, metrics.DEFAULT_PORT)
+        col2.caption(f"Set `{metrics.PORT_ENV}` to start the exporter with the server.")
+        if col2.button("▶ Start exporter"):
+            try:
+                metrics.serve(int(port))
+                st.rerun()
+            except OSError as e:
+                st.error(f"Could not listen on port {port}: {e}")
+    with st.expander("Exposition preview"):
+        st.code(metrics.get_metrics().prometheus(), language="text")
+
+
+def show_profiler():
+    st.subheader("🔥 Slow-Run Profiler")
+    profiler = profiling.get_profiler()
+    st.caption(
+        "Samples the script thread while the app runs and keeps the stacks of runs slower than the "
+        "threshold, as folded stacks for flamegraph.pl or speedscope."
+    )
+    col1, col2 = st.columns(2)
+    enabled = col1.toggle("Profile slow runs", value=profiler.enabled)
+    threshold = col2.number_input("Threshold (s)", 0.05, 60.0, float(profiler.threshold), step=0.05)
+    if enabled:
+        profiler.enable(threshold)
+    else:
+        profiler.disable()
+
+    if not profiler.dumps:
+        st.info(f"No slow runs recorded yet. Dumps are written to `{profiler.out_dir}`.")
+        return
+    for number, dump in enumerate(reversed(profiler.dumps)):
+        col1, col2 = st.columns([4, 1])
+        col1.markdown(f"`{dump.path.name}` · {dump.seconds:.2f}s · {dump.samples} samples")
+        try:
+            data = dump.path.read_bytes()
+        except OSError:
+            col2.caption("deleted")
+            continue
+        col2.download_button("📥", data=data, file_name=dump.path.name, mime="text/plain", key=f"dump_{number}")
+
+
+def show_diagnostics_page():
+    st.header("📈 Diagnostics")
+    st.write("Latency, counts and error rates of the dashboard and its tools, recorded in this server process.")
+
+    registry = metrics.get_metrics()
+    col1, col2 = st.columns([3, 1])
+    live = col1.toggle("Live updates", value=False)
+    if col2.button("🗑️ Reset"):
+        registry.reset()
+
+    @st.fragment(run_every=2.0 if live else None)
+    def tables():
+        rows = registry.summary()
+        if not rows:
+            st.info("Nothing recorded yet: open a tool and use it.")
+            return
+        show_latency_tables(rows)
+
+    tables()
+    show_exporter()
+    show_profiler()
@@ -0,0 +1,117 @@
+import streamlit as st
+
+from automation import mailer
+from automation.pages import jobs_panel, outbox_panel
+
+
+def bulk_job(job, config, sender, rows, subject, message, anonymous, connections):
+    """Background job: send one rendered message per row."""
+
+    def on_progress(done, total, report):
+        job.report(done / total, f"{done}/{total} · {report.failed} failed · {report.rate:.1f} msg/s")
+
+    return mailer.send_bulk(config, sender, rows, subject, message, anonymous=anonymous,
+                            connections=connections, on_progress=on_progress)
+
+
+def show_bulk_result(job):
+    report = job.result
+    st.success(
+        f"Sent {report.sent}/{len(report.results)} emails in {report.elapsed:.1f}s "
+        f"({report.rate:.1f} msg/s over {report.connections_opened} connections)."
+    )
+    failed = [r for r in report.results if not r.ok]
+    if failed:
+        with st.expander(f"⚠️ {len(failed)} emails failed"):
+            st.table({"Recipient": [r.to for r in failed], "Error": [r.error for r in failed]})
+
+
+def smtp_settings(key):
+    with st.expander("⚙️ SMTP Server"):
+        col1, col2, col3 = st.columns([3, 1, 1])
+        host = col1.text_input("Host", value=mailer.GMAIL_HOST, key=f"{key}_host")
+        port = col2.number_input("Port", value=mailer.GMAIL_PORT, min_value=1, max_value=65535, key=f"{key}_port")
+        starttls = col3.checkbox("STARTTLS", value=True, key=f"{key}_tls")
+    return host, int(port), starttls
+
+
+def show_email_sender_page():
+    st.header("📧 Email Sender")
+    st.write("Send email using Python with Gmail SMTP")
+
+    with st.expander("ℹ How to get Gmail App Password"):
+        st.markdown("""
+        1. Go to your Google Account settings
+        2. Enable 2-Factor Authentication
+        3. Go to Security → App passwords
+        4. Generate an app password for this application
+        5. Use the generated 16-character password below
+        """)
+
+    single_tab, bulk_tab = st.tabs(["Single Email", "Bulk Email"])
+
+    with single_tab:
+        host, port, starttls = smtp_settings("single")
+
+        with st.form("email_form"):
+            col1, col2 = st.columns(2)
+            with col1:
+                sender = st.text_input("Sender Email (Gmail)", placeholder="your-email@gmail.com")
+                receiver = st.text_input("Receiver Email", placeholder="recipient@example.com")
+            with col2:
+                app_password = st.text_input("Gmail App Password", type="password")
+                subject = st.text_input("Subject", placeholder="Email subject")
+
+            message = st.text_area("Message", placeholder="Type your email message here...")
+            anonymous_mode = st.checkbox("Send anonymously")
+
+            submitted = st.form_submit_button("📤 Send Email")
+
+            if submitted:
+                if not sender or not app_password or not receiver or not message:
+                    st.error("All fields are required!")
+                else:
+                    config = mailer.SmtpConfig(sender, app_password, host, port, starttls)
+                    st.session_state.email_route = outbox_panel.email_route(config)
+                    outbox_panel.enqueue(st.session_state.email_route, {
+                        "sender": sender, "to": receiver, "subject": subject, "body": message,
+                        "anonymous": anonymous_mode,
+                    })
+
+        if "email_route" in st.session_state:
+            outbox_panel.show_outbox_status(st.session_state.email_route)
+
+    with bulk_tab:
+        st.markdown(
+            "Upload a CSV with an `email` column (or put addresses in the first column). "
+            "Every column can be used in the subject and message as `$column`, e.g. `Hello $name`."
+        )
+        host, port, starttls = smtp_settings("bulk")
+
+        with st.form("bulk_email_form"):
+            col1, col2 = st.columns(2)
+            with col1:
+                sender = st.text_input("Sender Email (Gmail)", placeholder="your-email@gmail.com")
+                subject = st.text_input("Subject template", placeholder="Hello $name")
+            with col2:
+                app_password = st.text_input("Gmail App Password", type="password")
+                connections = st.slider("SMTP connections", 1, 8, 3)
+
+            message = st.text_area("Message template", placeholder="Hi $name, ...")
+            recipients_file = st.file_uploader("Recipients CSV", type=["csv"])
+            anonymous_mode = st.checkbox("Send anonymously")
+
+            submitted = st.form_submit_button("📤 Send Bulk Email")
+
+        if submitted:
+            rows = mailer.read_recipients(recipients_file.getvalue()) if recipients_file else []
+            if not sender or not app_password or not message:
+                st.error("Sender, password and message are required!")
+            elif not rows:
+                st.error("Please upload a CSV with at least one recipient.")
+            else:
+                config = mailer.SmtpConfig(sender, app_password, host, port, starttls)
+                jobs_panel.submit("bulk_email", f"{len(rows)} emails from {sender}", bulk_job, config, sender,
+                                  rows, subject, message, anonymous_mode, connections)
+
+        jobs_panel.show_jobs("bulk_email", show_bulk_result)
@@ -0,0 +1,193 @@
+import os
+import tempfile
+import zipfile
+
+import streamlit as st
+
+from automation import jobs
+from automation.pages import jobs_panel
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def swap_cached(src_data, dst_data):
+    from automation import faceswap
+
+    return faceswap.swap_bytes(src_data, dst_data)
+
+
+def batch_job(job, src_data, targets, output_dir, workers):
+    """Background job: swap the source face onto every target.
+
+    Returns ``(zip_path, total, failed)``. The ZIP is the job's output file, so
+    the job table holds only its path; it is None when results were written
+    to ``output_dir``.
+    """
+    from automation import faceswap
+
+    failed = []
+    path = job.output_file(".zip")
+    try:
+        with open(path, "wb") as fh, zipfile.ZipFile(fh, "w", compression=zipfile.ZIP_STORED) as zf:
+            for name, data, error in faceswap.swap_many(
+                src_data, targets, output_dir=output_dir, workers=workers,
+                on_progress=lambda done, total: job.report(done / total, f"{done}/{total} images"),
+            ):
+                if error:
+                    failed.append((name, error))
+                elif data is not None:
+                    zf.writestr(name, data)
+    except BaseException:
+        os.unlink(path)
+        raise
+    if output_dir:
+        os.unlink(path)
+        path = None
+    return path, len(targets), failed
+
+
+def show_batch_result(job):
+    path, total, failed = job.result
+    st.success(f"Swapped {total - len(failed)}/{total} images.")
+    if path is None:
+        st.write("Results written to the output folder.")
+    else:
+        try:
+            with open(path, "rb") as archive:
+                st.download_button("📥 Download ZIP", data=archive, file_name="face_swaps.zip",
+                                   mime="application/zip", key=f"zip_{job.id}")
+        except FileNotFoundError:
+            st.warning("The archive has been removed; run the batch again.")
+    if failed:
+        st.table({"Image": [n for n, _ in failed], "Error": [e for _, e in failed]})
+
+
+def video_job(job, src_data, video_data, suffix, swap_workers, confidence):
+    """Background job: swap the source face into every frame; returns ``(video_path, report)``.
+
+    The output video is the job's output file, so the job table holds only
+    its path.
+    """
+    from automation import faceswap_video
+
+    def on_progress(report):
+        job.report(min(1.0, report.frames / report.total_frames) if report.total_frames else None,
+                   f"{report.frames}/{report.total_frames} frames · {report.fps:.1f} fps")
+
+    output_path = job.output_file(".mp4")
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            input_path = os.path.join(workdir, "input" + suffix)
+            with open(input_path, "wb") as fh:
+                fh.write(video_data)
+            report = faceswap_video.swap_video(src_data, input_path, output_path, swap_workers=swap_workers,
+                                               min_confidence=confidence, on_progress=on_progress)
+    except BaseException:
+        os.unlink(output_path)
+        raise
+    return output_path, report
+
+
+def show_video_result(job):
+    path, report = job.result
+    st.success(
+        f"Processed {report.frames} frames in {report.elapsed:.1f}s ({report.fps:.1f} fps). "
+        f"Bottleneck: **{report.bottleneck.name}**."
+    )
+    st.table({
+        "Stage": [s.name for s in report.stages.values()],
+        "Workers": [s.workers for s in report.stages.values()],
+        "Mean latency (ms)": [round(s.mean_ms, 2) for s in report.stages.values()],
+        "Utilization": [f"{s.utilization(report.elapsed):.0%}" for s in report.stages.values()],
+    })
+    if report.frames_without_face:
+        st.caption(f"{report.frames_without_face} frames had no detectable face and were left unchanged.")
+    if not os.path.exists(path):
+        st.warning("The video has been removed; run the swap again.")
+        return
+    st.video(path)
+    with open(path, "rb") as video:
+        st.download_button("📥 Download Video", data=video, file_name="face_swap.mp4", mime="video/mp4",
+                           key=f"video_{job.id}")
+
+
+def show_face_swap_page():
+    st.header("🔄 Face Swap App")
+    st.write("Swap faces in two images using AI")
+
+    st.info("📋 Required libraries: opencv-python, mediapipe, numpy")
+    st.code("pip install opencv-python mediapipe numpy")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("First Face Image")
+        face1 = st.file_uploader("Upload first face image", type=["jpg", "jpeg", "png"], key="face1")
+    with col2:
+        st.subheader("Second Face Image")
+        face2 = st.file_uploader("Upload second face image", type=["jpg", "jpeg", "png"], key="face2")
+
+    try:
+        import cv2
+
+        from automation import faceswap
+    except ImportError:
+        st.info("Install required libraries to enable face swap functionality.")
+        return
+
+    if face1 and face2:
+        try:
+            with st.spinner("Swapping faces..."):
+                result = swap_cached(face1.getvalue(), face2.getvalue())
+        except (ValueError, cv2.error) as e:  # no face found, or an unreadable or corrupt upload
+            st.error(f"Face swap failed: {e}")
+        else:
+            st.image(result, caption="First face on second image")
+            st.download_button("📥 Download Result", data=result, file_name="face_swap.png", mime="image/png")
+
+    with st.expander("📦 Batch Mode: swap the first face onto many images"):
+        source = st.radio("Target images", ["Upload files", "Server folder"], horizontal=True)
+        if source == "Upload files":
+            uploads = st.file_uploader(
+                "Target images", type=["jpg", "jpeg", "png"], accept_multiple_files=True, key="face_targets",
+            )
+            targets = [(f.name, f.getvalue()) for f in uploads or []]
+            output_dir = None
+        else:
+            input_dir = st.text_input("Input folder")
+            output_dir = st.text_input("Output folder", value="face_swap_output")
+            targets = faceswap.folder_targets(input_dir) if input_dir and os.path.isdir(input_dir) else []
+        # The swap pools count against the job manager's process workers, so they
+        # cannot add up to more processes than it allows across all sessions.
+        cpus = jobs.get_jobs().process_limit
+        # A number input rather than a slider: a slider needs min < max, which fails on one core.
+        workers = st.number_input("Worker processes", min_value=1, max_value=cpus, value=cpus)
+
+        if st.button("🔄 Run Batch Swap"):
+            if not face1:
+                st.error("Upload the first face image to use as the source.")
+            elif not targets:
+                st.error("No target images found.")
+            else:
+                jobs_panel.submit("face_batch", f"Swap onto {len(targets)} images", batch_job,
+                                  face1.getvalue(), targets, output_dir or None, workers, processes=workers)
+        jobs_panel.show_jobs("face_batch", show_batch_result)
+
+    with st.expander("🎬 Video Mode: swap the first face into a video"):
+        video = st.file_uploader("Video file", type=["mp4", "mov", "avi", "mkv"], key="face_video")
+        col1, col2 = st.columns(2)
+        with col1:
+            video_workers = st.number_input("Swap processes", min_value=1, max_value=cpus, value=min(2, cpus))
+        with col2:
+            confidence = st.slider(
+                "Re-detect below tracking confidence", 0.1, 0.9, 0.5,
+                help="Landmarks are tracked between frames; the face detector only runs again when the "
+                     "tracking score drops below this value.",
+            )
+
+        if st.button("🎬 Swap Video"):
+            if not face1 or not video:
+                st.error("Upload the first face image and a video.")
+            else:
+                jobs_panel.submit("face_video", f"Swap into {video.name}", video_job, face1.getvalue(),
+                                  video.getvalue(), os.path.splitext(video.name)[1] or ".mp4", video_workers,
+                                  confidence, processes=video_workers)
+        jobs_panel.show_jobs("face_video", show_video_result)
@@ -0,0 +1,86 @@
+import streamlit as st
+
+from automation import search
+
+
+@st.cache_resource
+def get_search_service():
+    # One cache and rate limiter per server process, shared by every session.
+    return search.SearchService()
+
+
+def show_results(results):
+    for i, result in enumerate(results, start=1):
+        st.markdown(f"**{i}. [{result.title or result.url}]({result.url})**")
+        if result.description:
+            st.caption(result.description)
+
+
+def show_google_search_page():
+    st.header("🔍 Google Search")
+    st.markdown("Enter a query below to search Google and get the top results.")
+
+    st.info("📋 Required library: googlesearch-python")
+    st.code("pip install googlesearch-python")
+
+    service = get_search_service()
+    single_tab, batch_tab = st.tabs(["Single Search", "Batch Search"])
+
+    with single_tab:
+        with st.form("search_form"):
+            query = st.text_input("Search Query", placeholder="e.g., Best places to visit in Rajasthan")
+            num_results = st.slider("Number of results", min_value=5, max_value=25, value=10)
+            submitted = st.form_submit_button("Search")
+
+        if submitted:
+            if not query:
+                st.warning("Please enter a search query to begin.")
+            else:
+                try:
+                    results = service.search(query, num_results)
+                except ImportError:
+                    st.info("Feature requires googlesearch-python library. Install dependencies first.")
+                except Exception as e:
+                    st.error(f"Search failed: {e}")
+                else:
+                    show_results(results)
+
+    with batch_tab:
+        with st.form("batch_search_form"):
+            pasted = st.text_area("Queries (one per line)", height=150)
+            uploaded = st.file_uploader("...or upload a .txt/.csv of queries", type=["txt", "csv"])
+            col1, col2 = st.columns(2)
+            with col1:
+                batch_results = st.slider("Results per query", min_value=5, max_value=25, value=10)
+            with col2:
+                workers = st.slider("Concurrent queries", min_value=1, max_value=16, value=4)
+            batch_submitted = st.form_submit_button("Run Batch")
+
+        if batch_submitted:
+            queries = search.read_queries(pasted, uploaded)
+            if not queries:
+                st.warning("Please enter or upload at least one query.")
+            else:
+                with st.spinner(f"Running {len(queries)} queries..."):
+                    per_query, merged, errors = service.batch(queries, batch_results, max_workers=workers)
+                st.success(f"{len(per_query)} unique queries · {len(merged)} unique results")
+                for query, error in errors.items():
+                    st.error(f"{query}: {error}")
+                st.dataframe(
+                    {
+                        "URL": [m.url for m in merged],
+                        "Title": [m.title for m in merged],
+                        "Matched queries": [len(m.queries) for m in merged],
+                        "Best rank": [m.best_rank for m in merged],
+                    },
+                    use_container_width=True,
+                )
+                for query, results in per_query.items():
+                    with st.expander(f"{query} ({len(results)})"):
+                        show_results(results)
+
+    cache = service.cache
+    st.caption(
+        f"Cache: {len(cache)}/{cache.maxsize} entries · {cache.hits} hits · {cache.misses} misses · "
+        f"TTL {cache.ttl / 60:.0f} min · backend: {service.backend.name}"
+    )
@@ -0,0 +1,75 @@
+import streamlit as st
+
+from automation import jobs
+from automation.pages import jobs_panel
+
+
+def show_batch_result(job):
+    written, path = job.result
+    st.success(f"Generated {written} images.")
+    try:
+        with open(path, "rb") as archive:
+            st.download_button(
+                "📥 Download ZIP", data=archive, file_name="images.zip", mime="application/zip", key=f"zip_{job.id}",
+            )
+    except FileNotFoundError:
+        st.warning("The archive has been removed; generate the batch again.")
+
+
+def show_image_generator_page():
+    st.header("🎨 Image Generator")
+    st.write("Draw simple shapes and generate an image!")
+
+    st.info("📋 Required library: Pillow")
+    st.code("pip install Pillow")
+
+    try:
+        from automation import imaging
+    except ImportError:
+        st.info("Install Pillow library to enable image generation functionality.")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        width = st.slider("Image width", 100, imaging.MAX_SIDE, 400)
+        height = st.slider("Image height", 100, imaging.MAX_SIDE, 400)
+        size = st.slider("Shape size", 0.1, 1.0, 0.6)
+    with col2:
+        bg_color = st.color_picker("Background color", "#FFFFFF")
+        shape_color = st.color_picker("Shape color", "#FF4B4B")
+        thickness = st.slider("Line thickness", 1, 40, 8)
+
+    shape = st.selectbox("Shape to draw", list(imaging.SHAPES))
+
+    spec = imaging.ImageSpec(width, height, bg_color.upper(), shape, shape_color.upper(), size, thickness)
+    png = imaging.render_png(spec)
+    st.image(png, caption=f"{shape} · {width}×{height}")
+    st.download_button("📥 Download PNG", data=png, file_name=spec.filename, mime="image/png")
+
+    st.subheader("📦 Batch Generation")
+    mode = st.radio("Parameters", ["Random", "CSV"], horizontal=True)
+    if mode == "Random":
+        col1, col2 = st.columns(2)
+        count = col1.number_input("Number of images", 1, 5000, 100)
+        seed = col2.number_input("Random seed", 0, 2 ** 31 - 1, 0)
+        specs = list(imaging.random_specs(int(count), width, height, int(seed)))
+    else:
+        st.caption("Columns: " + ", ".join(f"`{name}`" for name in imaging.ImageSpec.__dataclass_fields__))
+        uploaded = st.file_uploader("Image parameters CSV", type=["csv"])
+        try:
+            specs = imaging.read_specs(uploaded.getvalue()) if uploaded else []
+        except (ValueError, TypeError) as e:
+            st.error(f"Invalid CSV: {e}")
+            specs = []
+    workers = st.slider("Parallel renderers", 1, 16, 4)
+
+    if st.button("🎨 Generate Batch"):
+        if not specs:
+            st.warning("No images to generate.")
+        else:
+            # Rendering is CPU-bound, so it runs in a worker process rather than
+            # competing with the app server for the GIL.
+            jobs_panel.submit("images", f"{len(specs)} images", imaging.zip_job, specs, workers,
+                              backend=jobs.PROCESS)
+
+    jobs_panel.show_jobs("images", show_batch_result)
@@ -0,0 +1,51 @@
+"""Background job helpers shared by the long-running tool pages."""
+
+import uuid
+
+import streamlit as st
+
+from automation import jobs
+
+
+def owner():
+    """This browser session, as the owner of its jobs."""
+    return st.session_state.setdefault("jobs_owner", uuid.uuid4().hex)
+
+
+def submit(kind, name, fn, *args, backend=jobs.THREAD, **kwargs):
+    job = jobs.get_jobs().submit(kind, name, fn, *args, owner=owner(), backend=backend, **kwargs)
+    if job.status == jobs.QUEUED:
+        st.info(f"Queued **{name}**: it starts when enough workers are free.")
+    return job
+
+
+def show_jobs(kind, render_result, limit=5):
+    """This session's ``kind`` jobs with progress, a cancel button, and ``render_result(job)`` once done.
+
+    The table is a fragment that polls once a second while a job is active,
+    so progress updates do not rerun the page.
+    """
+    manager = jobs.get_jobs()
+    if not manager.jobs(owner(), kind):
+        return
+    active = any(job.active for job in manager.jobs(owner(), kind))
+
+    @st.fragment(run_every=1.0 if active else None)
+    def table():
+        st.subheader("⏳ Jobs")
+        for job in manager.jobs(owner(), kind)[:limit]:
+            with st.container(border=True):
+                col1, col2 = st.columns([5, 1])
+                col1.markdown(f"**{job.name}** · {job.status} · {job.elapsed:.1f}s")
+                if job.active:
+                    col1.progress(job.progress, text=job.message or None)
+                    col2.button("✖ Cancel", key=f"cancel_{job.id}", on_click=manager.cancel, args=(job.id,),
+                                disabled=job.cancel_requested)
+                elif job.status == jobs.DONE:
+                    render_result(job)
+                elif job.status == jobs.FAILED:
+                    st.error(job.error)
+        if active and not any(job.active for job in manager.jobs(owner(), kind)):
+            st.rerun()  # everything finished: rerun the page so this table stops polling
+
+    table()
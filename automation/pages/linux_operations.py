@@ -0,0 +1,159 @@
+import os
+
+import streamlit as st
+
+from automation import remote
+from automation.pages import jobs_panel
+
+# The local backend runs whatever is typed here as bash on the server itself,
+# so the web UI offers it only when the operator opts in.
+LOCAL_ENV = "AUTOMATION_ALLOW_LOCAL_COMMANDS"
+TAIL_LINES = 3
+
+
+def local_allowed():
+    return os.environ.get(LOCAL_ENV) == "1"
+
+
+def backends():
+    return {"SSH": "ssh", "Local (subprocess)": "local"} if local_allowed() else {"SSH": "ssh"}
+
+
+def make_backend(kind, user, port, identity, connect_timeout):
+    if kind == "local":
+        if not local_allowed():
+            raise PermissionError(f"the local backend is disabled; set {LOCAL_ENV}=1 to enable it")
+        return remote.LocalBackend()
+    return remote.SshBackend(user=user or None, port=port or None, identity=identity or None,
+                             connect_timeout=connect_timeout)
+
+
+def tail(text, lines=TAIL_LINES):
+    return "\n".join(text.rstrip("\n").splitlines()[-lines:])
+
+
+def show_run_summary(job):
+    run = job.result
+    codes = run.exit_codes()
+    counts = run.counts()
+    summary = " · ".join(f"exit {code}: {n}" for code, n in sorted(codes.items(), key=lambda item: str(item[0])))
+    others = " · ".join(f"{status}: {n}" for status, n in counts.items() if status != remote.DONE)
+    st.success(f"{len(run.hosts)} hosts in {run.elapsed:.2f}s — {summary or 'no exit codes'}"
+               + (f" · {others}" if others else ""))
+
+
+def show_live_run(run, job):
+    """Per-host output while ``run`` is going, then its outputs grouped."""
+
+    @st.fragment(run_every=0.5 if job.active else None)
+    def live():
+        if not job.active and run.started is None:
+            st.info("This run was cancelled before it started.")
+            return
+        counts = run.counts()
+        finished = len(run.hosts) - counts[remote.PENDING] - counts[remote.RUNNING]
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Hosts", f"{finished}/{len(run.hosts)}")
+        col2.metric("Exit 0", run.exit_codes()[0])
+        col3.metric("Failed", finished - run.exit_codes()[0])
+        col4.metric("Elapsed", f"{run.elapsed:.1f}s")
+
+        if not run.done:
+            results = run.snapshot()
+            st.dataframe(
+                {
+                    "Host": [r.host for r in results],
+                    "Status": [r.status for r in results],
+                    "Exit": [r.exit_code for r in results],
+                    "Time (s)": [round(r.elapsed, 2) for r in results],
+                    "stdout": [tail(r.text("stdout")) for r in results],
+                    "stderr": [tail(r.text("stderr")) for r in results],
+                },
+                use_container_width=True,
+                hide_index=True,
+            )
+            return
+
+        st.subheader("📋 Output")
+        for number, group in enumerate(run.groups()):
+            label = f"exit {group.exit_code}" if group.status == remote.DONE else group.status
+            with st.expander(f"{len(group.hosts)} hosts · {label}", expanded=number == 0):
+                st.caption(", ".join(group.hosts))
+                if group.stdout:
+                    st.code(group.stdout, language="text")
+                if group.stderr:
+                    st.markdown("**stderr**")
+                    st.code(group.stderr, language="text")
+                if not group.stdout and not group.stderr:
+                    st.caption("(no output)")
+        if any(r.truncated for r in run.results.values()):
+            st.caption(f"Output beyond {remote.MAX_OUTPUT // 1024} KB per host and stream was dropped.")
+
+    live()
+
+
+def show_linux_page():
+    st.header("🐧 Linux Operations")
+    st.write("Run a command or script on many hosts at once")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        choices = backends()
+        kind = choices[st.radio("Run on", list(choices), horizontal=True)] if len(choices) > 1 else "ssh"
+        hosts_text = st.text_area(
+            "Hosts", placeholder="web[01-20].example.com\ndb1.example.com",
+            help="One per line (or comma separated); ranges like `node[1-200]` are expanded. "
+                 "For SSH, hosts can be written as `user@host:port`.",
+        )
+        try:
+            hosts = remote.expand_hosts(hosts_text)
+        except ValueError as e:
+            st.error(str(e))
+            hosts = []
+        st.caption(f"{len(hosts)} hosts" + (" · the local backend runs the command here, once per host name, "
+                                            "with `$TARGET_HOST` set" if kind == "local" else ""))
+    with col2:
+        concurrency = st.slider("Hosts at a time", 1, 256, remote.DEFAULT_CONCURRENCY)
+        timeout = st.number_input("Timeout per host (s, 0 = none)", 0.0, 3600.0, 60.0)
+        user = port = identity = None
+        connect_timeout = 10
+        if kind == "ssh":
+            with st.expander("⚙️ SSH Settings"):
+                user = st.text_input("User")
+                port = st.number_input("Port", 0, 65535, 0, help="0 uses the SSH config or 22.")
+                identity = st.text_input("Identity file")
+                connect_timeout = st.number_input("Connect timeout (s)", 1, 120, 10)
+                st.caption("Connections are kept open for 5 minutes after their last command and reused, "
+                           "so later runs skip the SSH handshake.")
+
+    mode = st.radio("Mode", ["Command", "Script"], horizontal=True)
+    if mode == "Command":
+        command = st.text_input("Command", placeholder="uptime")
+        script = None
+    else:
+        script = st.text_area("Script (bash)", height=200, placeholder="#!/bin/bash\ndf -h /\nfree -m")
+        command = None
+
+    if st.button("▶ Run"):
+        if not hosts:
+            st.error("Enter at least one host.")
+        elif not (command or script):
+            st.error(f"Enter a {mode.lower()} to run.")
+        else:
+            try:
+                backend = make_backend(kind, user, port, identity, connect_timeout)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                run = remote.Run(
+                    hosts, backend, command=command or None, script=script or None, concurrency=concurrency,
+                    timeout=timeout or None,
+                )
+                job = jobs_panel.submit("linux",
+                                        f"{(command or 'script').splitlines()[0][:40]} on {len(hosts)} hosts",
+                                        remote.run_job, run)
+                st.session_state.linux_run = (run, job)
+
+    jobs_panel.show_jobs("linux", show_run_summary)
+    if "linux_run" in st.session_state:
+        show_live_run(*st.session_state.linux_run)
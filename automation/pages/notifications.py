@@ -0,0 +1,100 @@
+import streamlit as st
+
+from automation import notify
+
+COMBINATIONS = {
+    "📱 SMS Only": (notify.SMS,),
+    "📞 Voice Call": (notify.VOICE,),
+    "📱📞 SMS + Voice Call": (notify.SMS, notify.VOICE),
+    "🚀 All Channels": (notify.SMS, notify.VOICE, notify.WHATSAPP),
+    "💬 WhatsApp Only": (notify.WHATSAPP,),
+    "📱💬 SMS + WhatsApp": (notify.SMS, notify.WHATSAPP),
+    "💬📞 WhatsApp + Voice Call": (notify.WHATSAPP, notify.VOICE),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def get_stub_channels(latency, fail_rate):
+    return notify.stub_channels(latency, fail_rate)
+
+
+def show_notifications_page():
+    st.header("🔔 Notification Options")
+
+    message = st.text_area("Alert message", value="Test alert from Automation Suite")
+    to_number = st.text_input("Recipient number (E.164)", placeholder="+15551234567")
+
+    with st.expander("⚙️ Providers"):
+        use_stubs = st.toggle("Use local stub providers", value=True,
+                              help="Simulated channels for testing; nothing is sent.")
+        if use_stubs:
+            col1, col2 = st.columns(2)
+            stub_latency = col1.slider("Stub latency (s)", 0.0, 3.0, 0.3)
+            stub_fail_rate = col2.slider("Stub failure rate", 0.0, 1.0, 0.0)
+        else:
+            st.info("📋 Required library: twilio")
+            account_sid = st.text_input("Twilio SID")
+            auth_token = st.text_input("Auth Token", type="password")
+            from_number = st.text_input("Twilio Phone Number")
+            whatsapp_from = st.text_input("WhatsApp sender (defaults to the phone number)")
+        col1, col2, col3 = st.columns(3)
+        timeout = col1.number_input("Per-channel timeout (s)", 1.0, 120.0, notify.DEFAULT_TIMEOUT)
+        retries = col2.number_input("Retries", 0, 5, notify.DEFAULT_RETRIES)
+        backoff = col3.number_input("Initial backoff (s)", 0.0, 10.0, notify.DEFAULT_BACKOFF)
+
+    col1, col2 = st.columns(2)
+    labels = list(COMBINATIONS)
+    clicked = None
+    with col1:
+        for label in labels[:4]:
+            if st.button(label):
+                clicked = label
+    with col2:
+        for label in labels[4:]:
+            if st.button(label):
+                clicked = label
+
+    if clicked is None:
+        return
+    if not message or not to_number:
+        st.error("Enter an alert message and a recipient number.")
+        return
+
+    if use_stubs:
+        channels = get_stub_channels(stub_latency, stub_fail_rate)
+    else:
+        if not (account_sid and auth_token and from_number):
+            st.error("Enter your Twilio credentials and phone number.")
+            return
+        try:
+            channels = notify.twilio_channels(
+                notify.TwilioConfig(account_sid, auth_token, from_number, whatsapp_from),
+            )
+        except ImportError:
+            st.error("Missing dependency: install twilio to send real notifications.")
+            st.code("pip install twilio")
+            return
+
+    with st.spinner(f"Sending on {', '.join(COMBINATIONS[clicked])}..."):
+        results = notify.dispatch(
+            notify.Alert(message, to_number), [channels[name] for name in COMBINATIONS[clicked]],
+            timeout=timeout, retries=retries, backoff=backoff,
+        )
+
+    sent = sum(r.ok for r in results)
+    slowest = max(r.latency for r in results)
+    summary = f"{sent}/{len(results)} channels delivered in {slowest:.2f}s (slowest channel)."
+    if sent == len(results):
+        st.success(summary)
+    elif sent:
+        st.warning(summary)
+    else:
+        st.error(summary)
+    st.table({
+        "Channel": [r.channel for r in results],
+        "Status": [r.status for r in results],
+        "Latency (s)": [round(r.latency, 3) for r in results],
+        "Attempts": [r.attempts for r in results],
+        "Reference": [r.reference or "" for r in results],
+        "Error": [r.error or "" for r in results],
+    })
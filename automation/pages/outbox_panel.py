@@ -0,0 +1,89 @@
+"""Outbox helpers shared by the SMS, Phone Caller, WhatsApp and Email pages."""
+
+import hashlib
+import json
+import uuid
+from datetime import datetime
+
+import streamlit as st
+
+from automation import outbox
+
+STATUSES = (outbox.PENDING, outbox.SENDING, outbox.SENT, outbox.FAILED)
+
+
+@st.cache_resource(show_spinner=False)
+def _email_sender(config):
+    return outbox.email_sender(config)
+
+
+def _fingerprint(*values):
+    return hashlib.sha256(json.dumps(values, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def twilio_route(kind, account_sid, auth_token, rate=None):
+    """Register the sender for these credentials with the outbox and return its route.
+
+    The route includes a hash of the token, so a session with other credentials for
+    the same account gets its own sender instead of replacing the one queued
+    messages will be sent with.
+    """
+    route = f"{kind}:{account_sid}:{_fingerprint(auth_token)}"
+    outbox.get_outbox().register(route, outbox.twilio_sender(kind, account_sid, auth_token), rate)
+    return route
+
+
+def email_route(config):
+    route = f"email:{config.username}@{config.host}:{config.port}:{_fingerprint(config.password)}"
+    outbox.get_outbox().register(route, _email_sender(config))
+    return route
+
+
+def enqueue(route, payload):
+    """Queue ``payload`` and report it.
+
+    Every submit gets its own key, except that submitting the same content as
+    the last submit while that one is still queued or sending (a double click)
+    is a no-op. Once it has gone out or failed, identical content is sent again.
+    """
+    box = outbox.get_outbox()
+    content = _fingerprint(route, payload)
+    last_content, last_key = st.session_state.get("outbox_last", (None, None))
+    if content == last_content:
+        entry = box.get(last_key)
+        if entry is not None and entry.status in (outbox.PENDING, outbox.SENDING):
+            st.info(f"This message is already in the outbox ({entry.status}).")
+            return last_key
+    key, _ = box.enqueue(route, payload, uuid.uuid4().hex)
+    st.session_state.outbox_last = (content, key)
+    st.success(f"Queued for delivery to {payload['to']}.")
+    return key
+
+
+def show_outbox_status(route):
+    box = outbox.get_outbox()
+    counts = box.counts(route)
+    if not counts:
+        return
+    in_flight = counts.get(outbox.PENDING, 0) + counts.get(outbox.SENDING, 0)
+
+    @st.fragment(run_every=2.0 if in_flight else None)
+    def status():
+        counts = box.counts(route)
+        st.subheader("📬 Outbox")
+        st.caption(" · ".join(f"{counts.get(s, 0)} {s}" for s in STATUSES))
+        entries = box.recent(route, limit=10)
+        st.dataframe(
+            {
+                "Queued": [datetime.fromtimestamp(e.created_at).strftime("%H:%M:%S") for e in entries],
+                "To": [e.payload.get("to", "") for e in entries],
+                "Status": [e.status for e in entries],
+                "Attempts": [e.attempts for e in entries],
+                "Reference": [e.reference or "" for e in entries],
+                "Error": [e.error or "" for e in entries],
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
+
+    status()
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from automation import campaigns
+from automation.pages import outbox_panel
+
+
+def show_call_campaign_progress(campaign):
+    @st.fragment(run_every=None if campaign.finished.is_set() else 1.0)
+    def live():
+        counts = campaign.counts()
+        total = len(campaign.records)
+        waiting = counts.get("waiting", 0)
+        st.progress((total - waiting - campaign.in_flight) / total)
+        st.caption(
+            f"{campaign.in_flight}/{campaign.max_in_flight} calls in flight · {waiting} waiting · "
+            + " · ".join(f"{n} {status}" for status, n in sorted(counts.items()) if status != "waiting")
+        )
+        if campaign.finished.is_set():
+            st.success("Campaign finished.")
+        elif st.button("⏹ Cancel remaining calls"):
+            campaign.cancel()
+
+    live()
+
+
+def show_phone_caller_page():
+    st.header("📞 Phone Caller")
+    st.write("Make phone calls using Twilio")
+
+    st.info("📋 Required library: twilio")
+    st.code("pip install twilio")
+
+    account_sid = st.text_input("Twilio Account SID")
+    auth_token = st.text_input("Twilio Auth Token", type="password")
+    from_number = st.text_input("Your Twilio Phone Number")
+
+    route = None
+    if account_sid and auth_token:
+        try:
+            route = outbox_panel.twilio_route("call", account_sid, auth_token)
+        except ImportError:
+            st.error("Missing dependency: install twilio to place calls.")
+
+    single_tab, campaign_tab = st.tabs(["Single Call", "Campaign"])
+
+    with single_tab:
+        to_number = st.text_input("Recipient's Phone Number")
+        message = st.text_area("Message to Speak")
+
+        if st.button("📞 Call Now"):
+            if route is None or not from_number or not to_number or not message:
+                st.error("All fields are required!")
+            else:
+                outbox_panel.enqueue(route, {"from": from_number, "to": to_number, "body": message})
+
+        if route is not None:
+            outbox_panel.show_outbox_status(route)
+
+    with campaign_tab:
+        st.markdown(
+            "Upload a CSV with a `phone` column, or list numbers one per line. "
+            "The message can use CSV columns as `$column`, e.g. `Hello $name`."
+        )
+        recipients_file = st.file_uploader("Recipients CSV", type=["csv"], key="call_campaign_csv")
+        numbers = st.text_area("Or numbers, one per line")
+        col1, col2 = st.columns(2)
+        default_country = col1.text_input("Default country code", value="+91", key="call_country")
+        max_in_flight = col2.slider("Concurrent calls", 1, 50, 5)
+        template = st.text_area("Message to speak", key="call_template")
+
+        now = datetime.now()
+        col1, col2, col3 = st.columns(3)
+        day = col1.date_input("Call on", value=now.date())
+        start_time = col2.time_input("From", value=now.time().replace(second=0, microsecond=0))
+        end_time = col3.time_input("Until", value=(now + timedelta(hours=2)).time().replace(second=0, microsecond=0))
+
+        with st.expander("⚙️ Status callbacks"):
+            st.markdown(
+                "New calls start when Twilio reports a call finished. Twilio must reach this server: "
+                "enter its public URL (e.g. an ngrok tunnel to the port below). Without one, the "
+                "limit only applies to placing calls, not to how long they last."
+            )
+            public_url = st.text_input("Public URL", placeholder="https://example.ngrok.app")
+            port = st.number_input("Local callback port", 1024, 65535, 8099)
+
+        if st.button("🚀 Start Call Campaign"):
+            rows = campaigns.read_rows(recipients_file.getvalue()) if recipients_file else [
+                {"phone": line} for line in numbers.splitlines() if line.strip()
+            ]
+            campaign = campaigns.prepare(rows, template, route or "", from_number,
+                                         default_country=default_country, kind="call")
+            start_at = datetime.combine(day, start_time)
+            end_at = datetime.combine(day, end_time)
+            if end_at <= start_at:
+                end_at += timedelta(days=1)  # window runs past midnight
+
+            if route is None or not from_number:
+                st.error("Enter your Twilio credentials and phone number.")
+            elif not campaign.messages or not template:
+                st.error("Add at least one valid number and a message.")
+            else:
+                from automation import call_campaign
+
+                scheduler = call_campaign.CallCampaign(
+                    call_campaign.twilio_placer(account_sid, auth_token, from_number), campaign.messages,
+                    max_in_flight=max_in_flight, start_at=start_at.timestamp(), end_at=end_at.timestamp(),
+                )
+                if public_url:
+                    try:
+                        call_campaign.get_callback_server(int(port)).attach(scheduler, public_url, auth_token)
+                    except OSError as e:
+                        st.error(f"Could not listen for callbacks on port {port}: {e}")
+                        return
+                st.session_state.call_campaign = scheduler.start()
+                st.info(
+                    f"Calling {len(campaign.messages)} numbers between {start_at:%H:%M} and {end_at:%H:%M} "
+                    f"({campaign.duplicates} duplicates and {len(campaign.invalid)} invalid numbers skipped)."
+                )
+
+        if "call_campaign" in st.session_state:
+            show_call_campaign_progress(st.session_state.call_campaign)
@@ -0,0 +1,330 @@
+import functools
+
+import streamlit as st
+
+OUTPUT_FORMATS = {"JPEG": "image/jpeg", "WebP": "image/webp", "PNG (lossless)": "image/png"}
+MAX_SIDES = [640, 1280, 1920, 0]  # 0 keeps the camera resolution
+
+# Runs in a Worker: scales the frame and encodes it off the main thread.
+ENCODER_WORKER = """
+self.onmessage = async (event) => {
+  const { id, bitmap, width, height, type, quality } = event.data;
+  const canvas = new OffscreenCanvas(width, height);
+  canvas.getContext("2d").drawImage(bitmap, 0, 0, width, height);
+  bitmap.close();
+  const blob = await canvas.convertToBlob({ type, quality });
+  self.postMessage({ id, blob, width, height });
+};
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def build_html(public_key, service_id, template_id, recipient_email, mime, quality, max_side):
+    """The standalone capture page for one configuration, built once per process."""
+    format_options = "".join(
+        f'<option value="{value}"{" selected" if value == mime else ""}>{name}</option>'
+        for name, value in OUTPUT_FORMATS.items()
+    )
+    side_options = "".join(
+        f'<option value="{side}"{" selected" if side == max_side else ""}>{f"{side}px" if side else "Original"}</option>'
+        for side in MAX_SIDES
+    )
+
+    # Generate the HTML with user's configuration
+    html_code = f"""
+    <html>
+    <head>
+      <title>Click Photo & Send via Email</title>
+      <script src="https://cdn.emailjs.com/dist/email.min.js"></script>
+      <style>
+        body {{
+            font-family: Arial, sans-serif;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+        }}
+        .container {{
+            background: rgba(255, 255, 255, 0.1);
+            padding: 30px;
+            border-radius: 15px;
+            backdrop-filter: blur(10px);
+            box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
+        }}
+        video, img {{
+            border-radius: 10px;
+            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
+        }}
+        button {{
+            background: linear-gradient(45deg, #FF6B6B, #4ECDC4);
+            color: white;
+            border: none;
+            padding: 12px 24px;
+            border-radius: 25px;
+            cursor: pointer;
+            font-size: 16px;
+            margin: 10px;
+            transition: transform 0.2s;
+        }}
+        button:hover {{
+            transform: translateY(-2px);
+        }}
+        input {{
+            padding: 12px;
+            border-radius: 10px;
+            border: none;
+            margin: 10px;
+            font-size: 16px;
+            width: 300px;
+        }}
+        h2 {{
+            text-align: center;
+            margin-bottom: 30px;
+        }}
+        select {{
+            padding: 8px;
+            border-radius: 10px;
+            border: none;
+            margin: 5px;
+        }}
+      </style>
+      <script id="encoder-worker" type="text/js-worker">{ENCODER_WORKER}</script>
+      <script>
+        window.onload = () => {{
+          emailjs.init("{public_key or 'YOUR_PUBLIC_KEY'}");
+        }};
+
+        function startCamera() {{
+          navigator.mediaDevices.getUserMedia({{ video: true }})
+            .then(stream => {{
+              document.getElementById("video").srcObject = stream;
+            }})
+            .catch(err => {{
+              alert("Camera access denied or not available: " + err.message);
+            }});
+        }}
+
+        let encoder = null;  // Worker, or false when this browser has no OffscreenCanvas
+        let captureId = 0;
+        let photoBlob = null;
+        let payloadBytes = 0;
+        let baselineBytes = 0;  // the full frame as raw RGB, estimated rather than encoded
+
+        function getEncoder() {{
+          if (encoder === null) {{
+            try {{
+              if (typeof OffscreenCanvas === "undefined") throw new Error("OffscreenCanvas unavailable");
+              const source = document.getElementById("encoder-worker").textContent;
+              encoder = new Worker(URL.createObjectURL(new Blob([source], {{ type: "text/javascript" }})));
+              encoder.onmessage = (event) => onEncoded(event.data);
+            }} catch (err) {{
+              encoder = false;
+            }}
+          }}
+          return encoder;
+        }}
+
+        function outputSettings() {{
+          return {{
+            type: document.getElementById("format").value,
+            quality: parseFloat(document.getElementById("quality").value),
+            maxSide: parseInt(document.getElementById("maxSide").value, 10),
+          }};
+        }}
+
+        function formatBytes(bytes) {{
+          if (bytes < 1024) return bytes + " B";
+          if (bytes < 1024 * 1024) return (bytes / 1024).toFixed(1) + " KB";
+          return (bytes / 1024 / 1024).toFixed(2) + " MB";
+        }}
+
+        // Length of the base64 data URL EmailJS receives for a blob of this size
+        function dataUrlBytes(size, type) {{
+          return ("data:" + type + ";base64,").length + 4 * Math.ceil(size / 3);
+        }}
+
+        async function capturePhoto() {{
+          const video = document.getElementById("video");
+          if (!video.videoWidth) {{
+            alert("The camera is not ready yet");
+            return;
+          }}
+          const settings = outputSettings();
+          const scale = settings.maxSide ? Math.min(1, settings.maxSide / Math.max(video.videoWidth, video.videoHeight)) : 1;
+          const width = Math.round(video.videoWidth * scale);
+          const height = Math.round(video.videoHeight * scale);
+          const id = ++captureId;
+          baselineBytes = video.videoWidth * video.videoHeight * 3;
+          document.getElementById("sizeInfo").textContent = "Compressing...";
+
+          const worker = getEncoder();
+          if (worker) {{
+            const bitmap = await createImageBitmap(video);
+            worker.postMessage({{ id, bitmap, width, height, type: settings.type, quality: settings.quality }}, [bitmap]);
+            return;
+          }}
+          // Fallback: encode on the page with canvas.toBlob
+          const canvas = document.getElementById("canvas");
+          canvas.width = width;
+          canvas.height = height;
+          canvas.getContext("2d").drawImage(video, 0, 0, width, height);
+          canvas.toBlob(blob => onEncoded({{ id, blob, width, height }}), settings.type, settings.quality);
+        }}
+
+        function onEncoded(result) {{
+          if (result.id !== captureId) return;  // a newer capture replaced this one
+          const info = document.getElementById("sizeInfo");
+          photoBlob = result.blob;
+          payloadBytes = dataUrlBytes(photoBlob.size, photoBlob.type);
+          const photo = document.getElementById("photo");
+          if (photo.src.startsWith("blob:")) URL.revokeObjectURL(photo.src);
+          photo.src = URL.createObjectURL(photoBlob);
+          photo.style.display = "block";
+          document.getElementById("emailSection").style.display = "block";
+          const requested = outputSettings().type;
+          const before = dataUrlBytes(baselineBytes, "image/png");
+          const saved = Math.max(0, 100 - 100 * payloadBytes / before);
+          info.textContent = "Payload: " + formatBytes(payloadBytes) + " (" + photoBlob.type + ", " +
+                             result.width + "×" + result.height + ")" +
+                             (photoBlob.type !== requested ? " – this browser cannot encode " + requested : "") +
+                             " · the uncompressed full frame would be about " + formatBytes(before) +
+                             " (" + saved.toFixed(0) + "% smaller)";
+        }}
+
+        function readAsDataURL(blob) {{
+          return new Promise((resolve, reject) => {{
+            const reader = new FileReader();
+            reader.onload = () => resolve(reader.result);
+            reader.onerror = () => reject(reader.error);
+            reader.readAsDataURL(blob);
+          }});
+        }}
+
+        async function sendEmail() {{
+          const toEmail = document.getElementById("email").value || "{recipient_email or 'recipient@example.com'}";
+
+          if (!toEmail.includes('@')) {{
+            alert("Please enter a valid email address");
+            return;
+          }}
+          if (!photoBlob) {{
+            alert("Capture a photo first");
+            return;
+          }}
+          const imageData = await readAsDataURL(photoBlob);
+
+          const templateParams = {{
+            to_email: toEmail,
+            image_base64: imageData,
+            from_name: "Photo Capture Tool",
+            message: "Here's your captured photo!"
+          }};
+
+          emailjs.send("{service_id or 'YOUR_SERVICE_ID'}", "{template_id or 'YOUR_TEMPLATE_ID'}", templateParams)
+            .then(() => {{
+              alert("📧 Email sent successfully!");
+            }})
+            .catch((err) => {{
+              alert("❌ Failed to send email: " + err.text);
+              console.error("EmailJS Error:", err);
+            }});
+        }}
+      </script>
+    </head>
+    <body onload="startCamera()">
+      <div class="container">
+        <h2>📷 Click Photo & Send via Email</h2>
+        
+        <div style="text-align: center;">
+          <video id="video" width="400" height="300" autoplay></video><br><br>
+          <div>
+            <select id="format">{format_options}</select>
+            <label>Quality <input type="range" id="quality" min="0.3" max="1" step="0.05" value="{quality}"
+                   style="width: 120px;" oninput="this.nextElementSibling.textContent = this.value" /><span>{quality}</span></label>
+            <select id="maxSide">{side_options}</select>
+          </div>
+          <button onclick="capturePhoto()">📷 Capture Photo</button><br><br>
+
+          <canvas id="canvas" style="display:none;"></canvas>
+          <img id="photo" width="400" style="display:none;" />
+          <p id="sizeInfo"></p>
+
+          <div id="emailSection" style="display:none;">
+            <input type="email" id="email" placeholder="Enter recipient email" value="{recipient_email or ''}" /><br><br>
+            <button onclick="sendEmail()">📩 Send Photo via Email</button>
+          </div>
+        </div>
+      </div>
+    </body>
+    </html>
+    """
+    return html_code
+
+
+def show_photo_capture_page():
+    st.header("📷 Photo Capture & Email")
+    st.write("Capture photos using your camera and send them via email using JavaScript")
+    
+    # Setup instructions
+    with st.expander("📋 Setup Instructions"):
+        st.markdown("""
+        **Required Setup for Email Functionality:**
+        1. Create an account at [EmailJS](https://www.emailjs.com/)
+        2. Get your Public Key from EmailJS dashboard
+        3. Create an email service and template
+        4. Replace the placeholder values in the code below
+        
+        **What this tool does:**
+        - Access your device camera
+        - Capture photos directly in the browser
+        - Send captured photos via email using EmailJS
+        """)
+    
+    # Configuration inputs
+    st.subheader("🔧 EmailJS Configuration")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        public_key = st.text_input("EmailJS Public Key", placeholder="YOUR_PUBLIC_KEY")
+        service_id = st.text_input("EmailJS Service ID", placeholder="YOUR_SERVICE_ID")
+    
+    with col2:
+        template_id = st.text_input("EmailJS Template ID", placeholder="YOUR_TEMPLATE_ID")
+        recipient_email = st.text_input("Default Recipient Email", placeholder="recipient@example.com")
+
+    # Output settings, baked into the generated HTML as its defaults
+    st.subheader("🗜️ Photo Output")
+    col1, col2, col3 = st.columns(3)
+    output_format = col1.selectbox("Format", list(OUTPUT_FORMATS))
+    quality = col2.slider("Quality", 0.3, 1.0, 0.8, 0.05, disabled=output_format == "PNG (lossless)")
+    max_side = col3.selectbox("Max resolution (longest side)", MAX_SIDES, index=1,
+                              format_func=lambda side: f"{side}px" if side else "Original")
+    st.caption(
+        "Photos are resized and encoded in a background worker before sending. The page shows the payload "
+        "size next to an estimate of the uncompressed full-resolution frame."
+    )
+    html_code = build_html(public_key, service_id, template_id, recipient_email,
+                           OUTPUT_FORMATS[output_format], quality, max_side)
+    
+    # Display the interactive HTML
+    if public_key and service_id and template_id:
+        st.success("✅ Configuration complete! The photo capture tool is ready to use.")
+        st.components.v1.html(html_code, height=800, scrolling=True)
+    else:
+        st.warning("⚠️ Please configure your EmailJS credentials above to use the photo capture tool.")
+        st.info("💡 You can still preview the interface, but email functionality requires EmailJS setup.")
+        
+        # Show preview with placeholder values
+        preview_html = html_code.replace('YOUR_PUBLIC_KEY', 'DEMO_MODE').replace('YOUR_SERVICE_ID', 'DEMO').replace('YOUR_TEMPLATE_ID', 'DEMO')
+        st.components.v1.html(preview_html, height=800, scrolling=True)
+    
+    # Code display
+    with st.expander("📝 View/Copy HTML Code"):
+        st.code(html_code, language="html")
+        st.download_button(
+            label="📥 Download HTML File",
+            data=html_code,
+            file_name="photo_capture_email.html",
+            mime="text/html"
+        )
@@ -0,0 +1,95 @@
+from datetime import datetime
+
+import streamlit as st
+
+HISTORY_WINDOWS = {"1 min": 60, "5 min": 300, "15 min": 900, "1 hour": 3600}
+SORT_KEYS = {"RSS": "rss", "USS": "uss", "Growth": "growth"}
+MB = 1024 ** 2
+
+
+def show_ram_monitor_page():
+    st.header("🖥 RAM Monitor")
+    st.write("Monitor system RAM usage")
+
+    try:
+        from automation import sysmon
+    except ImportError:
+        st.info("📋 Required library: psutil")
+        st.code("pip install psutil")
+        return
+
+    sampler = sysmon.get_sampler()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        live = st.toggle("Live updates", value=True)
+    with col2:
+        window = st.selectbox("History", list(HISTORY_WINDOWS), index=1)
+    with col3:
+        # Applied only when this user moves the slider, so sessions don't reset each other.
+        st.select_slider(
+            "Sampling interval (s)", options=[0.5, 1.0, 2.0, 5.0, 10.0], value=sampler.interval,
+            key="ram_interval", help="Shared by every session on this server.",
+            on_change=lambda: setattr(sampler, "interval", st.session_state.ram_interval),
+        )
+    interval = sampler.interval
+
+    # Only this fragment reruns on the timer; the rest of the app is left alone.
+    @st.fragment(run_every=max(interval, 1.0) if live else None)
+    def live_view():
+        latest = sampler.buffer.latest()
+        if latest is None:
+            st.info("Collecting the first sample...")
+            return
+
+        total_gb = latest["mem_total"] / (1024 ** 3)
+        used_gb = latest["mem_used"] / (1024 ** 3)
+        available_gb = latest["mem_available"] / (1024 ** 3)
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Total RAM", f"{total_gb:.2f} GB")
+        col2.metric("Used RAM", f"{used_gb:.2f} GB", f"{latest['mem_percent']}%")
+        col3.metric("Available RAM", f"{available_gb:.2f} GB")
+        col4.metric("CPU", f"{latest['cpu_percent']:.1f}%", f"swap {latest['swap_percent']:.1f}%")
+
+        st.progress(latest["mem_percent"] / 100)
+
+        history = sampler.buffer.snapshot(last=int(HISTORY_WINDOWS[window] / sampler.interval))
+        st.line_chart(
+            {
+                "time": [datetime.fromtimestamp(t) for t in history["time"]],
+                "Memory %": history["mem_percent"],
+                "Swap %": history["swap_percent"],
+                "CPU %": history["cpu_percent"],
+            },
+            x="time",
+            y=["Memory %", "Swap %", "CPU %"],
+        )
+        st.caption(f"{len(sampler.buffer)}/{sampler.buffer.capacity} samples buffered")
+
+        st.subheader("Top Processes")
+        col1, col2 = st.columns(2)
+        sort_by = col1.radio("Sort by", list(SORT_KEYS), horizontal=True, key="ram_sort")
+        top_n = col2.slider("Processes", 5, 50, 10, key="ram_top_n")
+        tracker = sampler.track_processes(top=top_n)
+        if not tracker.last_refresh:
+            st.info("Collecting the process table...")
+            return
+        procs = tracker.top(top_n, SORT_KEYS[sort_by])
+        st.dataframe(
+            {
+                "PID": [p.pid for p in procs],
+                "Name": [p.name for p in procs],
+                "RSS (MB)": [round(p.rss / MB, 1) for p in procs],
+                "USS (MB)": [None if p.uss is None else round(p.uss / MB, 1) for p in procs],
+                "Growth (MB/min)": [round(p.growth * 60 / MB, 2) for p in procs],
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.caption(
+            f"{len(tracker.procs)} processes · refreshed every {sampler.process_interval:.0f}s "
+            f"in {tracker.refresh_seconds * 1000:.0f} ms"
+        )
+
+    live_view()
@@ -0,0 +1,110 @@
+import functools
+
+import streamlit as st
+
+
+@functools.lru_cache(maxsize=32)
+def build_html(subject, recipient, message):
+    """The standalone Gmail page for one message, built once per process."""
+    html_code = f"""
+    <html>
+    <head>
+      <title>Send to Gmail</title>
+      <style>
+        body {{
+            font-family: Arial, sans-serif;
+            max-width: 600px;
+            margin: 0 auto;
+            padding: 20px;
+            background: linear-gradient(135deg, #fd79a8 0%, #e84393 100%);
+            color: white;
+            text-align: center;
+        }}
+        .container {{
+            background: rgba(255, 255, 255, 0.1);
+            padding: 30px;
+            border-radius: 15px;
+            backdrop-filter: blur(10px);
+        }}
+        button {{
+            background: linear-gradient(45deg, #e17055, #d63031);
+            color: white;
+            border: none;
+            padding: 15px 30px;
+            border-radius: 25px;
+            cursor: pointer;
+            font-size: 16px;
+            margin: 10px;
+            transition: transform 0.2s;
+        }}
+        button:hover {{
+            transform: translateY(-2px);
+        }}
+        input, textarea {{
+            padding: 10px;
+            border-radius: 10px;
+            border: none;
+            margin: 5px;
+            width: 90%;
+            font-size: 14px;
+        }}
+      </style>
+    </head>
+    <body>
+      <div class="container">
+        <h2>📧 Send to Gmail</h2>
+        <input type="text" id="subject" value="{subject}" placeholder="Subject"><br>
+        <input type="email" id="recipient" value="{recipient}" placeholder="Recipient (optional)"><br>
+        <textarea id="message" rows="4" placeholder="Your message">{message}</textarea><br><br>
+        <button onclick="sendToGmail()">📧 Open Gmail Composer</button>
+        <button onclick="sendWithPhoto()">📧 Send with Photo</button>
+      </div>
+
+      <script>
+        function sendToGmail() {{
+          let subject = document.getElementById('subject').value || 'Message from Web App';
+          let recipient = document.getElementById('recipient').value;
+          let body = document.getElementById('message').value || 'Hello from my web application!';
+          
+          let mailtoLink = `mailto:${{recipient}}?subject=${{encodeURIComponent(subject)}}&body=${{encodeURIComponent(body)}}`;
+          window.open(mailtoLink);
+        }}
+
+        function sendWithPhoto() {{
+          let subject = document.getElementById('subject').value || 'Photo from Web App';
+          let recipient = document.getElementById('recipient').value;
+          let body = document.getElementById('message').value + '\\n\\n[Photo will be attached manually from your device]';
+          
+          let mailtoLink = `mailto:${{recipient}}?subject=${{encodeURIComponent(subject)}}&body=${{encodeURIComponent(body)}}`;
+          window.open(mailtoLink);
+        }}
+      </script>
+    </body>
+    </html>
+    """
+    return html_code
+
+
+def show_send_to_gmail_page():
+    st.header("📧 Send to Gmail")
+    st.write("Send messages and content to Gmail using JavaScript")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        subject = st.text_input("Email Subject", value="Photo from my app")
+        recipient = st.text_input("Recipient Email (optional)", placeholder="recipient@gmail.com")
+    with col2:
+        message = st.text_area("Email Message", value="Hello! I'm sending you this message from my web app.")
+    
+    html_code = build_html(subject, recipient, message)
+
+    st.components.v1.html(html_code, height=500)
+
+    with st.expander("📝 View/Copy HTML Code"):
+        st.code(html_code, language="html")
+        st.download_button(
+            label="📥 Download HTML File",
+            data=html_code,
+            file_name="send_to_gmail.html",
+            mime="text/html"
+        )
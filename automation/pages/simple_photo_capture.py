@@ -0,0 +1,386 @@
+import streamlit as st
+
+
+def show_simple_photo_capture_page():
+    st.header("📸 Simple Photo Capture")
+    st.write("Capture photos using your device camera with a simple interface")
+    st.caption(
+        "Burst mode keeps up to the chosen number of frames in the browser's IndexedDB, dropping the oldest, "
+        "and exports them as one ZIP."
+    )
+    
+    html_code = """
+    <html>
+    <head>
+      <title>Simple Photo Capture</title>
+      <style>
+        body {
+            font-family: Arial, sans-serif;
+            max-width: 600px;
+            margin: 0 auto;
+            padding: 20px;
+            background: linear-gradient(135deg, #74b9ff 0%, #0984e3 100%);
+            color: white;
+            text-align: center;
+        }
+        .container {
+            background: rgba(255, 255, 255, 0.1);
+            padding: 30px;
+            border-radius: 15px;
+            backdrop-filter: blur(10px);
+        }
+        video, img {
+            border-radius: 10px;
+            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
+            margin: 10px;
+        }
+        button {
+            background: linear-gradient(45deg, #00b894, #00cec9);
+            color: white;
+            border: none;
+            padding: 15px 30px;
+            border-radius: 25px;
+            cursor: pointer;
+            font-size: 16px;
+            margin: 10px;
+            transition: transform 0.2s;
+        }
+        button:hover {
+            transform: translateY(-2px);
+        }
+        input {
+            padding: 8px;
+            border-radius: 10px;
+            border: none;
+            margin: 5px;
+            width: 70px;
+        }
+        #thumbs img {
+            margin: 3px;
+            box-shadow: none;
+        }
+      </style>
+    </head>
+    <body>
+      <div class="container">
+        <h2>📸 Simple Photo Capture</h2>
+        <video id="video" width="400" height="300" autoplay></video><br>
+        <button onclick="takePhoto()">📷 Take Photo</button>
+        <button id="burstButton" onclick="toggleBurst()">🎞️ Start Burst</button><br>
+        <label>Max frames <input type="number" id="maxFrames" min="1" max="2000" value="300"></label>
+        <label>Frames per second <input type="number" id="fps" min="1" max="30" value="5"></label>
+        <p id="status">Opening frame storage...</p>
+        <canvas id="canvas" style="display:none;"></canvas>
+        <img id="photo" width="400" style="display:none;">
+        <div id="thumbs"></div>
+        <div id="photoTaken" style="display:none;">
+          <button onclick="downloadPhoto()">💾 Download Latest</button>
+          <button onclick="exportZip()">🗜️ Export All as ZIP</button>
+          <button onclick="clearFrames()">🗑️ Clear Frames</button>
+        </div>
+      </div>
+
+      <script>
+        // Frames are JPEG Blobs in IndexedDB (no base64, no localStorage quota),
+        // keyed by an auto-increment id so the oldest frames are evicted first.
+        const DB_NAME = 'simple-photo-capture', STORE = 'frames', THUMBS = 8;
+        let db = null;          // null when IndexedDB is unavailable: frames stay in memory
+        let memoryFrames = [];
+        let nextMemoryId = 1;
+        let frameCount = 0;
+        let latest = null;
+        let imageCapture = null;
+
+        const video = document.getElementById('video');
+
+        // Camera setup
+        navigator.mediaDevices.getUserMedia({ video: true })
+          .then(stream => {
+            video.srcObject = stream;
+            if ('ImageCapture' in window) imageCapture = new ImageCapture(stream.getVideoTracks()[0]);
+          })
+          .catch(err => {
+            alert('Camera access denied: ' + err.message);
+          });
+
+        function request(req) {
+          return new Promise((resolve, reject) => {
+            req.onsuccess = () => resolve(req.result);
+            req.onerror = () => reject(req.error);
+          });
+        }
+
+        function frames(mode) {
+          return db.transaction(STORE, mode).objectStore(STORE);
+        }
+
+        async function openStore() {
+          try {
+            const open = indexedDB.open(DB_NAME, 1);
+            open.onupgradeneeded = () => open.result.createObjectStore(STORE, { keyPath: 'id', autoIncrement: true });
+            db = await request(open);
+            frameCount = await request(frames().count());
+          } catch (err) {
+            db = null;
+          }
+          try {
+            localStorage.removeItem('photoURL');  // left over from the single-photo version
+          } catch (err) {}
+          updateStatus();
+        }
+
+        function maxFrames() {
+          return Math.max(1, parseInt(document.getElementById('maxFrames').value, 10) || 1);
+        }
+
+        async function addFrame(blob) {
+          const frame = { blob, time: Date.now() };
+          if (db) {
+            frame.id = await request(frames('readwrite').add(frame));
+          } else {
+            frame.id = nextMemoryId++;
+            memoryFrames.push(frame);
+          }
+          frameCount++;
+          await evict();
+          return frame;
+        }
+
+        // Burst mode can have two captures evicting at once; they run one after the
+        // other, or both would delete the same oldest frames and undercount.
+        let evicting = Promise.resolve();
+
+        function evict() {
+          evicting = evicting.then(evictExcess, evictExcess);
+          return evicting;
+        }
+
+        async function evictExcess() {
+          if (db) {
+            // Counted in the same transaction as the delete, so the count is current.
+            const store = frames('readwrite');
+            const count = await request(store.count());
+            const excess = count - maxFrames();
+            if (excess > 0) {
+              const oldest = await request(store.getAllKeys(null, excess));
+              await request(store.delete(IDBKeyRange.upperBound(oldest[oldest.length - 1])));
+            }
+            frameCount = Math.min(count, maxFrames());
+          } else {
+            memoryFrames.splice(0, Math.max(0, memoryFrames.length - maxFrames()));
+            frameCount = memoryFrames.length;
+          }
+        }
+
+        async function frameIds() {
+          return db ? request(frames().getAllKeys()) : memoryFrames.map(frame => frame.id);
+        }
+
+        async function getFrame(id) {
+          return db ? request(frames().get(id)) : memoryFrames.find(frame => frame.id === id);
+        }
+
+        async function clearFrames() {
+          if (db) await request(frames('readwrite').clear());
+          memoryFrames = [];
+          frameCount = 0;
+          latest = null;
+          document.getElementById('thumbs').replaceChildren();
+          document.getElementById('photo').style.display = 'none';
+          document.getElementById('photoTaken').style.display = 'none';
+          updateStatus();
+        }
+
+        // One full-resolution frame: ImageCapture where supported, otherwise the video element
+        async function grabFrame() {
+          if (imageCapture) {
+            try {
+              return await imageCapture.grabFrame();
+            } catch (err) {
+              imageCapture = null;
+            }
+          }
+          return createImageBitmap(video);
+        }
+
+        async function captureFrame() {
+          const bitmap = await grabFrame();
+          const canvas = document.getElementById('canvas');
+          canvas.width = bitmap.width;
+          canvas.height = bitmap.height;
+          canvas.getContext('2d').drawImage(bitmap, 0, 0);
+          bitmap.close();
+          const blob = await new Promise(resolve => canvas.toBlob(resolve, 'image/jpeg', 0.9));
+          showFrame(await addFrame(blob));
+        }
+
+        function showFrame(frame) {
+          latest = frame;
+          const url = URL.createObjectURL(frame.blob);
+          const photo = document.getElementById('photo');
+          if (photo.src.startsWith('blob:')) URL.revokeObjectURL(photo.src);
+          photo.src = url;
+          photo.style.display = 'block';
+          const thumbs = document.getElementById('thumbs');
+          const thumb = document.createElement('img');
+          thumb.width = 60;
+          thumb.src = URL.createObjectURL(frame.blob);
+          thumbs.prepend(thumb);
+          while (thumbs.children.length > THUMBS) {
+            URL.revokeObjectURL(thumbs.lastChild.src);
+            thumbs.lastChild.remove();
+          }
+          document.getElementById('photoTaken').style.display = 'block';
+          updateStatus();
+        }
+
+        let skipped = 0;
+        function updateStatus(extra) {
+          document.getElementById('status').textContent =
+            frameCount + ' / ' + maxFrames() + ' frames stored' + (db ? '' : ' (in memory only)') +
+            (skipped ? ', ' + skipped + ' skipped while encoding' : '') + (extra ? ' · ' + extra : '');
+        }
+
+        async function takePhoto() {
+          if (!video.videoWidth) {
+            alert('The camera is not ready yet');
+            return;
+          }
+          await captureFrame();
+        }
+
+        // Burst: requestAnimationFrame paces the shots; at most two frames are
+        // encoding at once and ticks that find both busy are skipped, not queued.
+        let bursting = false, lastShot = 0, encoding = 0;
+
+        function toggleBurst() {
+          bursting = !bursting && video.videoWidth > 0;
+          document.getElementById('burstButton').textContent = bursting ? '⏹️ Stop Burst' : '🎞️ Start Burst';
+          if (bursting) {
+            skipped = 0;
+            requestAnimationFrame(burstTick);
+          }
+        }
+
+        function burstTick(now) {
+          if (!bursting) return;
+          const fps = Math.max(1, parseFloat(document.getElementById('fps').value) || 1);
+          if (now - lastShot >= 1000 / fps) {
+            lastShot = now;
+            if (encoding < 2) {
+              encoding++;
+              captureFrame().catch(err => console.error(err)).finally(() => encoding--);
+            } else {
+              skipped++;
+            }
+          }
+          requestAnimationFrame(burstTick);
+        }
+
+        function downloadPhoto() {
+          if (!latest) return;
+          saveBlob(latest.blob, 'captured-photo.jpg');
+        }
+
+        function saveBlob(blob, name) {
+          const link = document.createElement('a');
+          link.download = name;
+          link.href = URL.createObjectURL(blob);
+          link.click();
+          setTimeout(() => URL.revokeObjectURL(link.href), 10000);
+        }
+
+        // ZIP export (stored entries: JPEG does not compress further). Frames are read
+        // one at a time and written straight to a file where the File System Access
+        // API is available; otherwise the ZIP is a Blob that references the stored
+        // frames instead of copying them.
+        const CRC_TABLE = new Uint32Array(256).map((_, n) => {
+          let c = n;
+          for (let k = 0; k < 8; k++) c = c & 1 ? 0xEDB88320 ^ (c >>> 1) : c >>> 1;
+          return c >>> 0;
+        });
+
+        function crc32(bytes) {
+          let crc = 0xFFFFFFFF;
+          for (let i = 0; i < bytes.length; i++) crc = CRC_TABLE[(crc ^ bytes[i]) & 0xFF] ^ (crc >>> 8);
+          return (crc ^ 0xFFFFFFFF) >>> 0;
+        }
+
+        // Little-endian record from [byteCount, value] pairs, followed by the file name
+        function pack(fields, name) {
+          const size = fields.reduce((total, [bytes]) => total + bytes, 0);
+          const out = new Uint8Array(size + (name ? name.length : 0));
+          const view = new DataView(out.buffer);
+          let offset = 0;
+          for (const [bytes, value] of fields) {
+            if (bytes === 2) view.setUint16(offset, value, true);
+            else view.setUint32(offset, value, true);
+            offset += bytes;
+          }
+          if (name) out.set(name, offset);
+          return out;
+        }
+
+        function dosTime(ms) {
+          const d = new Date(ms);
+          return [(d.getHours() << 11) | (d.getMinutes() << 5) | (d.getSeconds() >> 1),
+                  ((d.getFullYear() - 1980) << 9) | ((d.getMonth() + 1) << 5) | d.getDate()];
+        }
+
+        async function exportZip() {
+          const ids = await frameIds();
+          if (!ids.length) return;
+          let file = null;
+          const parts = [];
+          if (window.showSaveFilePicker) {
+            try {
+              const handle = await showSaveFilePicker({ suggestedName: 'frames.zip' });
+              file = await handle.createWritable();
+            } catch (err) {
+              if (err.name === 'AbortError') return;
+            }
+          }
+          const write = async part => file ? file.write(part) : parts.push(part);
+          const names = new TextEncoder();
+          const central = [];
+          let offset = 0;
+          for (const id of ids) {
+            const frame = await getFrame(id);
+            if (!frame) continue;  // evicted meanwhile
+            const bytes = new Uint8Array(await frame.blob.arrayBuffer());
+            const name = names.encode('frame-' + String(central.length + 1).padStart(5, '0') + '.jpg');
+            const [time, date] = dosTime(frame.time);
+            const common = [[2, 20], [2, 0x0800], [2, 0], [2, time], [2, date], [4, crc32(bytes)],
+                            [4, bytes.length], [4, bytes.length], [2, name.length], [2, 0]];
+            const local = pack([[4, 0x04034b50], ...common], name);
+            central.push(pack([[4, 0x02014b50], [2, 20], ...common, [2, 0], [2, 0], [2, 0], [4, 0], [4, offset]], name));
+            await write(local);
+            await write(frame.blob);
+            offset += local.length + bytes.length;
+            updateStatus('exporting ' + central.length + ' / ' + ids.length);
+          }
+          const directorySize = central.reduce((total, entry) => total + entry.length, 0);
+          for (const entry of central) await write(entry);
+          await write(pack([[4, 0x06054b50], [2, 0], [2, 0], [2, central.length], [2, central.length],
+                            [4, directorySize], [4, offset], [2, 0]]));
+          if (file) await file.close();
+          else saveBlob(new Blob(parts, { type: 'application/zip' }), 'frames.zip');
+          updateStatus('exported ' + central.length + ' frames');
+        }
+
+        openStore();
+      </script>
+    </body>
+    </html>
+    """
+    
+    st.components.v1.html(html_code, height=900, scrolling=True)
+    
+    with st.expander("📝 View/Copy HTML Code"):
+        st.code(html_code, language="html")
+        st.download_button(
+            label="📥 Download HTML File",
+            data=html_code,
+            file_name="simple_photo_capture.html",
+            mime="text/html"
+        )
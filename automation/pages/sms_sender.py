@@ -0,0 +1,111 @@
+import streamlit as st
+
+from automation import campaigns, outbox
+from automation.pages import outbox_panel
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return "—"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m" if hours else f"{minutes}m {seconds:02d}s"
+
+
+def show_campaign_progress(campaign_id):
+    box = outbox.get_outbox()
+
+    @st.fragment(run_every=None if campaigns.progress(box, campaign_id).done else 1.0)
+    def live():
+        progress = campaigns.progress(box, campaign_id)
+        if not progress.total:
+            return
+        st.progress((progress.sent + progress.failed) / progress.total)
+        st.caption(
+            f"{progress.sent}/{progress.total} sent · {progress.failed} failed · "
+            f"{progress.rate:.1f} msg/s · ETA {format_eta(progress.eta)}"
+        )
+        if progress.done:
+            st.success(f"Campaign finished: {progress.sent} sent, {progress.failed} failed.")
+
+    live()
+
+
+def show_sms_sender_page():
+    st.header("📱 SMS Sender")
+    st.write("Send SMS using Python")
+
+    st.info("📋 Required library: twilio")
+    st.code("pip install twilio")
+
+    account_sid = st.text_input("Twilio SID")
+    auth_token = st.text_input("Auth Token", type="password")
+    from_number = st.text_input("Twilio Phone Number")
+    rate = st.number_input(
+        "Max messages per second", 0.1, 1000.0, 1.0,
+        help="Your number's provider limit: typically 1/s for a long code, 3/s toll-free, 100/s short code.",
+    )
+
+    route = None
+    if account_sid and auth_token:
+        try:
+            route = outbox_panel.twilio_route("sms", account_sid, auth_token, rate)
+        except ImportError:
+            st.error("Missing dependency: install twilio to send SMS.")
+
+    single_tab, campaign_tab = st.tabs(["Single SMS", "Campaign"])
+
+    with single_tab:
+        to_number = st.text_input("Recipient Number")
+        sms_body = st.text_area("SMS Body")
+
+        if st.button("📤 Send SMS"):
+            if route is None or not from_number or not to_number or not sms_body:
+                st.error("All fields are required!")
+            else:
+                outbox_panel.enqueue(route, {"from": from_number, "to": to_number, "body": sms_body})
+
+    with campaign_tab:
+        st.markdown(
+            "Upload a CSV with a `phone` column (or put numbers in the first column). "
+            "Every column can be used in the message as `$column`, e.g. `Hi $name`. "
+            "Uploading the same campaign again resumes it without resending."
+        )
+        recipients_file = st.file_uploader("Recipients CSV", type=["csv"], key="sms_campaign_csv")
+        col1, col2 = st.columns(2)
+        phone_column = col1.text_input("Phone column", value=campaigns.DEFAULT_PHONE_COLUMN)
+        default_country = col2.text_input("Default country code", value="+91",
+                                          help="Added to numbers written without one.")
+        template = st.text_area("Message template", placeholder="Hi $name, ...")
+
+        campaign = None
+        if recipients_file and template:
+            campaign = campaigns.prepare(
+                campaigns.read_rows(recipients_file.getvalue()), template, route or "", from_number,
+                phone_column, default_country,
+            )
+            st.caption(
+                f"{len(campaign.messages)} recipients · {campaign.duplicates} duplicates removed · "
+                f"{len(campaign.invalid)} invalid · about "
+                f"{format_eta(len(campaign.messages) / rate)} at {rate:g} msg/s"
+            )
+            if campaign.invalid:
+                with st.expander(f"⚠️ {len(campaign.invalid)} invalid numbers"):
+                    st.table({"Row": [n for n, _ in campaign.invalid], "Value": [v for _, v in campaign.invalid]})
+
+        if st.button("🚀 Start Campaign"):
+            if route is None or not from_number:
+                st.error("Enter your Twilio credentials and phone number.")
+            elif campaign is None or not campaign.messages:
+                st.error("Upload a CSV with at least one valid number and write a message.")
+            else:
+                added = campaigns.enqueue(outbox.get_outbox(), route, from_number, campaign)
+                st.session_state.sms_campaign = campaign.id
+                if added < len(campaign.messages):
+                    st.info(f"Resuming: {len(campaign.messages) - added} messages were already queued or sent.")
+
+        if "sms_campaign" in st.session_state:
+            show_campaign_progress(st.session_state.sms_campaign)
+
+    if route is not None:
+        outbox_panel.show_outbox_status(route)
@@ -0,0 +1,194 @@
+import streamlit as st
+
+from automation import microbench
+
+SIZE_CHOICES = (10, 100, 1_000, 10_000, 100_000)
+
+
+@st.cache_data(persist="disk", show_spinner="Timing sequences...")
+def run_sequences(interpreter, sizes):
+    # ``interpreter`` only keys the cache: results from another Python are not reused.
+    return microbench.run_sequences(sizes)
+
+
+@st.cache_data(persist="disk", show_spinner="Timing records...")
+def run_records(interpreter):
+    return microbench.run_records()
+
+
+def relative_to_fastest(rows, group):
+    """Adds ``relative`` (time / fastest time in the same ``group``) to timing rows that have a time."""
+    fastest = {}
+    for row in rows:
+        if row["seconds"] is not None:
+            key = row[group]
+            fastest[key] = min(fastest.get(key, row["seconds"]), row["seconds"])
+    return [{**row, "relative": row["seconds"] / fastest[row[group]]} for row in rows if row["seconds"] is not None]
+
+
+def show_sequence_results(timings, memory):
+    operation = st.radio("Operation", list(microbench.SEQUENCE_OPERATIONS), horizontal=True, key="bench_operation")
+    st.code(microbench.SEQUENCE_OPERATIONS[operation], language="python")
+    rows = relative_to_fastest([r for r in timings if r["operation"] == operation], "size")
+    if not rows:
+        st.info("No container supports this operation.")
+        return
+    st.bar_chart(
+        {
+            "Size": [f"n={r['size']:,}" for r in rows],
+            "× fastest": [r["relative"] for r in rows],
+            "Type": [r["type"] for r in rows],
+        },
+        x="Size",
+        y="× fastest",
+        color="Type",
+        stack=False,
+    )
+    st.dataframe(
+        {
+            "Type": [r["type"] for r in rows],
+            "Size": [r["size"] for r in rows],
+            "Time per op (µs)": [round(r["seconds"] * 1e6, 3) for r in rows],
+            "ns per element": [round(r["seconds"] * 1e9 / r["size"], 2) for r in rows],
+            "× fastest": [round(r["relative"], 2) for r in rows],
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+    unsupported = sorted({r["type"] for r in timings if r["operation"] == operation and r["seconds"] is None})
+    if unsupported:
+        st.caption(f"Not supported: {', '.join(unsupported)}")
+
+    st.markdown("**Memory**")
+    st.bar_chart(
+        {
+            "Size": [f"n={r['size']:,}" for r in memory],
+            "Bytes per element": [r["traced"] / r["size"] for r in memory],
+            "Type": [r["type"] for r in memory],
+        },
+        x="Size",
+        y="Bytes per element",
+        color="Type",
+        stack=False,
+    )
+    st.dataframe(
+        {
+            "Type": [r["type"] for r in memory],
+            "Size": [r["size"] for r in memory],
+            "sys.getsizeof (bytes)": [r["getsizeof"] for r in memory],
+            "tracemalloc (bytes)": [r["traced"] for r in memory],
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+    st.caption(
+        "Elements are the same int objects in every container, so the memory figures are the container "
+        "itself: one pointer per element for list and tuple, raw 8-byte values for array.array and NumPy."
+    )
+
+
+def show_record_results(timings, memory):
+    rows = [r for r in timings if r["seconds"] is not None]
+    st.bar_chart(
+        {
+            "Operation": [r["operation"] for r in rows],
+            "ns per op": [r["seconds"] * 1e9 for r in rows],
+            "Type": [r["type"] for r in rows],
+        },
+        x="Operation",
+        y="ns per op",
+        color="Type",
+        stack=False,
+    )
+    by_type = {}
+    for r in timings:
+        by_type.setdefault(r["type"], {})[r["operation"]] = r["seconds"]
+    footprint = {r["type"]: r for r in memory}
+    st.dataframe(
+        {
+            "Type": list(by_type),
+            **{
+                f"{operation} (ns)": [
+                    "n/a" if ops[operation] is None else f"{ops[operation] * 1e9:.1f}" for ops in by_type.values()
+                ]
+                for operation in microbench.RECORD_OPERATIONS
+            },
+            "sys.getsizeof (bytes)": [footprint[name]["getsizeof"] for name in by_type],
+            "tracemalloc per instance (bytes)": [round(footprint[name]["traced"], 1) for name in by_type],
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+    st.caption(
+        f"Three-field records (x, y, z). Memory per instance is measured over {microbench.RECORD_COUNT:,} "
+        "instances; the plain class includes its __dict__."
+    )
+
+
+@st.fragment
+def show_benchmark_lab():
+    st.subheader("🔬 Benchmark Lab")
+    interpreter = microbench.interpreter()
+    st.write(
+        f"Measure the differences on this interpreter (**{interpreter}**) with `timeit`, "
+        "`sys.getsizeof` and `tracemalloc`. Results are cached per interpreter version, "
+        "so they are only measured once."
+    )
+    sizes = st.multiselect("Sizes", SIZE_CHOICES, default=microbench.SIZES, key="bench_sizes")
+    if st.button("▶ Run benchmarks", disabled=not sizes):
+        st.session_state.bench_sizes_run = tuple(sorted(sizes))
+
+    if "bench_sizes_run" not in st.session_state:
+        return
+
+    timings, memory = run_sequences(interpreter, st.session_state.bench_sizes_run)
+    record_timings, record_memory = run_records(interpreter)
+
+    sequences_tab, records_tab = st.tabs(["Sequences of n ints", "Small records"])
+    with sequences_tab:
+        show_sequence_results(timings, memory)
+    with records_tab:
+        show_record_results(record_timings, record_memory)
+
+
+def show_tuple_vs_list_page():
+    st.header("📚 Tuple vs List in Python")
+    st.write("Technical comparison between Python's tuple and list types")
+
+    data = [
+        ["Mutability", "Mutable (can change)", "Immutable (cannot change)"],
+        ["Syntax", "Square brackets: [ ]", "Parentheses: ( )"],
+        ["Methods", "Many methods (append, remove, etc.)", "Few methods (count, index)"],
+        ["Performance", "Slightly slower", "Faster"],
+        ["Memory Usage", "More memory", "Less memory"],
+        ["Hashability", "Not hashable", "Hashable"],
+        ["Use Case", "Dynamic data", "Fixed data"],
+    ]
+
+    st.table({
+        "Property": [row[0] for row in data],
+        "List": [row[1] for row in data],
+        "Tuple": [row[2] for row in data],
+    })
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**List Example:**")
+        st.code("""
+my_list = [1, 2, 3]
+my_list.append(4)
+my_list[0] = 10
+print(my_list)  # [10, 2, 3, 4]
+        """, language="python")
+
+    with col2:
+        st.markdown("**Tuple Example:**")
+        st.code("""
+my_tuple = (1, 2, 3)
+# my_tuple[0] = 10  # Error!
+count = my_tuple.count(2)
+index = my_tuple.index(3)
+        """, language="python")
+
+    show_benchmark_lab()
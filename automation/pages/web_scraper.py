@@ -0,0 +1,99 @@
+import streamlit as st
+
+from automation.pages import jobs_panel
+
+
+def scrape_job(job, url, options, dest, incremental):
+    """Background job: crawl ``url`` and download the matching files into ``dest``."""
+    from automation import scraper
+    from automation.manifest import Manifest
+
+    with scraper.make_session(pool_size=options.max_workers) as session:
+        job.report(0.0, "Crawling for files...")
+        urls = scraper.crawl(session, url, options)
+        job.report(0.0, f"Found {len(urls)} matching files")
+        if not urls:
+            return {"dest": dest, "results": []}
+
+        def on_progress(p):
+            job.report(
+                p.files_done / p.files_total,
+                f"{p.files_done}/{p.files_total} files · {p.files_skipped} unchanged · "
+                f"{p.bytes_done / (1024 ** 2):.1f} MB · {scraper.format_rate(p.throughput)}",
+            )
+
+        manifest = Manifest(dest) if incremental else None
+        try:
+            results = scraper.Downloader(session, dest, options, manifest).run(urls, on_progress)
+        finally:
+            if manifest:
+                manifest.close()
+    return {"dest": dest, "results": results}
+
+
+def show_scrape_result(job):
+    dest, results = job.result["dest"], job.result["results"]
+    if not results:
+        st.warning("No matching files found.")
+        return
+    failed = [r for r in results if not r.ok]
+    unchanged = sum(r.not_modified for r in results)
+    duplicates = sum(r.deduplicated for r in results)
+    st.success(
+        f"Downloaded {len(results) - len(failed) - unchanged} files to `{dest}` "
+        f"({unchanged} unchanged, {duplicates} duplicates stored once)."
+    )
+    if failed:
+        with st.expander(f"⚠️ {len(failed)} downloads failed"):
+            st.table({"URL": [r.url for r in failed], "Error": [r.error for r in failed]})
+
+
+def show_web_scraper_page():
+    st.header("🌐 Website Data Downloader")
+    st.write("Go on a website and download the entire data using Python")
+
+    st.info("📋 Required libraries: requests, beautifulsoup4")
+    st.code("pip install requests beautifulsoup4")
+
+    url_input = st.text_input("Enter the website URL to scrape and download files from:")
+
+    file_types = st.multiselect(
+        "Select file types to download:",
+        options=[".csv", ".txt", ".xlsx", ".xls", ".pdf", ".zip", ".jpg", ".png"],
+        default=[".csv", ".xlsx"]
+    )
+
+    with st.expander("⚙️ Crawl Settings"):
+        col1, col2 = st.columns(2)
+        with col1:
+            depth = st.slider("Crawl depth (0 = this page only)", 0, 3, 0)
+            same_host = st.checkbox("Stay on the same website", value=True)
+            dest = st.text_input("Download folder", value="downloads")
+            incremental = st.checkbox(
+                "Skip unchanged files", value=True,
+                help="Keep a manifest in the download folder and only fetch files that changed since the last run.",
+            )
+        with col2:
+            max_workers = st.slider("Concurrent downloads", 1, 32, 8)
+            per_host = st.slider("Max downloads per host", 1, 16, 4)
+
+    if st.button("Download Files"):
+        if not url_input:
+            st.error("Please enter a valid URL.")
+        elif not file_types:
+            st.error("Please select at least one file type to download.")
+        else:
+            try:
+                from automation import scraper
+            except ImportError:
+                st.info("Feature requires additional libraries. Install dependencies first.")
+                return
+
+            options = scraper.CrawlOptions(
+                file_types=tuple(file_types), depth=depth, same_host=same_host,
+                max_workers=max_workers, per_host=per_host,
+            )
+            jobs_panel.submit("scraper", f"Download from {url_input}", scrape_job, url_input, options, dest,
+                              incremental)
+
+    jobs_panel.show_jobs("scraper", show_scrape_result)
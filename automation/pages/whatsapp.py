@@ -0,0 +1,107 @@
+from collections import deque
+
+import streamlit as st
+
+from automation import campaigns
+
+RESULTS_KEPT = 500  # per browser session; older results are dropped
+RESULTS_SHOWN = 50
+
+
+def show_whatsapp_page():
+    st.header("📱 WhatsApp Message Sender")
+    st.write("Send WhatsApp messages using Python automation")
+
+    st.info("📋 Required library: playwright")
+    st.code("pip install playwright\nplaywright install chromium")
+
+    try:
+        from automation import whatsapp_web
+    except ImportError:
+        st.info("Install playwright to enable WhatsApp messaging.")
+        return
+
+    sender = whatsapp_web.get_sender()
+    # The sender is shared by every session; each session only sees what it queued.
+    if "whatsapp_results" not in st.session_state:
+        st.session_state.whatsapp_results = deque(maxlen=RESULTS_KEPT)
+    own = st.session_state.whatsapp_results
+    col1, col2 = st.columns([3, 1])
+    col1.markdown(
+        f"**WhatsApp Web session:** {sender.state}"
+        + (f" — {sender.error}" if sender.error else "")
+    )
+    if sender.state in (whatsapp_web.STOPPED, whatsapp_web.ERROR):
+        if col2.button("▶ Open WhatsApp Web"):
+            sender.start()
+            st.rerun()
+    st.caption(
+        "One browser window stays open for all messages. Scan the QR code in it the first time; "
+        "the login is kept for later sessions."
+    )
+
+    single_tab, batch_tab = st.tabs(["Single Message", "Batch"])
+
+    with single_tab:
+        phone = st.text_input("📞 Phone Number (with country code)", value="+91")
+        message = st.text_area("💬 Enter Message", placeholder="Type your WhatsApp message here...")
+
+        if st.button("📤 Send Message"):
+            to = campaigns.normalize_e164(phone)
+            if to is None or not message:
+                st.error("Enter a phone number with country code and a message.")
+            else:
+                own.append(sender.start().submit(to, message))
+                st.success(f"Queued message to {to}.")
+
+    with batch_tab:
+        st.markdown(
+            "Upload a CSV with a `phone` column (or numbers in the first column). "
+            "Every column can be used in the message as `$column`."
+        )
+        recipients_file = st.file_uploader("Recipients CSV", type=["csv"], key="whatsapp_csv")
+        default_country = st.text_input("Default country code", value="+91", key="whatsapp_country")
+        template = st.text_area("Message template", placeholder="Hi $name, ...", key="whatsapp_template")
+
+        if st.button("📤 Queue Batch"):
+            rows = campaigns.read_rows(recipients_file.getvalue()) if recipients_file else []
+            batch = campaigns.prepare(rows, template, "whatsapp-web", "", default_country=default_country,
+                                      kind="whatsapp")
+            if not batch.messages or not template:
+                st.error("Upload a CSV with at least one valid number and write a message.")
+            else:
+                sender.start()
+                own.extend(sender.submit(to, body) for to, body in batch.messages)
+                st.success(
+                    f"Queued {len(batch.messages)} messages "
+                    f"({batch.duplicates} duplicates and {len(batch.invalid)} invalid numbers skipped)."
+                )
+
+    if own:
+        in_flight = any(r.status in ("queued", "sending") for r in own)
+
+        @st.fragment(run_every=1.0 if in_flight else None)
+        def results():
+            rows = list(own)[-RESULTS_SHOWN:]
+            st.subheader("📬 Sent Messages")
+            st.dataframe(
+                {
+                    "To": [r.phone for r in rows],
+                    "Status": [r.status for r in rows],
+                    "Open chat (s)": [round(r.timings.get("open chat", 0), 2) for r in rows],
+                    "Compose ready (s)": [round(r.timings.get("compose ready", 0), 2) for r in rows],
+                    "Delivered (s)": [round(r.timings.get("delivered to server", 0), 2) for r in rows],
+                    "Total (s)": [round(r.seconds, 2) for r in rows],
+                    "Error": [r.error or "" for r in rows],
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
+            sent = [r for r in own if r.status == "sent"]
+            if sent:
+                st.caption(
+                    f"{len(sent)} sent · {sum(r.status == 'queued' for r in own)} queued · "
+                    f"{sum(r.seconds for r in sent) / len(sent):.1f}s per message on average"
+                )
+
+        results()
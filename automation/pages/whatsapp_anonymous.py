@@ -0,0 +1,36 @@
+import streamlit as st
+
+from automation.pages import outbox_panel
+
+TWILIO_SANDBOX_NUMBER = "+14155238886"
+
+
+def show_whatsapp_anonymous_page():
+    st.header("📲 WhatsApp via Twilio")
+    st.write("Send WhatsApp messages using Twilio API")
+
+    st.info("📋 Required library: twilio")
+    st.code("pip install twilio")
+
+    account_sid = st.text_input("Twilio Account SID")
+    auth_token = st.text_input("Twilio Auth Token", type="password")
+    from_number = st.text_input("Twilio WhatsApp Number", value=TWILIO_SANDBOX_NUMBER,
+                                help="The Twilio sandbox number unless you have an approved sender.")
+    to_number = st.text_input("Recipient WhatsApp Number")
+    message = st.text_area("Message to Send")
+
+    route = None
+    if account_sid and auth_token:
+        try:
+            route = outbox_panel.twilio_route("whatsapp", account_sid, auth_token)
+        except ImportError:
+            st.error("Missing dependency: install twilio to send WhatsApp messages.")
+
+    if st.button("📤 Send WhatsApp Message"):
+        if route is None or not from_number or not to_number or not message:
+            st.error("All fields are required!")
+        else:
+            outbox_panel.enqueue(route, {"from": from_number, "to": to_number, "body": message})
+
+    if route is not None:
+        outbox_panel.show_outbox_status(route)
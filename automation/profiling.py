@@ -0,0 +1,161 @@
+"""Opt-in sampling profiler that keeps the stacks of slow script runs.
+
+While enabled, every profiled run registers its thread with one shared
+sampler thread, which reads that thread's stack from
+``sys._current_frames()`` every ``interval`` seconds. When a run takes at
+least ``threshold`` seconds its samples are written as folded stacks (one
+``frame;frame;frame count`` line per distinct stack), which ``flamegraph.pl``,
+speedscope and inferno read directly. Faster runs are discarded.
+
+Disabled (the default), ``profile`` is a no-op context manager. Enable it with
+``AUTOMATION_PROFILE_SLOW=<seconds>`` or from the Diagnostics page.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+THRESHOLD_ENV = "AUTOMATION_PROFILE_SLOW"
+DIR_ENV = "AUTOMATION_PROFILE_DIR"
+DEFAULT_DIR = Path.home() / ".automation_suite" / "profiles"
+DEFAULT_INTERVAL = 0.005
+DEFAULT_THRESHOLD = 1.0
+MAX_DEPTH = 128
+
+
+@dataclass
+class Dump:
+    path: Path
+    name: str
+    seconds: float
+    samples: int
+
+
+def _frame_label(code):
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def fold(frame, limit=MAX_DEPTH):
+    """The stack ending at ``frame`` as ``outer;...;inner``."""
+    labels = []
+    while frame is not None and len(labels) < limit:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class SlowRunProfiler:
+    def __init__(self, threshold=DEFAULT_THRESHOLD, interval=DEFAULT_INTERVAL, out_dir=DEFAULT_DIR, keep=50):
+        self.threshold = threshold
+        self.interval = interval
+        self.out_dir = Path(out_dir)
+        self.keep = keep
+        self.enabled = False
+        self.dumps = []
+        self._active = {}  # thread id -> Counter of folded stacks
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def enable(self, threshold=None):
+        if threshold is not None:
+            self.threshold = threshold
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    @contextmanager
+    def profile(self, name):
+        """Sample this thread while the block runs; dump the stacks if it was slow.
+
+        Nested calls on the same thread are no-ops, so the outermost run owns
+        the samples.
+        """
+        ident = threading.get_ident()
+        if not self.enabled or ident in self._active:
+            yield
+            return
+        samples = Counter()
+        with self._lock:
+            self._active[ident] = samples
+            self._ensure_sampler()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._active.pop(ident, None)
+            if elapsed >= self.threshold and samples:
+                self._dump(name, elapsed, samples)
+
+    def _ensure_sampler(self):
+        # Called with the lock held.
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._sample, name="slow-run-profiler", daemon=True)
+            self._thread.start()
+
+    def _sample(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                active = list(self._active.items())
+            frames = sys._current_frames()
+            for ident, samples in active:
+                frame = frames.get(ident)
+                if frame is not None:
+                    samples[fold(frame)] += 1
+
+    def _dump(self, name, elapsed, samples):
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = self.out_dir / f"{stamp}-{int(elapsed * 1000)}ms-{name}.folded"
+        path.write_text("".join(f"{stack} {count}\n" for stack, count in samples.most_common()), encoding="utf-8")
+        with self._lock:
+            self.dumps.append(Dump(path, name, elapsed, sum(samples.values())))
+            del self.dumps[:-self.keep]
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler():
+    """The process-wide profiler, enabled at creation if ``$AUTOMATION_PROFILE_SLOW`` is set."""
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = SlowRunProfiler(out_dir=os.environ.get(DIR_ENV, DEFAULT_DIR))
+            threshold = os.environ.get(THRESHOLD_ENV)
+            if threshold:
+                try:
+                    _profiler.enable(float(threshold))
+                except ValueError:
+                    pass
+        return _profiler
+
+
+def profile(name):
+    return get_profiler().profile(name)
+
+
+def profiled(name=None):
+    """Decorator that profiles ``fn`` with the process-wide profiler, looked up per call."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with profile(name or fn.__name__):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
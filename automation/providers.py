@@ -0,0 +1,124 @@
+"""Process-wide pool of authenticated Twilio clients.
+
+Building a Twilio ``Client`` per send means a new ``requests`` session, so
+every message pays for a fresh TCP connection and TLS handshake. The pool
+keeps one client per set of credentials, shared by every page, session and
+worker thread, and its session keeps connections to the API alive between
+sends. Clients unused for ``idle_timeout`` seconds are closed and dropped.
+
+Set ``AUTOMATION_TWILIO_BASE_URL`` (e.g. ``http://127.0.0.1:8099``) to send
+all API calls to a local mock server instead of ``https://api.twilio.com``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+
+from requests.adapters import HTTPAdapter
+
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_TIMEOUT = 15.0
+DEFAULT_POOL_SIZE = 16
+
+_HOST = re.compile(r"^https://[^/]+")
+
+
+def _http_client(timeout, base_url, pool_size):
+    from twilio.http.http_client import TwilioHttpClient
+
+    class RoutedHttpClient(TwilioHttpClient):
+        def request(self, method, url, *args, **kwargs):
+            if base_url:
+                url = _HOST.sub(base_url.rstrip("/"), url)
+            return super().request(method, url, *args, **kwargs)
+
+    http = RoutedHttpClient(timeout=timeout)
+    # Enough keep-alive connections for the outbox and campaign worker pools.
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    http.session.mount("https://", adapter)
+    http.session.mount("http://", adapter)
+    return http
+
+
+@dataclass
+class _Slot:
+    client: object
+    last_used: float
+    uses: int = 0
+
+
+class TwilioClientPool:
+    def __init__(self, idle_timeout=DEFAULT_IDLE_TIMEOUT, timeout=DEFAULT_TIMEOUT, base_url=None,
+                 pool_size=DEFAULT_POOL_SIZE, clock=time.monotonic):
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+        self._clock = clock
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._slots)
+
+    def client(self, account_sid, auth_token):
+        from twilio.rest import Client
+
+        # The token is only kept inside the client, not in the pool's keys.
+        key = (account_sid, hashlib.sha256(auth_token.encode()).hexdigest())
+        with self._lock:
+            now = self._clock()
+            self._evict(now)
+            slot = self._slots.get(key)
+            if slot is None:
+                http = _http_client(self.timeout, self.base_url, self.pool_size)
+                slot = self._slots[key] = _Slot(Client(account_sid, auth_token, http_client=http), now)
+                self.created += 1
+            else:
+                self.reused += 1
+            slot.last_used = now
+            slot.uses += 1
+            return slot.client
+
+    def _evict(self, now):
+        for key, slot in list(self._slots.items()):
+            if now - slot.last_used > self.idle_timeout:
+                del self._slots[key]
+                slot.client.http_client.session.close()
+                self.evicted += 1
+
+    def evict_idle(self):
+        with self._lock:
+            self._evict(self._clock())
+
+    def close(self):
+        with self._lock:
+            for slot in self._slots.values():
+                slot.client.http_client.session.close()
+            self._slots.clear()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def twilio_pool():
+    """The process-wide client pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = TwilioClientPool(base_url=os.environ.get("AUTOMATION_TWILIO_BASE_URL"))
+        return _pool
+
+
+def twilio_client(account_sid, auth_token):
+    """A shared, keep-alive Twilio client for these credentials."""
+    return twilio_pool().client(account_sid, auth_token)
@@ -0,0 +1,41 @@
+"""Thread-safe token bucket shared by the batch tools."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Allow ``rate`` operations per second with bursts of up to ``burst``.
+
+    ``acquire`` reserves its tokens under the lock and sleeps outside it, so
+    many worker threads can wait on one bucket without serialising on the
+    lock while they sleep. A ``rate`` of ``None`` or ``0`` disables limiting.
+    """
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens):
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, tokens=1):
+        """Block until ``tokens`` are available; return the time spent waiting."""
+        if not self.rate:
+            return 0.0
+        delay = self._reserve(tokens)
+        if delay:
+            self._sleep(delay)
+        return delay
@@ -0,0 +1,99 @@
+"""Tool registry for the Automation Suite sidebar.
+
+Every tool declares its category, sidebar label and page entry point as a
+``"module:function"`` string. Nothing behind an entry point is imported until
+the tool is opened for the first time; after that the page function (and the
+heavy libraries its module pulled in) stay cached for the life of the process.
+
+The registry itself lives in an imported module rather than in the Streamlit
+script, so it is built once per process instead of once per rerun.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Tool:
+    category: str
+    label: str
+    entry: str | None
+    imports: tuple[str, ...] = ()  # heavy third-party modules the page needs
+
+    @property
+    def available(self):
+        return self.entry is not None
+
+
+PYTHON = "🔧 Python Automation"
+JAVASCRIPT = "🟨 JavaScript Tools"
+LINUX = "🐧 Linux"
+
+TOOLS = (
+    Tool(PYTHON, "🔔 Notifications", "automation.pages.notifications:show_notifications_page"),
+    Tool(PYTHON, "🌐 Web Scraper", "automation.pages.web_scraper:show_web_scraper_page",
+         ("requests", "bs4")),
+    Tool(PYTHON, "🔍 Google Search", "automation.pages.google_search:show_google_search_page",
+         ("googlesearch",)),
+    Tool(PYTHON, "📧 Email Sender", "automation.pages.email_sender:show_email_sender_page",
+         ("smtplib", "email.mime.text")),
+    Tool(PYTHON, "🎨 Image Generator", "automation.pages.image_generator:show_image_generator_page",
+         ("PIL.Image", "numpy")),
+    Tool(PYTHON, "🔄 Face Swap", "automation.pages.face_swap:show_face_swap_page",
+         ("cv2", "mediapipe", "numpy")),
+    Tool(PYTHON, "💬 WhatsApp", "automation.pages.whatsapp:show_whatsapp_page",
+         ("playwright.sync_api",)),
+    Tool(PYTHON, "📱 SMS Sender", "automation.pages.sms_sender:show_sms_sender_page",
+         ("twilio.rest",)),
+    Tool(PYTHON, "📞 Phone Caller", "automation.pages.phone_caller:show_phone_caller_page",
+         ("twilio.rest",)),
+    Tool(PYTHON, "🖥 RAM Monitor", "automation.pages.ram_monitor:show_ram_monitor_page",
+         ("psutil",)),
+    Tool(PYTHON, "📲 WhatsApp Anonymous",
+         "automation.pages.whatsapp_anonymous:show_whatsapp_anonymous_page", ("twilio.rest",)),
+    Tool(PYTHON, "📚 Tuple vs List", "automation.pages.tuple_vs_list:show_tuple_vs_list_page"),
+    Tool(PYTHON, "📈 Diagnostics", "automation.pages.diagnostics:show_diagnostics_page"),
+    Tool(JAVASCRIPT, "📷 Photo Capture & Email",
+         "automation.pages.photo_capture:show_photo_capture_page"),
+    Tool(JAVASCRIPT, "📸 Simple Photo Capture",
+         "automation.pages.simple_photo_capture:show_simple_photo_capture_page"),
+    Tool(JAVASCRIPT, "📧 Send to Gmail", "automation.pages.send_to_gmail:show_send_to_gmail_page"),
+    Tool(JAVASCRIPT, "🗺️ Current Location Map", None),
+    Tool(JAVASCRIPT, "🛣️ Route Finder", None),
+    Tool(JAVASCRIPT, "💬 WhatsApp Messenger", None),
+    Tool(LINUX, "🐧 Linux Operations", "automation.pages.linux_operations:show_linux_page"),
+)
+
+_BY_LABEL = {tool.label: tool for tool in TOOLS}
+_BY_CATEGORY = {}
+for _tool in TOOLS:
+    _BY_CATEGORY.setdefault(_tool.category, []).append(_tool.label)
+
+CATEGORIES = tuple(_BY_CATEGORY)
+
+
+def labels(category):
+    """Sidebar labels for ``category``, in registration order."""
+    return _BY_CATEGORY[category]
+
+
+def get(label):
+    return _BY_LABEL[label]
+
+
+@functools.cache
+def load(label):
+    """Import the page module for ``label`` on first use and return its page function.
+
+    Raises ``LookupError`` for tools that have no page yet. An ``ImportError``
+    from the page module is not cached, so installing a missing library and
+    rerunning picks the tool up without restarting the server.
+    """
+    tool = _BY_LABEL[label]
+    if tool.entry is None:
+        raise LookupError(f"{label} is not available yet")
+    module_name, _, attr = tool.entry.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
@@ -0,0 +1,384 @@
+"""Run one command or script on many hosts at once and collect the output.
+
+Every host is a child process: ``ssh`` for remote hosts, or ``bash`` for the
+local backend, which runs the command once per host name on this machine
+and is what tests and benchmarks use. Up to ``concurrency`` children run at
+a time. A single thread multiplexes all of their stdout and stderr pipes
+with ``selectors``, so a 200-host fan-out needs no thread per host and
+finishes in about the time of the slowest host.
+
+SSH connections are pooled by OpenSSH's connection multiplexing: the first
+command to a host starts a master connection that stays up for
+``persist`` seconds after its last use (``ControlPersist``), and every later
+command to that host, in this run or the next, reuses it instead of
+performing a new handshake.
+
+Output is kept per host (up to ``MAX_OUTPUT`` bytes per stream) and can be
+read while the run is in progress; ``groups()`` folds hosts with identical
+exit codes and output together.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import selectors
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from automation import metrics
+
+DEFAULT_CONCURRENCY = 64
+MAX_OUTPUT = 1024 * 1024  # per host and stream; the rest is dropped
+CHUNK_SIZE = 65536
+POLL_INTERVAL = 0.1
+
+PENDING, RUNNING, DONE = "pending", "running", "done"
+FAILED, TIMED_OUT, CANCELLED = "failed", "timed out", "cancelled"
+
+_RANGE = re.compile(r"\[(\d+)-(\d+)\]")
+
+
+def check_name(value, what="host"):
+    """Return ``value``, or raise ``ValueError`` if ssh could read it as an option or split it."""
+    if not value or value.startswith("-") or any(c.isspace() for c in value):
+        raise ValueError(f"invalid {what} {value!r}: it must not be empty, start with '-' or contain spaces")
+    return value
+
+
+def expand_hosts(text):
+    """Host names from ``text``, one per line or separated by commas or spaces.
+
+    ``#`` starts a comment, duplicates are dropped, and one numeric range per
+    name is expanded: ``web[01-12].example.com`` gives ``web01`` to ``web12``.
+    A name starting with ``-`` raises ``ValueError``.
+    """
+    hosts = []
+    for line in text.splitlines():
+        for item in line.split("#", 1)[0].replace(",", " ").split():
+            check_name(item)
+            match = _RANGE.search(item)
+            if match is None:
+                hosts.append(item)
+                continue
+            first, last = match.group(1), match.group(2)
+            width = len(first) if first.startswith("0") else 0
+            for number in range(int(first), int(last) + 1):
+                hosts.append(item[:match.start()] + str(number).zfill(width) + item[match.end():])
+    return list(dict.fromkeys(hosts))
+
+
+class LocalBackend:
+    """Runs the command on this machine once per host, with ``$TARGET_HOST`` set to the host name."""
+
+    name = "local"
+    kill_group = True  # the command's own children hold the pipes too
+
+    def argv(self, host, command):
+        return ["bash", "-c", command]
+
+    def env(self, host):
+        return {**os.environ, "TARGET_HOST": host}
+
+
+class SshBackend:
+    """OpenSSH client with multiplexed, persistent connections. Hosts are ``[user@]host[:port]``."""
+
+    name = "ssh"
+    # Only the client: a persistent master it forked may share its process group.
+    kill_group = False
+
+    def __init__(self, user=None, port=None, identity=None, connect_timeout=10, persist=300, control_dir=None,
+                 options=()):
+        self.user = check_name(user, "user") if user else user
+        self.port = port
+        self.identity = identity
+        self.connect_timeout = connect_timeout
+        self.persist = persist
+        # Unix socket paths are short (~100 bytes), so keep the directory near the root.
+        self.control_dir = Path(control_dir or Path(tempfile.gettempdir()) / "automation-ssh")
+        self.control_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.options = tuple(options)
+
+    def _target(self, host):
+        user, _, address = host.rpartition("@")
+        address, _, port = address.partition(":") if address.count(":") == 1 else (address, "", "")
+        check_name(address)
+        if user:
+            check_name(user, "user")
+        if port and not port.isdigit():
+            raise ValueError(f"invalid port {port!r} in {host!r}")
+        return user or self.user, address, port or self.port
+
+    def option_argv(self, host):
+        """Every option for ``host``; the destination goes after them, behind ``--``."""
+        user, address, port = self._target(host)
+        argv = [
+            "ssh", "-o", "BatchMode=yes", "-o", f"ConnectTimeout={self.connect_timeout}",
+            "-o", "ControlMaster=auto", "-o", f"ControlPath={self.control_dir}/%C",
+            "-o", f"ControlPersist={self.persist}",
+        ]
+        for option in self.options:
+            argv += ["-o", option]
+        if port:
+            argv += ["-p", str(port)]
+        if user:
+            argv += ["-l", user]
+        if self.identity:
+            argv += ["-i", str(self.identity)]
+        return argv
+
+    def argv(self, host, command):
+        return self.option_argv(host) + ["--", self._target(host)[1], command]
+
+    def env(self, host):
+        return None
+
+    def close(self, host):
+        """Stop the persistent master connection to ``host``, if there is one."""
+        subprocess.run(self.option_argv(host) + ["-O", "exit", "--", self._target(host)[1]],
+                       capture_output=True, timeout=self.connect_timeout)
+
+
+@dataclass
+class HostResult:
+    host: str
+    status: str = PENDING
+    exit_code: int | None = None
+    error: str | None = None
+    started: float | None = None
+    finished: float | None = None
+    stdout: bytearray = field(default_factory=bytearray, repr=False)
+    stderr: bytearray = field(default_factory=bytearray, repr=False)
+    truncated: bool = False
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def ok(self):
+        return self.status == DONE and self.exit_code == 0
+
+    def text(self, stream="stdout"):
+        return bytes(getattr(self, stream)).decode("utf-8", errors="replace")
+
+
+@dataclass
+class Group:
+    exit_code: int | None
+    status: str
+    stdout: str
+    stderr: str
+    hosts: list[str]
+
+
+class _Child:
+    def __init__(self, result, process):
+        self.result = result
+        self.process = process
+        self.open_streams = 2
+        self.deadline = None
+
+
+class Run:
+    """One command (or script, fed on stdin) across ``hosts``; ``execute`` drives it to completion."""
+
+    def __init__(self, hosts, backend, command=None, script=None, concurrency=DEFAULT_CONCURRENCY, timeout=None):
+        if (command is None) == (script is None):
+            raise ValueError("pass either a command or a script")
+        self.backend = backend
+        self.command = command if script is None else "bash -s"
+        self.script = script.encode() if script is not None else None
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.results = {host: HostResult(host) for host in hosts}
+        self.started = None
+        self.finished = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def hosts(self):
+        return list(self.results)
+
+    @property
+    def done(self):
+        return self.finished is not None
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def cancel(self):
+        self._cancel.set()
+
+    def counts(self):
+        """Hosts per status."""
+        with self._lock:
+            return Counter(result.status for result in self.results.values())
+
+    def exit_codes(self):
+        """Finished hosts per exit code."""
+        with self._lock:
+            return Counter(r.exit_code for r in self.results.values() if r.status == DONE)
+
+    def snapshot(self):
+        """Copies of the per-host results, safe to read while the run is going."""
+        with self._lock:
+            return [HostResult(r.host, r.status, r.exit_code, r.error, r.started, r.finished, bytearray(r.stdout),
+                               bytearray(r.stderr), r.truncated) for r in self.results.values()]
+
+    def groups(self):
+        """Hosts with identical status, exit code and output folded together, largest group first."""
+        groups = {}
+        for result in self.snapshot():
+            key = hashlib.sha256(b"\0".join([
+                result.status.encode(), str(result.exit_code).encode(), str(result.error).encode(),
+                bytes(result.stdout), bytes(result.stderr),
+            ])).digest()
+            if key not in groups:
+                groups[key] = Group(result.exit_code, result.status, result.text("stdout"),
+                                    result.text("stderr") or (result.error or ""), [])
+            groups[key].hosts.append(result.host)
+        return sorted(groups.values(), key=lambda g: (-len(g.hosts), g.exit_code != 0))
+
+    # -- execution ---------------------------------------------------------------
+
+    def execute(self, on_progress=None, interval=0.2):
+        """Run every host and return ``self``.
+
+        ``on_progress(finished_hosts, total_hosts)`` is called from this
+        thread every ``interval`` seconds and at the end; an exception from
+        it (e.g. a cancelled job) kills the children and propagates.
+        """
+        self.started = time.monotonic()
+        pending = deque(self.results.values())
+        children = set()
+        selector = selectors.DefaultSelector()
+        last_report = 0.0
+        try:
+            while pending or children:
+                if self._cancel.is_set():
+                    break
+                while pending and len(children) < self.concurrency:
+                    child = self._spawn(pending.popleft(), selector)
+                    if child is not None:
+                        children.add(child)
+                for key, _ in selector.select(timeout=POLL_INTERVAL) if selector.get_map() else ():
+                    self._read(key, selector)
+                now = time.monotonic()
+                for child in list(children):
+                    if child.deadline is not None and now > child.deadline and child.result.status == RUNNING:
+                        self._kill(child, TIMED_OUT)
+                    if child.open_streams == 0 and child.process.poll() is not None:
+                        self._finish(child)
+                        children.discard(child)
+                if not selector.get_map() and children:
+                    time.sleep(0.005)  # only exiting children left: wait for them without spinning
+                if on_progress and now - last_report >= interval:
+                    last_report = now
+                    on_progress(len(self.results) - len(pending) - len(children), len(self.results))
+        finally:
+            for child in children:
+                self._kill(child, CANCELLED)
+                self._reap(child, selector)
+                self._finish(child)
+            with self._lock:
+                for result in pending:
+                    result.status = CANCELLED
+            selector.close()
+            self.finished = time.monotonic()
+        if on_progress:
+            on_progress(len(self.results), len(self.results))
+        return self
+
+    def _spawn(self, result, selector):
+        with self._lock:
+            result.status, result.started = RUNNING, time.monotonic()
+        try:
+            process = subprocess.Popen(
+                self.backend.argv(result.host, self.command), env=self.backend.env(result.host),
+                stdin=subprocess.PIPE if self.script is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True,
+            )
+        except (OSError, ValueError) as exc:  # ValueError: a host name ssh would take for an option
+            with self._lock:
+                result.status, result.error, result.finished = FAILED, str(exc), time.monotonic()
+            return None
+        if self.script is not None:
+            try:
+                process.stdin.write(self.script)
+            except OSError:  # the child exited before reading its script; its exit code tells why
+                pass
+            finally:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+        child = _Child(result, process)
+        if self.timeout:
+            child.deadline = result.started + self.timeout
+        selector.register(process.stdout, selectors.EVENT_READ, (child, "stdout"))
+        selector.register(process.stderr, selectors.EVENT_READ, (child, "stderr"))
+        return child
+
+    def _read(self, key, selector):
+        child, stream = key.data
+        data = os.read(key.fd, CHUNK_SIZE)
+        if not data:
+            selector.unregister(key.fileobj)
+            key.fileobj.close()
+            child.open_streams -= 1
+            return
+        result = child.result
+        with self._lock:
+            buffer = getattr(result, stream)
+            room = MAX_OUTPUT - len(buffer)
+            buffer += data[:room]
+            result.truncated |= len(data) > room
+
+    def _kill(self, child, status):
+        with self._lock:
+            child.result.status = status
+        try:
+            if self.backend.kill_group:
+                os.killpg(child.process.pid, signal.SIGKILL)
+            else:
+                child.process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _reap(self, child, selector):
+        for stream in (child.process.stdout, child.process.stderr):
+            if not stream.closed:
+                selector.unregister(stream)
+                stream.close()
+        child.process.wait()
+
+    def _finish(self, child):
+        result = child.result
+        with self._lock:
+            result.exit_code = child.process.returncode
+            result.finished = time.monotonic()
+            if result.status == RUNNING:
+                result.status = DONE
+        metrics.observe("operation", result.elapsed, not result.ok, op=f"{self.backend.name}_command")
+
+
+def run_job(job, run):
+    """Background job: execute ``run``, reporting hosts finished; returns the run."""
+    return run.execute(
+        on_progress=lambda done, total: job.report(done / total if total else 1.0, f"{done}/{total} hosts"),
+    )
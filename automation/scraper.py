@@ -0,0 +1,287 @@
+"""Crawl a site for file links and download them concurrently.
+
+Pages are fetched breadth-first up to ``depth`` levels below the start URL.
+Matching files are downloaded on a thread pool that shares one pooled,
+keep-alive ``requests.Session``; a semaphore per host caps how many
+page fetches or downloads hit the same server at once. Each file is streamed to disk in
+chunks through a ``.part`` file, so memory use does not depend on file size.
+Passing a ``manifest.Manifest`` makes re-crawls incremental.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import unquote, urldefrag, urljoin, urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from automation import metrics
+
+CHUNK_SIZE = 64 * 1024
+USER_AGENT = "AutomationSuite-Scraper/1.0"
+
+
+@dataclass
+class CrawlOptions:
+    file_types: tuple[str, ...]
+    depth: int = 0
+    same_host: bool = True
+    max_workers: int = 8
+    per_host: int = 4
+    timeout: float = 30.0
+    chunk_size: int = CHUNK_SIZE
+
+
+@dataclass
+class Download:
+    url: str
+    path: Path | None = None
+    bytes: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+    not_modified: bool = False
+    deduplicated: bool = False
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+@dataclass
+class Progress:
+    files_total: int
+    files_done: int = 0
+    files_failed: int = 0
+    files_skipped: int = 0
+    bytes_done: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def throughput(self):
+        """Bytes per second since the run started."""
+        elapsed = self.elapsed
+        return self.bytes_done / elapsed if elapsed > 0 else 0.0
+
+
+def make_session(pool_size=16):
+    """A keep-alive session whose connection pool fits ``pool_size`` workers."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def _matches(url, file_types):
+    path = urlsplit(url).path.lower()
+    return any(path.endswith(ext.lower()) for ext in file_types)
+
+
+def _links(base_url, html):
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup.find_all(["a", "img", "link", "source"]):
+        ref = tag.get("href") or tag.get("src")
+        if ref:
+            url, _ = urldefrag(urljoin(base_url, ref))
+            if urlsplit(url).scheme in ("http", "https"):
+                yield url
+
+
+class HostLimits:
+    """One semaphore per host, so at most ``per_host`` requests go to the same server at once."""
+
+    def __init__(self, per_host):
+        self.per_host = per_host
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def slot(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._slots[host]
+
+
+def _fetch_page(session, url, timeout):
+    # Streamed, so a non-HTML response (a large file linked like a page) is closed unread.
+    try:
+        with session.get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            if "html" not in response.headers.get("Content-Type", "text/html"):
+                return url, None
+            return url, response.text
+    except requests.RequestException:
+        return url, None
+
+
+def crawl(session, start_url, options):
+    """Return the file URLs reachable from ``start_url`` within ``options.depth`` levels."""
+    host = urlsplit(start_url).netloc
+    limits = HostLimits(options.per_host)
+    seen_pages = {start_url}
+    files = {}
+    frontier = [start_url]
+
+    def fetch(url):
+        with limits.slot(url):
+            return _fetch_page(session, url, options.timeout)
+
+    with ThreadPoolExecutor(max_workers=options.max_workers) as pool:
+        for level in range(options.depth + 1):
+            next_frontier = []
+            for page_url, html in pool.map(fetch, frontier):
+                if html is None:
+                    continue
+                for url in _links(page_url, html):
+                    if options.same_host and urlsplit(url).netloc != host:
+                        continue
+                    if _matches(url, options.file_types):
+                        files.setdefault(url, None)
+                    elif level < options.depth and url not in seen_pages:
+                        seen_pages.add(url)
+                        next_frontier.append(url)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+    return list(files)
+
+
+def local_path(dest, url):
+    """Mirror ``url`` under ``dest/<host>/`` so equal basenames on different paths don't collide.
+
+    A query string adds a short hash of itself to the file name, so
+    ``get.csv?id=1`` and ``get.csv?id=2`` become two files.
+    """
+    parts = urlsplit(url)
+    relative = unquote(parts.path).lstrip("/")
+    safe = [p for p in relative.split("/") if p not in ("", ".", "..")] or ["index"]
+    path = Path(dest, parts.netloc.replace(":", "_"), *safe)
+    if parts.query:
+        tag = hashlib.sha256(parts.query.encode()).hexdigest()[:8]
+        path = path.with_name(f"{path.stem}-{tag}{path.suffix}")
+    return path
+
+
+class Downloader:
+    """Download many URLs concurrently with per-host limits and chunked streaming.
+
+    With a ``Manifest`` attached, files already on disk are revalidated with
+    conditional requests and new content is stored once per SHA-256.
+    """
+
+    def __init__(self, session, dest, options, manifest=None):
+        self.session = session
+        self.dest = Path(dest)
+        self.options = options
+        self.manifest = manifest
+        self._host_limits = HostLimits(options.per_host)
+        self._lock = threading.Lock()
+
+    def _count(self, progress, nbytes):
+        with self._lock:
+            progress.bytes_done += nbytes
+
+    def fetch(self, url, progress):
+        result = Download(url)
+        start = time.perf_counter()
+        target = local_path(self.dest, url)
+        part = target.with_name(target.name + ".part")
+        headers = self.manifest.conditional_headers(url) if self.manifest else {}
+        try:
+            with self._host_limits.slot(url):
+                with self.session.get(url, stream=True, timeout=self.options.timeout, headers=headers) as response:
+                    if response.status_code == 304 and headers:
+                        self._not_modified(url, target)
+                        result.not_modified = True
+                    else:
+                        response.raise_for_status()
+                        digest = self._stream(response, part, result, progress)
+            if not result.not_modified:
+                self._commit(url, part, target, digest, response.headers, result)
+            result.path = target
+        except (requests.RequestException, OSError) as exc:
+            result.error = str(exc)
+            part.unlink(missing_ok=True)
+        result.seconds = time.perf_counter() - start
+        metrics.observe("operation", result.seconds, not result.ok, op="http_fetch")
+        return result
+
+    def _stream(self, response, part, result, progress):
+        digest = hashlib.sha256()
+        part.parent.mkdir(parents=True, exist_ok=True)
+        with open(part, "wb") as fh:
+            for chunk in response.iter_content(self.options.chunk_size):
+                fh.write(chunk)
+                digest.update(chunk)
+                result.bytes += len(chunk)
+                self._count(progress, len(chunk))
+        return digest.hexdigest()
+
+    def _not_modified(self, url, target):
+        entry = self.manifest.get(url)
+        if not target.exists():
+            self.manifest.link(entry.sha256, target)
+        self.manifest.touch(url)
+
+    def _commit(self, url, part, target, sha256, headers, result):
+        if self.manifest is None:
+            os.replace(part, target)
+            return
+        result.deduplicated = self.manifest.store(part, sha256)
+        self.manifest.link(sha256, target)
+        self.manifest.record(
+            url, etag=headers.get("ETag"), last_modified=headers.get("Last-Modified"),
+            size=result.bytes, sha256=sha256, path=target,
+        )
+
+    def run(self, urls, on_progress=None, interval=0.2):
+        """Download ``urls`` and return a ``Download`` per URL.
+
+        ``on_progress`` is called from the calling thread (never from a worker)
+        every ``interval`` seconds and once at the end, so it may safely update
+        UI elements.
+        """
+        progress = Progress(files_total=len(urls))
+        results = []
+        with ThreadPoolExecutor(max_workers=self.options.max_workers) as pool:
+            pending = {pool.submit(self.fetch, url, progress) for url in urls}
+            try:
+                while pending:
+                    done, pending = wait(pending, timeout=interval, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        results.append(result)
+                        progress.files_done += 1
+                        progress.files_failed += not result.ok
+                        progress.files_skipped += result.not_modified
+                    if on_progress:
+                        on_progress(progress)
+            except BaseException:
+                # e.g. a cancelled job raising from on_progress: skip the downloads not started yet
+                pool.shutdown(cancel_futures=True)
+                raise
+        if on_progress and not urls:
+            on_progress(progress)
+        return results
+
+
+def format_rate(bytes_per_second):
+    for unit in ("B/s", "KB/s", "MB/s"):
+        if bytes_per_second < 1024:
+            return f"{bytes_per_second:.1f} {unit}"
+        bytes_per_second /= 1024
+    return f"{bytes_per_second:.1f} GB/s"
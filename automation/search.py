@@ -0,0 +1,182 @@
+"""Search backends, a process-wide result cache and concurrent batch search.
+
+A backend is any callable ``backend(query, num_results) -> list[Result]``.
+``GoogleBackend`` wraps googlesearch-python; ``HttpJsonBackend`` talks to any
+endpoint that answers ``GET ?q=...&num=...`` with a JSON list of results,
+which is how a local fake provider is plugged in for testing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+from automation import metrics
+from automation.ratelimit import TokenBucket
+
+ENDPOINT_ENV = "AUTOMATION_SEARCH_ENDPOINT"
+
+
+@dataclass(frozen=True)
+class Result:
+    url: str
+    title: str = ""
+    description: str = ""
+
+
+@dataclass
+class MergedResult:
+    url: str
+    title: str
+    description: str
+    queries: list[str] = field(default_factory=list)
+    best_rank: int = 0
+
+
+class GoogleBackend:
+    name = "Google"
+
+    def __call__(self, query, num_results):
+        from googlesearch import search
+
+        results = []
+        for item in search(query, num_results=num_results, advanced=True):
+            results.append(Result(item.url, item.title or "", item.description or ""))
+        return results[:num_results]
+
+
+class HttpJsonBackend:
+    """Backend for a provider that returns ``[{"url", "title", "description"}, ...]``."""
+
+    name = "HTTP JSON"
+
+    def __init__(self, endpoint, timeout=10.0):
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def __call__(self, query, num_results):
+        url = f"{self.endpoint}?{urlencode({'q': query, 'num': num_results})}"
+        with urlopen(url, timeout=self.timeout) as response:
+            items = json.load(response)
+        return [Result(i["url"], i.get("title", ""), i.get("description", "")) for i in items][:num_results]
+
+
+def default_backend():
+    """``HttpJsonBackend`` if ``AUTOMATION_SEARCH_ENDPOINT`` is set, else Google."""
+    endpoint = os.environ.get(ENDPOINT_ENV)
+    return HttpJsonBackend(endpoint) if endpoint else GoogleBackend()
+
+
+def normalize(query):
+    return " ".join(query.casefold().split())
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries also expire ``ttl`` seconds after insertion."""
+
+    def __init__(self, maxsize=256, ttl=3600.0, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= self._clock():
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SearchService:
+    """Cached front end to a backend; safe to share between Streamlit sessions."""
+
+    def __init__(self, backend=None, cache=None, rate=2.0):
+        self.backend = backend or default_backend()
+        self.cache = cache or TTLCache()
+        self.limiter = TokenBucket(rate)
+
+    def search(self, query, num_results):
+        key = (normalize(query), num_results)
+        results = self.cache.get(key)
+        if results is None:
+            self.limiter.acquire()
+            with metrics.timer("operation", op="search_query"):
+                results = self.backend(key[0], num_results)
+            self.cache.set(key, results)
+        return results
+
+    def batch(self, queries, num_results, max_workers=4):
+        """Run ``queries`` concurrently; returns ``(per_query, merged, errors)``.
+
+        Duplicate queries (after normalisation) run once. ``merged`` lists each
+        URL once with every query that returned it, ordered by how many
+        queries matched and then by best rank.
+        """
+        unique = list(dict.fromkeys(normalize(q) for q in queries if q.strip()))
+        per_query, errors = {}, {}
+
+        def run(query):
+            try:
+                return query, self.search(query, num_results), None
+            except Exception as exc:  # one failing query must not sink the batch
+                return query, [], exc
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for query, results, exc in pool.map(run, unique):
+                per_query[query] = results
+                if exc is not None:
+                    errors[query] = str(exc)
+        return per_query, merge(per_query), errors
+
+
+def merge(per_query):
+    merged = {}
+    for query, results in per_query.items():
+        for rank, result in enumerate(results, start=1):
+            entry = merged.get(result.url)
+            if entry is None:
+                merged[result.url] = MergedResult(result.url, result.title, result.description, [query], rank)
+            else:
+                entry.queries.append(query)
+                entry.best_rank = min(entry.best_rank, rank)
+    return sorted(merged.values(), key=lambda m: (-len(m.queries), m.best_rank))
+
+
+def read_queries(text="", uploaded=None):
+    """Queries from a pasted block and/or an uploaded .txt/.csv (first column)."""
+    lines = text.splitlines()
+    if uploaded is not None:
+        content = uploaded.getvalue().decode("utf-8", errors="replace")
+        lines.extend(line.split(",")[0].strip().strip('"') for line in content.splitlines())
+    return [line for line in lines if line.strip()]
@@ -0,0 +1,248 @@
+"""Process-wide system sampler with a fixed-size history.
+
+One daemon thread per server process samples memory, swap and CPU every
+``interval`` seconds into a ring buffer backed by preallocated ``array``
+columns. Every browser session reads the same buffer, so sampling cost is
+constant however many sessions are watching, and memory use is fixed by
+the buffer capacity.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+
+import psutil
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_CAPACITY = 3600
+PROCESS_INTERVAL = 5.0
+USS_CANDIDATES = 3  # USS is read for this many times N of the largest processes by RSS
+CHECKED = 50  # the largest processes by RSS and by growth get a PID reuse check
+
+FIELDS = (
+    "time",
+    "mem_percent",
+    "mem_used",
+    "mem_available",
+    "mem_total",
+    "swap_percent",
+    "swap_used",
+    "cpu_percent",
+)
+
+
+class RingBuffer:
+    """Fixed-capacity columns of doubles; the oldest row is overwritten when full."""
+
+    def __init__(self, capacity, fields=FIELDS):
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._columns = {name: array("d", bytes(8 * capacity)) for name in self.fields}
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._size
+
+    def append(self, row):
+        with self._lock:
+            i = self._next
+            for name in self.fields:
+                self._columns[name][i] = row[name]
+            self._next = (i + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def latest(self):
+        with self._lock:
+            if not self._size:
+                return None
+            i = (self._next - 1) % self.capacity
+            return {name: column[i] for name, column in self._columns.items()}
+
+    def snapshot(self, last=None):
+        """Columns as lists, oldest first, optionally limited to the ``last`` rows."""
+        with self._lock:
+            size = self._size if last is None else min(last, self._size)
+            start = (self._next - size) % self.capacity
+            out = {}
+            for name, column in self._columns.items():
+                if start + size <= self.capacity:
+                    out[name] = column[start:start + size].tolist()
+                else:
+                    out[name] = column[start:].tolist() + column[:(start + size) % self.capacity].tolist()
+            return out
+
+
+@dataclass
+class ProcInfo:
+    pid: int
+    name: str
+    rss: int
+    uss: int | None = None
+    growth: float = 0.0  # bytes per second, smoothed
+    seen: float = 0.0
+    _process: psutil.Process | None = None
+
+
+class ProcessTracker:
+    """Incremental per-process memory table.
+
+    Processes come from ``psutil.process_iter()``, which keeps one
+    ``Process`` per PID between calls and drops exited ones. A process is
+    looked up in full (name) only when its ``Process`` object first appears;
+    after that each refresh reads just the memory counters, batched under
+    ``Process.oneshot()``. The processes that can make the top of the table
+    are also checked with ``is_running()``, which compares creation times, so
+    a reused PID is looked up afresh instead of keeping the old name. USS
+    needs a full smaps walk, so it is only read for the largest few.
+    """
+
+    def __init__(self, smoothing=0.5):
+        self.smoothing = smoothing
+        self.procs = {}
+        self.last_refresh = 0.0
+        self.refresh_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _add(self, process, now):
+        try:
+            with process.oneshot():
+                info = ProcInfo(process.pid, process.name(), process.memory_info().rss, seen=now,
+                                _process=process)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+        return info
+
+    def _update(self, info, now):
+        try:
+            with info._process.oneshot():
+                rss = info._process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
+        elapsed = now - info.seen
+        if elapsed > 0:
+            rate = (rss - info.rss) / elapsed
+            info.growth = self.smoothing * rate + (1 - self.smoothing) * info.growth
+        info.rss, info.seen = rss, now
+        return True
+
+    def refresh(self, uss_for=10):
+        started = time.perf_counter()
+        now = time.monotonic()
+        procs = {}
+        for process in psutil.process_iter():
+            info = self.procs.get(process.pid)
+            if info is not None and info._process is process:
+                if self._update(info, now):
+                    procs[process.pid] = info
+            else:
+                info = self._add(process, now)
+                if info is not None:
+                    procs[process.pid] = info
+        checked = max(CHECKED, uss_for * USS_CANDIDATES)
+        candidates = {info.pid: info for key in ("rss", "growth")
+                      for info in heapq.nlargest(checked, procs.values(), key=lambda p: getattr(p, key))}
+        for pid, info in candidates.items():
+            if not info._process.is_running():  # exited, or the PID was reused
+                del procs[pid]
+                try:
+                    info = self._add(psutil.Process(pid), now)
+                except psutil.NoSuchProcess:
+                    info = None
+                if info is not None:
+                    procs[pid] = info
+        if uss_for:
+            for info in heapq.nlargest(uss_for * USS_CANDIDATES, procs.values(), key=lambda p: p.rss):
+                try:
+                    info.uss = info._process.memory_full_info().uss
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    info.uss = None
+        with self._lock:
+            self.procs = procs
+            self.last_refresh = time.time()
+            self.refresh_seconds = time.perf_counter() - started
+
+    def top(self, n=10, key="rss"):
+        """The ``n`` largest processes by ``"rss"``, ``"uss"`` or ``"growth"``."""
+        with self._lock:
+            procs = list(self.procs.values())
+        if key == "uss":
+            return heapq.nlargest(n, (p for p in procs if p.uss is not None), key=lambda p: p.uss)
+        return heapq.nlargest(n, procs, key=lambda p: getattr(p, key))
+
+
+class Sampler:
+    def __init__(self, interval=DEFAULT_INTERVAL, capacity=DEFAULT_CAPACITY):
+        self.interval = interval
+        self.buffer = RingBuffer(capacity)
+        self.processes = None
+        self.process_interval = PROCESS_INTERVAL
+        self.process_top = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def track_processes(self, top=10):
+        """Start refreshing the per-process table from the sampler thread."""
+        self.process_top = max(self.process_top, top)
+        if self.processes is None:
+            self.processes = ProcessTracker()
+        return self.processes
+
+    def sample(self):
+        memory = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        self.buffer.append({
+            "time": time.time(),
+            "mem_percent": memory.percent,
+            "mem_used": memory.used,
+            "mem_available": memory.available,
+            "mem_total": memory.total,
+            "swap_percent": swap.percent,
+            "swap_used": swap.used,
+            # Non-blocking: CPU use since the previous call, i.e. over one interval.
+            "cpu_percent": psutil.cpu_percent(interval=None),
+        })
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.sample()
+            tracker = self.processes
+            if tracker is not None and time.time() - tracker.last_refresh >= self.process_interval:
+                tracker.refresh(uss_for=self.process_top)
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            psutil.cpu_percent(interval=None)  # prime the CPU counter
+            self._thread = threading.Thread(target=self._run, name="sysmon-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def get_sampler(interval=DEFAULT_INTERVAL, capacity=DEFAULT_CAPACITY):
+    """The process-wide sampler, started on first use. Later arguments are ignored."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = Sampler(interval, capacity)
+        return _sampler.start()
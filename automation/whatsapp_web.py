@@ -0,0 +1,166 @@
+"""Send queued WhatsApp messages through one persistent WhatsApp Web session.
+
+pywhatkit opens a new browser tab per message and sleeps fixed delays
+around it. Here one Playwright browser, with a persistent profile so the
+QR login survives restarts, stays open on WhatsApp Web, and a single worker
+thread (Playwright objects belong to the thread that created them) sends
+queued messages back to back. Every wait is for a concrete page state:
+the compose box with the send button, then the outgoing bubble losing its
+pending clock. So a message takes only as long as WhatsApp needs.
+
+Page structure is described by ``Selectors`` so the flow can be exercised
+against ``benchmarks/mock_whatsapp.py``, a local page that mimics it.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import quote
+
+WHATSAPP_WEB = "https://web.whatsapp.com"
+DEFAULT_PROFILE = Path.home() / ".automation_suite" / "whatsapp-profile"
+
+STOPPED, STARTING, LOGIN, READY, ERROR = "stopped", "starting", "waiting for QR login", "ready", "error"
+
+
+@dataclass(frozen=True)
+class Selectors:
+    logged_in: str = "#pane-side"
+    send_button: str = "button:has([data-icon='send']), [data-icon='send']"
+    invalid_number: str = "[data-animate-modal-popup='true']"
+    outgoing: str = ".message-out"
+    pending: str = "[data-icon='msg-time']"
+
+
+@dataclass
+class MessageResult:
+    phone: str
+    message: str
+    status: str = "queued"  # queued, sending, sent, failed
+    error: str | None = None
+    seconds: float = 0.0
+    timings: dict = field(default_factory=dict)  # phase -> seconds
+
+
+class InvalidNumber(ValueError):
+    pass
+
+
+class WhatsAppSender:
+    def __init__(self, base_url=WHATSAPP_WEB, profile_dir=DEFAULT_PROFILE, headless=False, selectors=Selectors(),
+                 timeout=60.0, login_timeout=180.0):
+        self.base_url = base_url.rstrip("/")
+        self.profile_dir = Path(profile_dir)
+        self.headless = headless
+        self.selectors = selectors
+        self.timeout = timeout
+        self.login_timeout = login_timeout
+        self.state = STOPPED
+        self.error = None
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self.state, self.error = STARTING, None
+            self._thread = threading.Thread(target=self._run, name="whatsapp-web", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def submit(self, phone, message):
+        """Queue a message; the returned result is updated in place as it is sent.
+
+        The sender keeps no list of results: whoever submits holds on to them.
+        """
+        result = MessageResult(phone, message)
+        self._queue.put(result)
+        return result
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _run(self):
+        try:
+            from playwright.sync_api import sync_playwright
+
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            with sync_playwright() as playwright:
+                context = playwright.chromium.launch_persistent_context(self.profile_dir, headless=self.headless)
+                try:
+                    page = context.pages[0] if context.pages else context.new_page()
+                    page.set_default_timeout(self.timeout * 1000)
+                    page.goto(self.base_url)
+                    self.state = LOGIN
+                    page.wait_for_selector(self.selectors.logged_in, timeout=self.login_timeout * 1000)
+                    self.state = READY
+                    while not self._stop.is_set():
+                        try:
+                            result = self._queue.get(timeout=0.5)
+                        except queue.Empty:
+                            continue
+                        self._send(page, result)
+                finally:
+                    context.close()
+            self.state = STOPPED
+        except Exception as exc:  # Playwright raises its own error types
+            self.state, self.error = ERROR, str(exc)
+            while not self._queue.empty():
+                result = self._queue.get_nowait()
+                result.status, result.error = "failed", "WhatsApp session stopped"
+
+    def _send(self, page, result):
+        selectors = self.selectors
+        result.status = "sending"
+        started = time.perf_counter()
+        try:
+            digits = result.phone.lstrip("+")
+            page.goto(f"{self.base_url}/send?phone={digits}&text={quote(result.message)}",
+                      wait_until="domcontentloaded")
+            result.timings["open chat"] = time.perf_counter() - started
+
+            mark = time.perf_counter()
+            page.wait_for_selector(f"{selectors.send_button}, {selectors.invalid_number}", state="visible")
+            if page.locator(selectors.invalid_number).count():
+                raise InvalidNumber(f"{result.phone} is not on WhatsApp")
+            result.timings["compose ready"] = time.perf_counter() - mark
+
+            mark = time.perf_counter()
+            sent_before = page.locator(selectors.outgoing).count()
+            page.locator(selectors.send_button).first.click()
+            bubble = page.locator(selectors.outgoing).nth(sent_before)
+            bubble.wait_for()
+            bubble.locator(selectors.pending).wait_for(state="detached")
+            result.timings["delivered to server"] = time.perf_counter() - mark
+            result.status = "sent"
+        except Exception as exc:  # Playwright timeouts and InvalidNumber
+            result.status, result.error = "failed", str(exc).splitlines()[0]
+        result.seconds = time.perf_counter() - started
+
+
+_sender = None
+_sender_lock = threading.Lock()
+
+
+def get_sender(**options):
+    """The process-wide sender. ``options`` only apply when it is first created.
+
+    ``AUTOMATION_WHATSAPP_URL`` replaces WhatsApp Web, e.g. with the local mock page.
+    """
+    global _sender
+    with _sender_lock:
+        if _sender is None:
+            options.setdefault("base_url", os.environ.get("AUTOMATION_WHATSAPP_URL", WHATSAPP_WEB))
+            _sender = WhatsAppSender(**options)
+        return _sender
@@ -0,0 +1,162 @@
+"""Minimal local stand-in for the Twilio REST API.
+
+Answers ``Messages.json`` and ``Calls.json`` POSTs with Twilio-shaped JSON
+after ``latency`` seconds, over HTTP/1.1 keep-alive, and counts requests and
+TCP connections so benchmarks can see connection reuse. Point the suite at
+it with ``AUTOMATION_TWILIO_BASE_URL=<mock.base_url>``.
+
+Calls created with a ``StatusCallback`` get Twilio-style signed status
+callbacks (``initiated``, ``ringing``, ``in-progress``, then a final status)
+over ``call_duration`` seconds, posted from one scheduler thread.
+
+    with MockTwilio(latency=0.02) as mock:
+        os.environ["AUTOMATION_TWILIO_BASE_URL"] = mock.base_url
+        ...
+"""
+
+import heapq
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import requests
+
+_RESOURCE = re.compile(r"^/2010-04-01/Accounts/(?P<account>[^/]+)/(?P<kind>Messages|Calls)\.json$")
+
+
+class MockTwilio:
+    def __init__(self, latency=0.0, host="127.0.0.1", port=0, fail_every=0, call_duration=(1.0, 1.0),
+                 call_outcomes=("completed",), auth_token=None, seed=0):
+        self.latency = latency
+        self.fail_every = fail_every
+        self.call_duration = call_duration
+        self.call_outcomes = call_outcomes
+        self.auth_token = auth_token
+        self.requests = 0
+        self.connections = 0
+        self.received = []
+        self.callbacks_sent = 0
+        self._ids = itertools.count(1)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._events = []  # heap of (due, seq, url, params)
+        self._events_ready = threading.Condition(self._lock)
+        self._stopped = False
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._callbacks = threading.Thread(target=self._post_callbacks, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with mock._lock:
+                    mock.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+                match = _RESOURCE.match(self.path)
+                if not match:
+                    self._reply(404, {"code": 20404, "message": "Not found", "status": 404})
+                    return
+                time.sleep(mock.latency)
+                with mock._lock:
+                    mock.requests += 1
+                    n = next(mock._ids)
+                    mock.received.append((match["kind"], form))
+                if mock.fail_every and n % mock.fail_every == 0:
+                    self._reply(503, {"code": 20503, "message": "Service unavailable", "status": 503})
+                    return
+                prefix = "SM" if match["kind"] == "Messages" else "CA"
+                if match["kind"] == "Calls" and form.get("StatusCallback"):
+                    mock._schedule_call(f"{prefix}{n:032x}", form)
+                self._reply(201, {
+                    "sid": f"{prefix}{n:032x}",
+                    "account_sid": match["account"],
+                    "to": form.get("To"),
+                    "from": form.get("From"),
+                    "body": form.get("Body"),
+                    "status": "queued",
+                })
+
+        return Handler
+
+    def _schedule_call(self, sid, form):
+        with self._lock:
+            now = time.monotonic()
+            duration = self._random.uniform(*self.call_duration)
+            outcome = self._random.choice(self.call_outcomes)
+            steps = [(0.0, "initiated"), (0.1, "ringing"), (0.2, "in-progress"), (1.0, outcome)]
+            for i, (fraction, status) in enumerate(steps):
+                params = {"CallSid": sid, "CallStatus": status, "To": form.get("To", ""),
+                          "From": form.get("From", ""), "SequenceNumber": str(i)}
+                heapq.heappush(self._events, (now + fraction * duration, next(self._ids), form["StatusCallback"],
+                                              params))
+            self._events_ready.notify()
+
+    def _post_callbacks(self):
+        from twilio.request_validator import RequestValidator
+
+        validator = RequestValidator(self.auth_token) if self.auth_token else None
+        session = requests.Session()
+        while True:
+            with self._lock:
+                while not self._stopped and (not self._events or self._events[0][0] > time.monotonic()):
+                    timeout = self._events[0][0] - time.monotonic() if self._events else None
+                    self._events_ready.wait(timeout)
+                if self._stopped:
+                    return
+                _, _, url, params = heapq.heappop(self._events)
+            headers = {"X-Twilio-Signature": validator.compute_signature(url, params)} if validator else {}
+            try:
+                session.post(url, data=params, headers=headers, timeout=5)
+            except requests.RequestException:
+                pass
+            with self._lock:
+                self.callbacks_sent += 1
+
+    def start(self):
+        self._thread.start()
+        self._callbacks.start()
+        return self
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            self._events_ready.notify()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,119 @@
+"""Local page that mimics the WhatsApp Web send flow.
+
+``/`` shows the chat list after ``load_delay`` seconds. ``/send?phone=&text=``
+loads like a chat opened from a link: after the same delay it shows the
+compose box with the text and a send button, or an "invalid number" popup
+for numbers that are not 8-15 digits. Clicking send adds an outgoing bubble
+with a pending clock, which turns into a tick after ``ack_delay``. Element
+names match ``automation.whatsapp_web.Selectors``. Sent messages are posted
+back to the server and collected in ``mock.sent``.
+
+    with MockWhatsApp(load_delay=0.3) as mock:
+        os.environ["AUTOMATION_WHATSAPP_URL"] = mock.base_url
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>WhatsApp</title></head>
+<body>
+<div id="app">Loading...</div>
+<script>
+const params = new URLSearchParams(location.search);
+const phone = params.get("phone"), text = params.get("text") || "";
+const delay = ms => new Promise(r => setTimeout(r, ms));
+(async () => {
+  await delay(%(load_ms)d);
+  const app = document.getElementById("app");
+  app.innerHTML = '<div id="pane-side">Chats</div><div id="main"></div>';
+  if (phone === null) return;
+  if (!/^[1-9][0-9]{7,14}$/.test(phone)) {
+    app.insertAdjacentHTML("beforeend",
+      '<div data-animate-modal-popup="true">Phone number shared via url is invalid.</div>');
+    return;
+  }
+  const main = document.getElementById("main");
+  main.innerHTML = '<div id="messages"></div><footer><div contenteditable="true"></div>' +
+                   '<button aria-label="Send"><span data-icon="send"></span></button></footer>';
+  main.querySelector("[contenteditable]").textContent = text;
+  main.querySelector("button").addEventListener("click", async () => {
+    const box = main.querySelector("[contenteditable]");
+    const bubble = document.createElement("div");
+    bubble.className = "message-out";
+    bubble.textContent = box.textContent;
+    bubble.insertAdjacentHTML("beforeend", '<span data-icon="msg-time"></span>');
+    document.getElementById("messages").appendChild(bubble);
+    box.textContent = "";
+    await fetch("/sent", {method: "POST", body: JSON.stringify({phone, text: bubble.firstChild.textContent})});
+    await delay(%(ack_ms)d);
+    bubble.querySelector("[data-icon='msg-time']").outerHTML = '<span data-icon="msg-check"></span>';
+  });
+})();
+</script>
+</body></html>
+"""
+
+
+class MockWhatsApp:
+    def __init__(self, load_delay=0.3, ack_delay=0.2, host="127.0.0.1", port=0):
+        self.load_delay = load_delay
+        self.ack_delay = ack_delay
+        self.sent = []
+        self.page_loads = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if urlparse(self.path).path not in ("/", "/send"):
+                    self.send_error(404)
+                    return
+                with mock._lock:
+                    mock.page_loads += 1
+                body = (_PAGE % {"load_ms": mock.load_delay * 1000, "ack_ms": mock.ack_delay * 1000}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                message = json.loads(self.rfile.read(length) or b"{}")
+                with mock._lock:
+                    mock.sent.append((message.get("phone"), message.get("text")))
+                self.send_response(204)
+                self.end_headers()
+
+        return Handler
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
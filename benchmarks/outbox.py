@@ -0,0 +1,104 @@
+"""Burst throughput and crash recovery for the notification outbox.
+
+Queues ``--messages`` messages against a stub sender with ``--latency``
+seconds of simulated provider time, then drains them and reports:
+
+* enqueue rate, one transaction per message (what the pages do);
+* enqueue rate, one transaction for the whole burst;
+* drain throughput and the end-to-end time until the last message is sent.
+
+It then simulates a crash: a batch is claimed and abandoned, and a second
+outbox on the same file picks it up once the lease expires. Each message
+must be delivered exactly once.
+
+    python benchmarks/outbox.py [--messages 5000] [--latency 0.01] [--workers 8]
+"""
+
+import argparse
+import collections
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from automation.outbox import SENT, Outbox  # noqa: E402
+
+
+class StubSender:
+    def __init__(self, latency):
+        self.latency = latency
+        self.delivered = collections.Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, payload, key):
+        time.sleep(self.latency)
+        with self._lock:
+            self.delivered[key] += 1
+        return f"stub-{key[:8]}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.01, help="simulated provider latency (s)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "outbox.sqlite3"
+        sender = StubSender(args.latency)
+        box = Outbox(path, batch_size=args.batch, workers=args.workers)
+        box.register("stub", sender)
+
+        single = min(args.messages, 1000)
+        start = time.perf_counter()
+        for i in range(single):
+            box.enqueue("stub", {"to": f"+1555{i:07d}", "body": "burst"}, key=f"single-{i}")
+        single_rate = single / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        box.enqueue_many(("stub", {"to": f"+1555{i:07d}", "body": "burst"}, f"bulk-{i}")
+                         for i in range(args.messages))
+        bulk_rate = args.messages / (time.perf_counter() - start)
+        duplicates = box.enqueue_many(("stub", {}, f"bulk-{i}") for i in range(args.messages))
+
+        total = single + args.messages
+        start = time.perf_counter()
+        box.start()
+        while box.counts().get(SENT, 0) < total:
+            time.sleep(0.05)
+        drain_seconds = time.perf_counter() - start
+        box.close()
+
+        print(f"enqueue, one transaction each:  {single_rate:10.0f} msg/s")
+        print(f"enqueue, one transaction burst: {bulk_rate:10.0f} msg/s")
+        print(f"re-enqueued duplicates stored:  {duplicates:10d}")
+        print(f"drained {total} messages in {drain_seconds:.2f}s: {total / drain_seconds:.0f} msg/s "
+              f"({args.workers} workers, batches of {args.batch}, {args.latency * 1000:.0f} ms/send)")
+        print(f"delivered more than once:       {sum(n > 1 for n in sender.delivered.values()):10d}")
+
+        # Crash recovery: claim a batch, "crash" before delivering it, restart.
+        crashed = Outbox(path, batch_size=args.batch, lease=0.5)
+        crashed.register("stub", sender)
+        crashed.enqueue_many(("stub", {"to": "+15550000000", "body": "crash"}, f"crash-{i}") for i in range(50))
+        claimed = len(crashed._claim())
+        crashed._pool.shutdown()
+
+        recovered = Outbox(path, batch_size=args.batch)
+        recovered.register("stub", sender)
+        time.sleep(0.6)
+        while recovered.drain_once():
+            pass
+        counts = recovered.counts()
+        recovered.close()
+        crash_keys = [k for k in sender.delivered if k.startswith("crash-")]
+        print(f"crash recovery: {claimed} claimed then abandoned, {len(crash_keys)} delivered after restart, "
+              f"{sum(sender.delivered[k] > 1 for k in crash_keys)} duplicates; outbox {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark the per-process memory table against a naive full scan.
+
+Spawns ``--procs`` idle child processes so the host has a known, large
+process table, then times:
+
+* naive: ``process_iter`` with separate ``name`` / ``memory_info`` /
+  ``memory_full_info`` calls for every PID, every time;
+* tracker cold: the first ``ProcessTracker.refresh`` (every PID is new);
+* tracker warm: later refreshes, where only memory counters are re-read.
+
+    python benchmarks/processes.py [--procs 500] [--rounds 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import psutil  # noqa: E402
+
+from automation.sysmon import ProcessTracker  # noqa: E402
+
+
+def naive_scan(n):
+    rows = []
+    for process in psutil.process_iter():
+        try:
+            rows.append((process.pid, process.name(), process.memory_info().rss,
+                         process.memory_full_info().uss))
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            pass
+    return sorted(rows, key=lambda r: r[2], reverse=True)[:n]
+
+
+def timed(fn, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--procs", type=int, default=500, help="synthetic processes to spawn")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    children = [subprocess.Popen(["sleep", "600"]) for _ in range(args.procs)]
+    try:
+        total = len(psutil.pids())
+        naive_ms = timed(lambda: naive_scan(args.top), args.rounds)
+
+        tracker = ProcessTracker()
+        start = time.perf_counter()
+        tracker.refresh(uss_for=args.top)
+        cold_ms = (time.perf_counter() - start) * 1000
+        warm_ms = timed(lambda: tracker.refresh(uss_for=args.top), args.rounds)
+        top_us = timed(lambda: tracker.top(args.top, "rss"), args.rounds) * 1000
+    finally:
+        for child in children:
+            child.kill()
+        for child in children:
+            child.wait()
+
+    print(f"processes on host: {total} ({args.procs} synthetic)")
+    print(f"naive full scan:   {naive_ms:9.1f} ms")
+    print(f"tracker cold:      {cold_ms:9.1f} ms")
+    print(f"tracker warm:      {warm_ms:9.1f} ms  ({naive_ms / warm_ms:.1f}x faster than naive)")
+    print(f"top-{args.top} selection:  {top_us:9.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Script-run time per widget interaction: whole app vs. page fragment.
+
+Every page runs inside ``st.fragment``, so a widget on the page reruns only
+the page function; before, every interaction reran the whole script (styles,
+header, sidebar and page). ``AppTest`` always performs full runs, so the two
+cases are measured as:
+
+* full rerun: ``automation_suite.py`` with the page selected in the sidebar;
+* fragment rerun: an app that only calls the page function, which is what a
+  fragment rerun executes.
+
+Each interaction edits the page's first text input (or text area, or number
+input), alternating between two values, and the median of
+``--runs`` script runs is reported.
+
+    python benchmarks/reruns.py [--runs 10] [--page "Send to Gmail" ...]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from automation import registry  # noqa: E402
+
+
+def page_only(label):
+    from automation import registry
+
+    registry.load(label)()
+
+
+def interaction(at):
+    """``change(n)`` setting one page widget to one of two values by parity of ``n``, or None."""
+    for widgets in (at.text_input, at.text_area):
+        if widgets:
+            widget, base = widgets[0], widgets[0].value or ""
+            return lambda n: widget.input(f"{base}{n % 2}")
+    if at.number_input:
+        widget, base = at.number_input[0], at.number_input[0].value
+        return lambda n: widget.set_value(base + (n % 2) * widget.step)
+    return None
+
+
+def time_interactions(at, runs):
+    change = interaction(at)
+    if change is None:
+        return None
+    timings = []
+    for n in range(runs):
+        change(n)
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+    return statistics.median(timings)
+
+
+def full_app(label):
+    at = AppTest.from_file(str(ROOT / "automation_suite.py"), default_timeout=60).run()
+    category = next(tool.category for tool in registry.TOOLS if tool.label == label)
+    at.sidebar.selectbox[0].set_value(category).run()
+    at.sidebar.radio[0].set_value(label).run()
+    return at
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--page", action="append", help="tool label (substring); default: every available page")
+    args = parser.parse_args(argv)
+
+    labels = [tool.label for tool in registry.TOOLS if tool.available]
+    if args.page:
+        labels = [label for label in labels if any(p.lower() in label.lower() for p in args.page)]
+
+    print(f"{'page':32} {'full rerun':>12} {'fragment':>12} {'saved':>7}")
+    for label in labels:
+        full = time_interactions(full_app(label), args.runs)
+        if full is None:
+            print(f"{label:32} {'(no text/number widget to change)':>33}")
+            continue
+        fragment = time_interactions(AppTest.from_function(page_only, args=(label,), default_timeout=60).run(),
+                                     args.runs)
+        print(f"{label:32} {full * 1000:9.1f} ms {fragment * 1000:9.1f} ms {1 - fragment / full:7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""SMS campaign throughput against a local Twilio stub, with an interruption.
+
+Builds a CSV of ``--recipients`` rows (with some duplicate and invalid
+numbers), prepares and queues the campaign, and delivers it through the
+outbox to ``benchmarks/mock_twilio.py`` at ``--rate`` messages per second.
+Halfway through, the outbox is stopped and a new one is opened on the same
+file with the campaign uploaded again, as after a restart. Reports
+preparation time, achieved rate against the limit, and how many numbers
+were messaged more than once (should be 0).
+
+    python benchmarks/sms_campaign.py [--recipients 2000] [--rate 200] [--latency 0.02]
+"""
+
+import argparse
+import collections
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.mock_twilio import MockTwilio  # noqa: E402
+
+SID, TOKEN, SENDER = "AC" + "0" * 32, "token", "+15550000000"
+ROUTE = f"sms:{SID}"
+
+
+def make_csv(n, seed=0):
+    rng = random.Random(seed)
+    lines = ["name,phone"]
+    for i in range(n):
+        roll = rng.random()
+        if roll < 0.02:
+            phone = "not-a-number"
+        elif roll < 0.07 and i:
+            phone = f"(555) 010-{rng.randrange(i):04d}"  # duplicate of an earlier row, other formatting
+        else:
+            phone = f"555-010-{i:04d}" if i < 10000 else f"555{i:07d}"
+        lines.append(f"user{i},{phone}")
+    return "\n".join(lines).encode()
+
+
+def run_until(box, campaign_id, target, campaigns):
+    while True:
+        progress = campaigns.progress(box, campaign_id)
+        if progress.sent + progress.failed >= target:
+            return progress
+        time.sleep(0.05)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recipients", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=200.0, help="token-bucket limit (msg/s)")
+    parser.add_argument("--latency", type=float, default=0.02, help="stub API latency (s)")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    with MockTwilio(latency=args.latency) as mock, tempfile.TemporaryDirectory() as tmp:
+        os.environ["AUTOMATION_TWILIO_BASE_URL"] = mock.base_url
+        from automation import campaigns
+        from automation.outbox import Outbox, twilio_sender
+
+        data = make_csv(args.recipients)
+        start = time.perf_counter()
+        campaign = campaigns.prepare(campaigns.read_rows(data), "Hi $name, your code is ready.", ROUTE, SENDER,
+                                     default_country="+1")
+        prepare_ms = (time.perf_counter() - start) * 1000
+        total = len(campaign.messages)
+
+        path = Path(tmp) / "outbox.sqlite3"
+        box = Outbox(path, workers=args.workers)
+        box.register(ROUTE, twilio_sender("sms", SID, TOKEN), rate=args.rate)
+        start = time.perf_counter()
+        campaigns.enqueue(box, ROUTE, SENDER, campaign)
+        box.start()
+        run_until(box, campaign.id, total // 2, campaigns)
+        box.close()  # interrupted: unsent rows of the batch are handed back
+        interrupted_at = mock.requests
+
+        box = Outbox(path, workers=args.workers)
+        box.register(ROUTE, twilio_sender("sms", SID, TOKEN), rate=args.rate)
+        requeued = campaigns.enqueue(box, ROUTE, SENDER, campaign)
+        box.start()
+        progress = run_until(box, campaign.id, total, campaigns)
+        elapsed = time.perf_counter() - start
+        box.close()
+
+    sends = collections.Counter(form["To"] for _, form in mock.received)
+    print(f"{args.recipients} CSV rows -> {total} recipients "
+          f"({campaign.duplicates} duplicates, {len(campaign.invalid)} invalid), prepared in {prepare_ms:.1f} ms")
+    print(f"interrupted after {interrupted_at} sends; re-upload queued {requeued} new messages")
+    print(f"delivered {progress.sent} ({progress.failed} failed) in {elapsed:.2f}s: "
+          f"{progress.sent / elapsed:.0f} msg/s against a {args.rate:g} msg/s limit")
+    print(f"numbers messaged more than once: {sum(n > 1 for n in sends.values())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Minimal local SMTP server that accepts and discards every message.
+
+Speaks just enough SMTP for ``smtplib`` without STARTTLS or AUTH (EHLO,
+MAIL, RCPT, DATA, RSET, NOOP, QUIT), answers after ``latency`` seconds per
+message, and counts messages and TCP connections so benchmarks can see
+connection reuse. Point ``SmtpConfig`` at it with ``starttls=False`` and an
+empty password.
+
+    with SmtpSink(latency=0.005) as sink:
+        config = SmtpConfig("bench@example.com", "", sink.host, sink.port, starttls=False)
+        ...
+"""
+
+import socketserver
+import threading
+import time
+
+
+class SmtpSink:
+    def __init__(self, latency=0.0, host="127.0.0.1", port=0):
+        self.latency = latency
+        self.messages = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = socketserver.ThreadingTCPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def host(self):
+        return self._server.server_address[0]
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def _handler(self):
+        sink = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line):
+                self.wfile.write(line.encode() + b"\r\n")
+                self.wfile.flush()
+
+            def handle(self):
+                with sink._lock:
+                    sink.connections += 1
+                self.reply("220 sink ESMTP ready")
+                for raw in self.rfile:
+                    command = raw.decode("ascii", "replace").strip().upper()
+                    if command.startswith(("EHLO", "HELO")):
+                        self.reply("250-sink\r\n250 8BITMIME" if command.startswith("EHLO") else "250 sink")
+                    elif command.startswith("DATA"):
+                        self.reply("354 end data with <CR><LF>.<CR><LF>")
+                        for line in self.rfile:
+                            if line in (b".\r\n", b".\n"):
+                                break
+                        time.sleep(sink.latency)
+                        with sink._lock:
+                            sink.messages += 1
+                        self.reply("250 OK queued")
+                    elif command.startswith("QUIT"):
+                        self.reply("221 bye")
+                        return
+                    elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                        self.reply("250 OK")
+                    else:
+                        self.reply("502 command not implemented")
+
+        return Handler
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,117 @@
+"""Startup-time benchmark for the Automation Suite.
+
+Reports the cold import cost of the registry, the cold import cost of each
+tool (its page module plus the heavy libraries it declares), and the script
+run time of the dashboard on first load and on a rerun.
+
+Every import measurement runs in a fresh interpreter so nothing is already
+sitting in ``sys.modules``.
+
+    python benchmarks/startup.py [--repeat 3]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from automation import registry  # noqa: E402
+
+_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+import automation.registry
+registry_ms = (time.perf_counter() - start) * 1000
+try:
+    import streamlit  # always loaded in the server, so not charged to any tool
+except ImportError:
+    pass
+modules = json.loads(sys.argv[1])
+missing = []
+start = time.perf_counter()
+for name in modules:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        missing.append(name)
+tool_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"registry_ms": registry_ms, "tool_ms": tool_ms, "missing": missing}))
+"""
+
+
+def probe(modules):
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, json.dumps(modules)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out)
+
+
+def tool_modules(tool):
+    return [tool.entry.partition(":")[0], *tool.imports] if tool.available else []
+
+
+def measure_imports(repeat):
+    rows = []
+    registry_ms = []
+    for tool in registry.TOOLS:
+        samples = [probe(tool_modules(tool)) for _ in range(repeat)]
+        registry_ms.extend(s["registry_ms"] for s in samples)
+        rows.append({
+            "tool": tool.label,
+            "import_ms": statistics.median(s["tool_ms"] for s in samples),
+            "missing": samples[0]["missing"],
+        })
+    return statistics.median(registry_ms), rows
+
+
+def measure_script_runs(repeat):
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return None
+    app = AppTest.from_file(str(ROOT / "automation_suite.py"), default_timeout=60)
+    start = time.perf_counter()
+    app.run()
+    first_ms = (time.perf_counter() - start) * 1000
+    reruns = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.run()
+        reruns.append((time.perf_counter() - start) * 1000)
+    return {"first_run_ms": first_ms, "rerun_ms": statistics.median(reruns)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    registry_ms, rows = measure_imports(args.repeat)
+    runs = measure_script_runs(args.repeat)
+
+    if args.json:
+        print(json.dumps({"registry_ms": registry_ms, "tools": rows, "script": runs}, indent=2))
+        return
+
+    print(f"registry import: {registry_ms:8.2f} ms  ({len(registry.TOOLS)} tools)")
+    print()
+    print(f"{'tool':<28} {'cold import':>12}  missing")
+    for row in sorted(rows, key=lambda r: r["import_ms"], reverse=True):
+        missing = ", ".join(row["missing"]) or "-"
+        print(f"{row['tool']:<28} {row['import_ms']:9.2f} ms  {missing}")
+    if runs:
+        print()
+        print(f"script first run: {runs['first_run_ms']:8.2f} ms")
+        print(f"script rerun:     {runs['rerun_ms']:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
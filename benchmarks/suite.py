@@ -0,0 +1,351 @@
+"""Benchmark and regression suite: page renders and tool engine throughput.
+
+Three groups, selectable with ``--only``:
+
+* ``pages``: every available page in the sidebar, driven through ``AppTest``
+  on the full app: the first open (cold import included), the median and
+  p95 of ``--runs`` reruns, and the peak Python allocation of a rerun
+  (``tracemalloc``);
+* ``engines``: the tool engines against local stand-ins: the scraper against
+  an ``http.server`` site (a full download, then a revalidation pass that
+  gets 304s), bulk email against ``benchmarks/smtp_sink.py``, SMS against
+  ``benchmarks/mock_twilio.py`` and a Linux Operations fan-out on the local
+  backend;
+* ``micro``: single-threaded hot paths: image render, campaign preparation,
+  message building and metric recording.
+
+Results are written as JSON (``--out``). ``--baseline OLD.json`` compares the
+new results against an earlier file, and ``--compare OLD.json NEW.json``
+compares two files without running anything. Either way, a metric that got
+worse by more than ``--threshold`` (default 10%), a baseline metric missing
+from the new results, or a recorded failure (a page that raised, downloads
+or messages that failed) is flagged and the exit status is 1. Failures
+alone also make the exit status 1.
+
+    python benchmarks/suite.py --out bench.json
+    python benchmarks/suite.py --only engines micro --baseline bench.json
+    python benchmarks/suite.py --compare before.json after.json --threshold 0.05
+"""
+
+import argparse
+import contextlib
+import functools
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from automation import registry  # noqa: E402
+
+GROUPS = ("pages", "engines", "micro")
+PREFIXES = {"page": "pages", "engine": "engines", "micro": "micro"}  # metric name prefix -> group
+LOWER, HIGHER = "lower", "higher"
+
+
+class Results:
+    def __init__(self):
+        self.metrics = {}
+        self.failures = {}
+
+    def add(self, name, value, unit, better=LOWER):
+        self.metrics[name] = {"value": round(value, 4), "unit": unit, "better": better}
+        print(f"  {name:58} {value:12.2f} {unit}", flush=True)
+
+    def fail(self, name, message):
+        self.failures[name] = message
+        print(f"  {name:58} FAILED: {message}", flush=True)
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# -- pages ---------------------------------------------------------------------
+
+
+def bench_pages(results, runs):
+    from streamlit.testing.v1 import AppTest
+
+    for tool in registry.TOOLS:
+        if not tool.available:
+            continue
+        name = tool.entry.partition(":")[2]
+        at = AppTest.from_file(str(ROOT / "automation_suite.py"), default_timeout=60).run()
+        at.sidebar.selectbox[0].set_value(tool.category).run()
+        start = time.perf_counter()
+        at.sidebar.radio[0].set_value(tool.label).run()
+        first = time.perf_counter() - start
+        if at.exception:
+            results.fail(f"page.{name}", at.exception[0].value)
+            continue
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            at.run()
+            timings.append(time.perf_counter() - start)
+        tracemalloc.start()
+        at.run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.add(f"page.{name}.first_open_ms", first * 1000, "ms")
+        results.add(f"page.{name}.rerun_ms", statistics.median(timings) * 1000, "ms")
+        results.add(f"page.{name}.rerun_p95_ms", percentile(timings, 0.95) * 1000, "ms")
+        results.add(f"page.{name}.rerun_peak_kb", peak / 1024, "KB")
+
+
+# -- engines -------------------------------------------------------------------
+
+
+@contextlib.contextmanager
+def static_site(files, size, seed=0):
+    """A local ``http.server`` serving an index page that links ``files`` CSVs of ``size`` bytes each."""
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as root:
+        links = []
+        for i in range(files):
+            Path(root, f"data{i}.csv").write_bytes(rng.randbytes(size))
+            links.append(f'<a href="data{i}.csv">data{i}</a>')
+        Path(root, "index.html").write_text("<html><body>" + "".join(links) + "</body></html>")
+
+        class Handler(SimpleHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(Handler, directory=root))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            yield f"http://127.0.0.1:{server.server_address[1]}/index.html"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def bench_scraper(results, files, size):
+    from automation import scraper
+    from automation.manifest import Manifest
+
+    options = scraper.CrawlOptions((".csv",), max_workers=8, per_host=8)
+    with static_site(files, size) as url, tempfile.TemporaryDirectory() as dest:
+        with scraper.make_session(pool_size=options.max_workers) as session:
+            urls = scraper.crawl(session, url, options)
+            for label in ("download", "revalidate"):  # the second pass finds every file unchanged
+                manifest = Manifest(dest)
+                start = time.perf_counter()
+                downloads = scraper.Downloader(session, dest, options, manifest).run(urls)
+                elapsed = time.perf_counter() - start
+                manifest.close()
+                failed = sum(not d.ok for d in downloads)
+                if failed:
+                    results.fail(f"engine.scraper.{label}", f"{failed} downloads failed")
+                results.add(f"engine.scraper.{label}_files_per_s", len(urls) / elapsed, "files/s", HIGHER)
+                if label == "download":
+                    results.add("engine.scraper.download_mb_per_s", sum(d.bytes for d in downloads) / 1024 ** 2
+                                / elapsed, "MB/s", HIGHER)
+
+
+def bench_email(results, messages, latency):
+    from automation import mailer
+
+    from benchmarks.smtp_sink import SmtpSink
+
+    rows = [{"email": f"user{i}@example.com", "name": f"User {i}"} for i in range(messages)]
+    with SmtpSink(latency=latency) as sink:
+        config = mailer.SmtpConfig("bench@example.com", "", sink.host, sink.port, starttls=False)
+        report = mailer.send_bulk(config, "bench@example.com", rows, "Hello $name", "Hi $name, this is a test.")
+    if report.failed:
+        results.fail("engine.email", f"{report.failed} messages failed")
+    results.add("engine.email.bulk_msgs_per_s", report.rate, "msg/s", HIGHER)
+    results.add("engine.email.connections_opened", report.connections_opened, "connections")
+
+
+def bench_sms(results, messages, latency, workers=8):
+    from benchmarks.mock_twilio import MockTwilio
+
+    with MockTwilio(latency=latency) as mock:
+        os.environ["AUTOMATION_TWILIO_BASE_URL"] = mock.base_url
+        from automation import notify, providers
+
+        client = providers.twilio_client("AC" + "0" * 32, "token")
+        single = []
+        for i in range(20):
+            start = time.perf_counter()
+            notify.send_sms(client, "+15550000000", f"+1555010{i:04d}", "hello")
+            single.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda i: notify.send_sms(client, "+15550000000", f"+1555020{i:04d}", "hello"),
+                          range(messages)))
+        elapsed = time.perf_counter() - start
+        connections = mock.connections
+    results.add("engine.sms.request_ms", statistics.median(single) * 1000, "ms")
+    results.add("engine.sms.parallel_msgs_per_s", messages / elapsed, "msg/s", HIGHER)
+    results.add("engine.sms.connections_opened", connections, "connections")
+
+
+def bench_fanout(results, hosts, max_sleep=0.5):
+    """Local-backend fan-out: wall time against the slowest host, whose time is the floor."""
+    from automation import remote
+
+    command = f'sleep $((RANDOM % {int(max_sleep * 1000)}))e-3; echo "$TARGET_HOST"'
+    run = remote.Run([f"node{i}" for i in range(hosts)], remote.LocalBackend(), command=command,
+                     concurrency=hosts).execute()
+    slowest = max(result.elapsed for result in run.results.values())
+    if run.exit_codes()[0] != hosts:
+        results.fail(f"engine.remote.fanout_{hosts}", f"{hosts - run.exit_codes()[0]} hosts failed")
+    results.add(f"engine.remote.fanout_{hosts}_ms", run.elapsed * 1000, "ms")
+    results.add(f"engine.remote.fanout_{hosts}_over_slowest_ms", (run.elapsed - slowest) * 1000, "ms")
+
+
+# -- micro ---------------------------------------------------------------------
+
+
+def time_per_call(fn, min_time=0.1, rounds=3):
+    """Seconds per call of ``fn(i)``: the best of ``rounds`` rounds of at least ``min_time`` each.
+
+    ``i`` keeps counting across rounds, so inputs picked by it are not repeated.
+    """
+    best = float("inf")
+    counter = itertools.count()
+    for _ in range(rounds):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            fn(next(counter))
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+    return best
+
+
+def bench_micro(results):
+    from automation import campaigns, imaging, mailer, metrics
+
+    specs = list(imaging.random_specs(2000, 400, 400, seed=1))  # distinct specs: the render cache never hits
+    results.add("micro.image.render_png_ms", time_per_call(lambda i: imaging.render_png(specs[i % len(specs)]))
+                * 1000, "ms")
+
+    rows = [{"name": f"user{i}", "phone": f"555-010-{i % 9000:04d}"} for i in range(10000)]
+    results.add("micro.campaign.prepare_10k_ms",
+                time_per_call(lambda i: campaigns.prepare(rows, "Hi $name", "sms", "+15550000000",
+                                                          default_country="+1")) * 1000, "ms")
+    results.add("micro.email.build_message_us",
+                time_per_call(lambda i: mailer.build_message("a@example.com", "b@example.com", "Hi", "Body"))
+                * 1e6, "µs")
+
+    registry_ = metrics.Metrics()
+    results.add("micro.metrics.observe_ns",
+                time_per_call(lambda i: registry_.observe("operation", 0.003, op="bench")) * 1e9, "ns")
+
+
+# -- comparison ----------------------------------------------------------------
+
+
+def compare(old, new, threshold):
+    """Print every metric present in both result sets; return the names that regressed.
+
+    Failures recorded in ``new``, and metrics of ``old`` missing from ``new``
+    (in the groups ``new`` ran), count as regressions too.
+    """
+    regressions = []
+    print(f"{'metric':58} {'before':>12} {'after':>12} {'change':>8}")
+    groups = set(new.get("meta", {}).get("groups", GROUPS))
+    for name, before in old["results"].items():
+        if name not in new["results"] and PREFIXES.get(name.partition(".")[0]) in groups:
+            print(f"{name:58} {before['value']:12.2f} {'missing':>12}  REGRESSION")
+            regressions.append(name)
+    for name, message in new.get("failures", {}).items():
+        print(f"{name:58} FAILED: {message}  REGRESSION")
+        regressions.append(name)
+    for name, after in new["results"].items():
+        before = old["results"].get(name)
+        if before is None or not before["value"]:
+            continue
+        change = after["value"] / before["value"] - 1
+        worse = change > threshold if after["better"] == LOWER else change < -threshold
+        flag = "  REGRESSION" if worse else ""
+        print(f"{name:58} {before['value']:12.2f} {after['value']:12.2f} {change:+8.1%}{flag}")
+        if worse:
+            regressions.append(name)
+    print(f"\n{len(regressions)} regressions beyond {threshold:.0%}" if regressions else
+          f"\nno regressions beyond {threshold:.0%}")
+    return regressions
+
+
+def load(path):
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("--runs", type=int, default=10, help="reruns per page")
+    parser.add_argument("--files", type=int, default=200, help="files on the scraper's test site")
+    parser.add_argument("--file-kb", type=int, default=64)
+    parser.add_argument("--messages", type=int, default=500, help="emails and SMS per engine benchmark")
+    parser.add_argument("--latency", type=float, default=0.002, help="SMTP sink and Twilio stub latency (s)")
+    parser.add_argument("--hosts", type=int, default=200, help="hosts in the Linux Operations fan-out")
+    parser.add_argument("--out", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the results against this earlier JSON file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files and exit")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change flagged as a regression")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        sys.exit(1 if compare(load(args.compare[0]), load(args.compare[1]), args.threshold) else 0)
+
+    results = Results()
+    if "pages" in args.only:
+        print("pages")
+        bench_pages(results, args.runs)
+    if "engines" in args.only:
+        print("engines")
+        bench_scraper(results, args.files, args.file_kb * 1024)
+        bench_email(results, args.messages, args.latency)
+        bench_sms(results, args.messages, args.latency)
+        bench_fanout(results, args.hosts)
+    if "micro" in args.only:
+        print("micro")
+        bench_micro(results)
+
+    report = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "groups": args.only,
+        },
+        "results": results.metrics,
+        "failures": results.failures,
+    }
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.baseline:
+        print()
+        sys.exit(1 if compare(load(args.baseline), report, args.threshold) else 0)
+    if results.failures:
+        print(f"\n{len(results.failures)} failures")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Per-send cost of a fresh Twilio client versus the shared client pool.
+
+Sends ``--messages`` SMS to a local mock of the Twilio API, first building a
+new ``Client`` (and HTTP session) for every send, as the pages used to on
+every rerun, then through ``automation.providers``. Reports mean latency
+per send and how many TCP connections the mock accepted.
+
+    python benchmarks/twilio_clients.py [--messages 200] [--latency 0]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from twilio.rest import Client  # noqa: E402
+
+from automation import notify  # noqa: E402
+from automation.providers import TwilioClientPool, _http_client  # noqa: E402
+from benchmarks.mock_twilio import MockTwilio  # noqa: E402
+
+SID, TOKEN = "AC" + "0" * 32, "token"
+
+
+def run(mock, messages, get_client):
+    before = mock.connections
+    samples = []
+    for i in range(messages):
+        start = time.perf_counter()
+        notify.send_sms(get_client(), "+15550000000", f"+1555{i:07d}", "benchmark")
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(samples), statistics.median(samples), mock.connections - before
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated API latency (s)")
+    args = parser.parse_args(argv)
+
+    with MockTwilio(latency=args.latency) as mock:
+        fresh = run(mock, args.messages,
+                    lambda: Client(SID, TOKEN, http_client=_http_client(15.0, mock.base_url, 16)))
+        pool = TwilioClientPool(base_url=mock.base_url)
+        pooled = run(mock, args.messages, lambda: pool.client(SID, TOKEN))
+        pool.close()
+
+    print(f"{args.messages} sends against {mock.base_url}")
+    print(f"{'':18}{'mean ms':>10}{'median ms':>12}{'connections':>14}")
+    for name, (mean, median, connections) in (("client per send", fresh), ("pooled client", pooled)):
+        print(f"{name:18}{mean:10.2f}{median:12.2f}{connections:14d}")
+    print(f"pool: {pool.created} created, {pool.reused} reused")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Batch WhatsApp sending through one browser session, against a local mock.
+
+Starts ``benchmarks/mock_whatsapp.py`` and a headless ``WhatsAppSender`` on
+it, queues ``--messages`` messages (every tenth to an invalid number) and
+reports per-phase timings. For comparison it prints what pywhatkit's fixed
+waits alone add up to for the same batch (``wait_time`` before sending plus
+``close_time`` after, per message, with its defaults).
+
+Needs Playwright and a Chromium build: ``pip install playwright`` and
+``playwright install chromium``.
+
+    python benchmarks/whatsapp_batch.py [--messages 20] [--load-delay 0.3] [--ack-delay 0.2]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from automation.whatsapp_web import READY, WhatsAppSender  # noqa: E402
+from benchmarks.mock_whatsapp import MockWhatsApp  # noqa: E402
+
+PYWHATKIT_WAIT, PYWHATKIT_CLOSE = 15, 3  # sendwhatmsg_instantly defaults (s)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--load-delay", type=float, default=0.3, help="mock chat load time (s)")
+    parser.add_argument("--ack-delay", type=float, default=0.2, help="mock server acknowledgement time (s)")
+    args = parser.parse_args(argv)
+
+    with MockWhatsApp(load_delay=args.load_delay, ack_delay=args.ack_delay) as mock, \
+            tempfile.TemporaryDirectory() as profile:
+        sender = WhatsAppSender(base_url=mock.base_url, profile_dir=profile, headless=True, timeout=10)
+        sender.start()
+        while sender.state != READY:
+            if sender.error:
+                sys.exit(f"browser session failed: {sender.error}")
+            time.sleep(0.05)
+
+        start = time.perf_counter()
+        results = [sender.submit("12345" if i % 10 == 9 else f"+1555{i:07d}", f"Batch message {i}")
+                   for i in range(args.messages)]
+        while any(r.status in ("queued", "sending") for r in results):
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        sender.stop()
+
+    sent = [r for r in results if r.status == "sent"]
+    print(f"{len(sent)}/{len(results)} sent in {elapsed:.2f}s ({elapsed / len(results):.2f}s per message), "
+          f"{len(mock.sent)} received by the mock, {mock.page_loads} page loads")
+    for phase in ("open chat", "compose ready", "delivered to server"):
+        values = [r.timings[phase] for r in sent if phase in r.timings]
+        if values:
+            print(f"  {phase:20} mean {statistics.mean(values) * 1000:7.1f} ms   max {max(values) * 1000:7.1f} ms")
+    failed = [r for r in results if r.status == "failed"]
+    if failed:
+        print(f"  {len(failed)} failed fast, mean {statistics.mean(r.seconds for r in failed) * 1000:.0f} ms: "
+              f"{failed[0].error}")
+    print(f"pywhatkit fixed waits alone for {len(results)} messages: "
+          f"{len(results) * (PYWHATKIT_WAIT + PYWHATKIT_CLOSE)}s")
+
+
+if __name__ == "__main__":
+    main()